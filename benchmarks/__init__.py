@@ -0,0 +1 @@
+"""Benchmarks of the hot paths, run from the repository root with python -m benchmarks.<name>"""
@@ -0,0 +1,107 @@
+"""Fire concurrent requests at the database routes and report their latency percentiles.
+
+The routes run twice in one process, through httpx over the ASGI transport: as served by the API, the
+handlers in the threadpool, then as async handlers calling the same services on the event loop. Every request
+asks for another draw date, so the response cache never answers it and each one queries the database of
+DATABASE_CONNECTION_STRING, a migrated database. The --latency option sleeps before every statement to
+emulate the round trip of a remote database, the local ones answer within a fraction of a millisecond.
+
+    DATABASE_CONNECTION_STRING=postgresql://... python -m benchmarks.route_latency
+"""
+import asyncio
+import datetime
+import functools
+import inspect
+import statistics
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Callable, Final
+
+# main imports the routers as top-level modules, as when the API is started from src
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from main import app
+from daily_grand import daily_grand_route
+from lottomax import lottomax_route
+from six_fourty_nine import six_fourty_nine_route
+from src.database.database import database
+
+_ROUTES: Final[list[str]] = ["/lottomax/results/{date}", "/daily-grand/results/{date}", "/6-49/results/{date}"]
+
+def main() -> None:
+    parser = ArgumentParser(prog="python -m benchmarks.route_latency", description="Report the latency of the database routes under concurrent requests")
+    parser.add_argument("--requests", type=int, default=600, help="The number of requests of each run")
+    parser.add_argument("--concurrency", type=int, default=32, help="The number of requests in flight")
+    parser.add_argument("--latency", type=float, default=0.005, help="The seconds slept before every statement to emulate a remote database")
+    arguments = parser.parse_args()
+
+    if arguments.latency > 0:
+        event.listen(database.engine, "before_cursor_execute", lambda *_: time.sleep(arguments.latency))
+
+    print(f"{arguments.requests} requests, {arguments.concurrency} in flight, {arguments.latency * 1000:g}ms per statement")
+
+    for name, asgi_app, first_date in (
+        ("async handlers on the event loop", _build_event_loop_app(), datetime.date(2024, 12, 31)),
+        ("def handlers in the threadpool", app, datetime.date(2024, 12, 31) - datetime.timedelta(days=arguments.requests))
+    ):
+        latencies, seconds = asyncio.run(_run(asgi_app, first_date, arguments.requests, arguments.concurrency))
+        print(
+            f"{name}: p50 {_percentile(latencies, 50) * 1000:.1f}ms, p99 {_percentile(latencies, 99) * 1000:.1f}ms, "
+            f"{arguments.requests / seconds:.0f} requests/s"
+        )
+
+def _build_event_loop_app() -> FastAPI:
+    """Return the routes of the games with the def handlers wrapped in async handlers, so they run on the event loop"""
+    event_loop_app: Final[FastAPI] = FastAPI(dependencies=app.router.dependencies)
+
+    for router in (lottomax_route.router, daily_grand_route.router, six_fourty_nine_route.router):
+        for route in router.routes:
+            if isinstance(route, APIRoute):
+                event_loop_app.add_api_route(
+                    route.path,
+                    route.endpoint if inspect.iscoroutinefunction(route.endpoint) else _on_the_event_loop(route.endpoint),
+                    methods=list(route.methods),
+                    response_model=route.response_model,
+                    response_class=route.response_class
+                )
+
+    return event_loop_app
+
+def _on_the_event_loop(endpoint: Callable) -> Callable:
+    @functools.wraps(endpoint)
+    async def call(**kwargs):
+        return endpoint(**kwargs)
+
+    return call
+
+async def _run(asgi_app: FastAPI, first_date: datetime.date, requests: int, concurrency: int) -> tuple[list[float], float]:
+    """Send the requests, each one for another date, and return their latencies and the total duration"""
+    semaphore: Final[asyncio.Semaphore] = asyncio.Semaphore(concurrency)
+    latencies: Final[list[float]] = []
+
+    async with AsyncClient(transport=ASGITransport(app=asgi_app), base_url="http://benchmark") as client:
+        async def send(index: int) -> None:
+            date: datetime.date = first_date - datetime.timedelta(days=index)
+
+            async with semaphore:
+                start: float = time.perf_counter()
+                await client.get(_ROUTES[index % len(_ROUTES)].format(date=date))
+                latencies.append(time.perf_counter() - start)
+
+        start: Final[float] = time.perf_counter()
+        await asyncio.gather(*(send(index) for index in range(requests)))
+
+        return latencies, time.perf_counter() - start
+
+def _percentile(values: list[float], percentile: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+if __name__ == "__main__":
+    main()
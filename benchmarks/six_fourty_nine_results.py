@@ -0,0 +1,171 @@
+"""Compare the row-wise apply of the 6/49 archive results with the grouped build of extract_649_results.
+
+The archives are generated with the layout of the PlayNow 649.zip and 649GPs.zip for every draw since 1982:
+guaranteed prize draws since 2013 and gold ball draws since 2022. Both paths read the same archives and the
+same classic prizes, the benchmark fails when they do not return the same results.
+
+    python -m benchmarks.six_fourty_nine_results
+"""
+import datetime
+import random
+import time
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Callable, Final
+from unittest import mock
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from pandas import DataFrame, read_csv, to_datetime
+
+from src.common import playnow_archive
+from src.six_fourty_nine import six_fourty_nine_external_data
+from src.six_fourty_nine.models.classic import Classic
+from src.six_fourty_nine.models.gold_ball import GoldBall
+from src.six_fourty_nine.models.guaranteed import Guaranteed
+from src.six_fourty_nine.models.result import Result
+from src.six_fourty_nine.six_fourty_nine_external_data import (
+    _6_49_CLASSIC_FILE_PATH_URL,
+    _6_49_GP_FILE_PATH_URL,
+    extract_649_results
+)
+
+_FIRST_DRAW: Final[datetime.date] = datetime.date(1982, 6, 12)
+_LAST_DRAW: Final[datetime.date] = datetime.date(2026, 10, 17)
+_FIRST_GUARANTEED_DRAW: Final[datetime.date] = datetime.date(2013, 9, 18)
+_FIRST_GOLD_BALL_DRAW: Final[datetime.date] = datetime.date(2022, 9, 14)
+_DRAW_WEEKDAYS: Final[tuple[int, int]] = (2, 5)
+_DATE_FORMAT: Final[str] = "%Y-%m-%d"
+
+_DRAW_DATE_FIELD: Final[str] = "DRAW DATE"
+_PRIZE_WON_FIELD: Final[str] = "PRIZE WON"
+_NUMBER_DRAWN_FIELD: Final[str] = "NUMBER DRAWN"
+_BALL_DRAWN_FIELD: Final[str] = "BALL DRAWN"
+_IS_GOLD_BALL_DRAWN_FIELD: Final[str] = "IS GOLD BALL DRAWN"
+_BONUS_NUMBER_FIELD: Final[str] = "BONUS NUMBER"
+_NUMBERS_FIELDS: Final[str] = "NUMBERS"
+_NUMBER_COLUMNS: Final[list[str]] = ["NUMBER DRAWN 1", "NUMBER DRAWN 2", "NUMBER DRAWN 3", "NUMBER DRAWN 4", "NUMBER DRAWN 5", "NUMBER DRAWN 6"]
+
+def main() -> None:
+    draw_dates: Final[list[datetime.date]] = _get_draw_dates()
+    classic_zip, gp_zip = _build_archives(draw_dates)
+    prizes: Final[dict[datetime.date, float | None]] = {date: float(random.Random(date.toordinal()).randrange(2, 70) * 1_000_000) for date in draw_dates}
+    years: Final[list[int]] = sorted({date.year for date in draw_dates})
+
+    print(f"{len(draw_dates)} draws from {years[0]} to {years[-1]}, archives of {len(classic_zip) + len(gp_zip)} bytes")
+
+    apply_results, apply_seconds = _time(lambda: [_extract_649_results_with_apply(classic_zip, gp_zip, year, prizes) for year in years])
+
+    responses: Final[dict[str, SimpleNamespace]] = {
+        _6_49_CLASSIC_FILE_PATH_URL: SimpleNamespace(status_code=200, content=classic_zip, text=""),
+        _6_49_GP_FILE_PATH_URL: SimpleNamespace(status_code=200, content=gp_zip, text="")
+    }
+
+    with mock.patch.object(playnow_archive.http_client, "get", side_effect=lambda url, max_age=None: responses[url]):
+        grouped_results, grouped_seconds = _time(lambda: [extract_649_results(year, prizes) for year in years])
+
+    assert apply_results == grouped_results, "the grouped build does not return the results of the row-wise apply"
+
+    print(f"row-wise apply: {apply_seconds:.2f}s ({apply_seconds / len(years) * 1000:.0f}ms per year)")
+    print(f"grouped build:  {grouped_seconds:.2f}s ({grouped_seconds / len(years) * 1000:.0f}ms per year)")
+    print(f"speedup: {apply_seconds / grouped_seconds:.1f}x, {sum(map(len, grouped_results))} identical results")
+
+def _get_draw_dates() -> list[datetime.date]:
+    draw_dates: Final[list[datetime.date]] = []
+    date: datetime.date = _FIRST_DRAW
+
+    while date <= _LAST_DRAW:
+        if date.weekday() in _DRAW_WEEKDAYS:
+            draw_dates.append(date)
+
+        date += datetime.timedelta(days=1)
+
+    return draw_dates
+
+def _build_archives(draw_dates: list[datetime.date]) -> tuple[bytes, bytes]:
+    """Return the 649.zip and 649GPs.zip archives of the draws, the same draws on every run"""
+    generator: Final[random.Random] = random.Random(649)
+    classic_rows: Final[list[str]] = ["PRODUCT,DRAW NUMBER,SEQUENCE NUMBER,DRAW DATE,NUMBER DRAWN 1,NUMBER DRAWN 2,NUMBER DRAWN 3,NUMBER DRAWN 4,NUMBER DRAWN 5,NUMBER DRAWN 6,BONUS NUMBER"]
+    gp_rows: Final[list[str]] = ["PRODUCT,DRAW NUMBER,SEQUENCE NUMBER,DRAW DATE,PRIZE WON,NUMBER DRAWN,BALL DRAWN"]
+
+    for draw_number, date in enumerate(draw_dates, start=1):
+        numbers: list[int] = sorted(generator.sample(range(1, 50), 7))
+        bonus: int = numbers.pop(generator.randrange(7))
+        classic_rows.append(f"649,{draw_number},0,{date:{_DATE_FORMAT}},{','.join(map(str, numbers))},{bonus}")
+
+        if date >= _FIRST_GUARANTEED_DRAW:
+            for sequence_number in range(generator.choice((1, 1, 1, 2, 10))):
+                prize: str = "$1,000,000.00" if sequence_number == 0 else generator.choice(("$1,000,000.00", "$100,000.00"))
+                gp_rows.append(f'649,{draw_number},{sequence_number},{date:{_DATE_FORMAT}},"{prize}",{_get_gp_number(generator)},Not Applicable')
+
+        if date >= _FIRST_GOLD_BALL_DRAW:
+            ball: str = "Gold" if generator.random() < 0.05 else "White"
+            prize = f'"${generator.randrange(10, 70) * 1_000_000:,}.00"' if ball == "Gold" else '"$1,000,000.00"'
+            gp_rows.append(f"649,{draw_number},0,{date:{_DATE_FORMAT}},{prize},{_get_gp_number(generator)},{ball}")
+
+    return _zip("649.csv", classic_rows), _zip("649GPs.csv", gp_rows)
+
+def _get_gp_number(generator: random.Random) -> str:
+    return f"{generator.randrange(10 ** 8):08d} -{generator.randrange(100):02d}"
+
+def _zip(file_name: str, rows: list[str]) -> bytes:
+    buffer: Final[BytesIO] = BytesIO()
+
+    with ZipFile(buffer, "w", ZIP_DEFLATED) as zip_file:
+        zip_file.writestr(file_name, "\n".join(rows))
+
+    return buffer.getvalue()
+
+def _time(call: Callable[[], list[list[Result]]]) -> tuple[list[list[Result]], float]:
+    start: Final[float] = time.perf_counter()
+    results: Final[list[list[Result]]] = call()
+
+    return results, time.perf_counter() - start
+
+# the results of a year as extract_649_results built them before the grouped build, the prizes read from the dictionary instead of the result pages
+def _extract_649_results_with_apply(classic_zip: bytes, gp_zip: bytes, year: int, prizes: dict[datetime.date, float | None]) -> list[Result]:
+    csv_file_classic = read_csv(ZipFile(BytesIO(classic_zip)).open("649.csv"))
+    csv_file_gp = read_csv(ZipFile(BytesIO(gp_zip)).open("649GPs.csv"))
+
+    csv_file_classic[_DRAW_DATE_FIELD] = to_datetime(csv_file_classic[_DRAW_DATE_FIELD], format=_DATE_FORMAT)
+    csv_file_gp[_DRAW_DATE_FIELD] = to_datetime(csv_file_gp[_DRAW_DATE_FIELD], format=_DATE_FORMAT)
+
+    csv_file_classic = csv_file_classic[csv_file_classic[_DRAW_DATE_FIELD].dt.year == year].copy()
+    csv_file_gp = csv_file_gp[csv_file_gp[_DRAW_DATE_FIELD].dt.year == year].copy()
+
+    csv_file_classic[_PRIZE_WON_FIELD] = csv_file_classic.apply(lambda row: prizes[row[_DRAW_DATE_FIELD].date()], axis=1)
+    csv_file_classic[_NUMBERS_FIELDS] = csv_file_classic[_NUMBER_COLUMNS].values.tolist()
+    classic_data: DataFrame = csv_file_classic.loc[:, [_DRAW_DATE_FIELD, _PRIZE_WON_FIELD, _NUMBERS_FIELDS, _BONUS_NUMBER_FIELD]]
+
+    csv_file_gp[_PRIZE_WON_FIELD] = csv_file_gp[_PRIZE_WON_FIELD].replace("[\\$,]", "", regex=True).astype(float)
+    csv_file_gp[_NUMBER_DRAWN_FIELD] = csv_file_gp[_NUMBER_DRAWN_FIELD].replace(" ", "", regex=True)
+    guaranteed_data: DataFrame = csv_file_gp[csv_file_gp[_BALL_DRAWN_FIELD] == "Not Applicable"].groupby([_DRAW_DATE_FIELD, _PRIZE_WON_FIELD]).agg({_NUMBER_DRAWN_FIELD: list}).reset_index()
+    guaranteed_data = guaranteed_data.loc[:, [_DRAW_DATE_FIELD, _PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD]]
+
+    gold_ball_data: DataFrame = csv_file_gp[csv_file_gp[_BALL_DRAWN_FIELD] != "Not Applicable"].copy()
+    gold_ball_data[_IS_GOLD_BALL_DRAWN_FIELD] = gold_ball_data[_BALL_DRAWN_FIELD] == "Gold"
+    gold_ball_data = gold_ball_data.loc[:, [_DRAW_DATE_FIELD, _PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD, _IS_GOLD_BALL_DRAWN_FIELD]]
+
+    if classic_data.empty:
+        return []
+
+    return classic_data.apply(lambda row: _build_result_with_apply(row, gold_ball_data, guaranteed_data), axis=1).tolist()
+
+def _build_result_with_apply(row, gold_ball_data: DataFrame, guaranteed_data: DataFrame) -> Result:
+    date: Final[datetime.date] = row[_DRAW_DATE_FIELD]
+
+    classic: Final[Classic] = Classic(numbers=row[_NUMBERS_FIELDS], bonus=row[_BONUS_NUMBER_FIELD], prize=row[_PRIZE_WON_FIELD])
+    guaranteed: list[Guaranteed] | None = None
+    gold_ball: GoldBall | None = None
+
+    if not guaranteed_data[guaranteed_data[_DRAW_DATE_FIELD] == date].empty:
+        guaranteed_value_df: Final[DataFrame] = guaranteed_data.loc[guaranteed_data[_DRAW_DATE_FIELD] == date, [_PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD]].rename(columns={_NUMBER_DRAWN_FIELD: "numbers", _PRIZE_WON_FIELD: "prize"})
+        guaranteed = guaranteed_value_df.apply(lambda row: Guaranteed(numbers=row["numbers"], prize=row["prize"]), axis=1).tolist()
+
+    if not gold_ball_data[gold_ball_data[_DRAW_DATE_FIELD] == date].empty:
+        gold_ball_value_df: Final[DataFrame] = gold_ball_data.loc[gold_ball_data[_DRAW_DATE_FIELD] == date, [_PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD, _IS_GOLD_BALL_DRAWN_FIELD]].rename(columns={_NUMBER_DRAWN_FIELD: "number", _PRIZE_WON_FIELD: "prize", _IS_GOLD_BALL_DRAWN_FIELD: "isGoldBallDrawn"})
+        gold_ball = GoldBall(**gold_ball_value_df.to_dict(orient="records")[0])
+
+    return Result(date=date.strftime(_DATE_FORMAT), classic=classic, guaranteed=guaranteed, goldBall=gold_ball)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Measure the start of the API: the import of main and its first request.
+
+Each measure runs in a fresh interpreter started from src, as the API is. The import of main must not load the
+scrapers, the scheduler or the email sender, they are imported by the first job that needs them.
+
+    python -m benchmarks.startup
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final, NamedTuple
+
+LAZY_MODULES: Final[list[str]] = ["pandas", "bs4", "apscheduler", "httpx", "smtplib"]
+_SOURCE_DIRECTORY: Final[Path] = Path(__file__).resolve().parents[1] / "src"
+_IMPORT_TIME_LINE: Final[re.Pattern] = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+# the years are loaded from the database by the lifespan, the first request is measured without a database
+_FIRST_REQUEST_PROBE: Final[str] = f"""
+import json, sys, time
+start = time.perf_counter()
+import main
+import_seconds = time.perf_counter() - start
+loaded_modules = sorted(set({LAZY_MODULES!r}) & set(sys.modules))
+
+from fastapi.testclient import TestClient
+from src.games.game_years_registry import game_years_registry
+game_years_registry.load = lambda: None
+
+with TestClient(main.app) as client:
+    start = time.perf_counter()
+    status_code = client.get("/").status_code
+    first_request_seconds = time.perf_counter() - start
+
+print(json.dumps({{"import_seconds": import_seconds, "loaded_modules": loaded_modules, "status_code": status_code, "first_request_seconds": first_request_seconds}}))
+"""
+
+class StartupMeasure(NamedTuple):
+    import_seconds: float
+    slowest_imports: list[tuple[str, float]]
+    loaded_modules: list[str]
+    status_code: int
+    first_request_seconds: float
+
+def measure_startup(slowest_imports: int = 10) -> StartupMeasure:
+    """Return the import time of main with its slowest top-level imports, the lazy modules it loaded and the time of its first request"""
+    import_time: Final[subprocess.CompletedProcess] = _run_python("-X", "importtime", "-c", "import main")
+    main_seconds: float = 0.0
+    main_imports: list[tuple[str, float]] = []
+    nested_imports: list[tuple[str, float]] = []
+
+    # a module is printed after its imports, the top-level modules are indented by one space and their imports by three
+    for line in import_time.stderr.splitlines():
+        match: re.Match | None = _IMPORT_TIME_LINE.match(line)
+
+        if match is None:
+            continue
+
+        seconds: float = int(match.group(2)) / 1_000_000
+
+        if len(match.group(3)) == 3:
+            nested_imports.append((match.group(4), seconds))
+        elif len(match.group(3)) == 1:
+            if match.group(4) == "main":
+                main_seconds, main_imports = seconds, nested_imports
+
+            nested_imports = []
+
+    probe: Final[dict] = json.loads(_run_python("-c", _FIRST_REQUEST_PROBE).stdout.splitlines()[-1])
+
+    return StartupMeasure(
+        main_seconds,
+        sorted(main_imports, key=lambda item: item[1], reverse=True)[:slowest_imports],
+        probe["loaded_modules"],
+        probe["status_code"],
+        probe["first_request_seconds"]
+    )
+
+def _run_python(*arguments: str) -> subprocess.CompletedProcess:
+    environment: Final[dict[str, str]] = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(_SOURCE_DIRECTORY.parent), str(_SOURCE_DIRECTORY)]),
+        "RUN_SCHEDULER": "false"
+    }
+    environment.setdefault("DATABASE_CONNECTION_STRING", "postgresql://localhost/lottery")
+
+    return subprocess.run([sys.executable, *arguments], cwd=_SOURCE_DIRECTORY, env=environment, capture_output=True, text=True, check=True)
+
+def main() -> None:
+    measure: Final[StartupMeasure] = measure_startup()
+
+    print(f"import main: {measure.import_seconds * 1000:.0f}ms")
+
+    for module, seconds in measure.slowest_imports:
+        print(f"  {module}: {seconds * 1000:.0f}ms")
+
+    print(f"lazy modules loaded by the import: {', '.join(measure.loaded_modules) or 'none'}")
+    print(f"first request: {measure.first_request_seconds * 1000:.0f}ms (status {measure.status_code})")
+
+    assert not measure.loaded_modules, f"the import of main loaded {measure.loaded_modules}"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare the throughput of the Lotto Max year page parser with lxml and with the html.parser fallback.
+
+The pages are the year page fixtures of the tests, both backends must return the same numbers.
+
+    python -m benchmarks.year_page_parsing
+"""
+import re
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Final
+from unittest import mock
+
+from src.lottomax import lottomax_external_data
+from src.lottomax.models.numbers import Numbers
+
+_FIXTURES_DIRECTORY: Final[Path] = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "lottomax"
+_YEAR_PAGE_NAME: Final[re.Pattern] = re.compile(r"year_(\d{4})\.html")
+
+def main() -> None:
+    parser = ArgumentParser(prog="python -m benchmarks.year_page_parsing", description="Report the parse throughput of the Lotto Max year pages")
+    parser.add_argument("--repeat", type=int, default=200, help="The number of times every page is parsed by each backend")
+    arguments = parser.parse_args()
+
+    if lottomax_external_data.lxml_html is None:
+        raise SystemExit("lxml is not installed, install the development dependencies with pip install -r requirements-dev.txt")
+
+    pages: Final[dict[int, str]] = {
+        int(_YEAR_PAGE_NAME.fullmatch(path.name).group(1)): path.read_text()
+        for path in sorted(_FIXTURES_DIRECTORY.glob("year_*.html"))
+    }
+    page_bytes: Final[int] = sum(len(page.encode()) for page in pages.values())
+
+    lxml_numbers, lxml_seconds = _parse(pages, arguments.repeat)
+
+    with mock.patch.object(lottomax_external_data, "lxml_html", None):
+        html_parser_numbers, html_parser_seconds = _parse(pages, arguments.repeat)
+
+    assert lxml_numbers == html_parser_numbers, "lxml and html.parser do not return the same numbers"
+
+    draws: Final[int] = sum(map(len, lxml_numbers.values()))
+    print(f"{len(pages)} pages of {page_bytes} bytes and {draws} draws, parsed {arguments.repeat} times")
+
+    for name, seconds in (("lxml", lxml_seconds), ("html.parser", html_parser_seconds)):
+        print(
+            f"{name}: {len(pages) * arguments.repeat / seconds:.0f} pages/s, {draws * arguments.repeat / seconds:.0f} draws/s, "
+            f"{page_bytes * arguments.repeat / seconds / 1_000_000:.1f} MB/s"
+        )
+
+    print(f"speedup: {html_parser_seconds / lxml_seconds:.1f}x")
+
+def _parse(pages: dict[int, str], repeat: int) -> tuple[dict[int, list[Numbers]], float]:
+    """Return the numbers of every page and the seconds spent parsing the pages repeat times"""
+    start: Final[float] = time.perf_counter()
+
+    for _ in range(repeat):
+        numbers: dict[int, list[Numbers]] = {year: lottomax_external_data._parse_year_page(year, page) for year, page in pages.items()}
+
+    return numbers, time.perf_counter() - start
+
+if __name__ == "__main__":
+    main()
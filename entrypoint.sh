@@ -1,6 +1,16 @@
 echo "Running migrations"
 alembic -x url=$DATABASE_CONNECTION_STRING upgrade head
 
+echo "Checking the materialized responses"
+python -m src.payloads check --repair
+
+echo "Exporting the draw history"
+python -m src.exports --missing
+
+# the backfill only fills the draws missing after the checkpoint, the api does not wait for it
+echo "Running backfill in the background"
+python -m src.backfill &
+
 # Run fastapi app
 echo "Running fastapi app"
-python src/main.py
\ No newline at end of file
+python src/main.py
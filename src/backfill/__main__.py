@@ -0,0 +1,13 @@
+"""Backfill the draw results tables: python -m src.backfill"""
+from argparse import ArgumentParser
+
+from src.config.configuration import configuration
+from .backfill import BACKFILL_GAMES, run_backfill
+
+parser = ArgumentParser(prog="python -m src.backfill", description="Fill the draw results tables from the external data")
+parser.add_argument("--games", nargs="+", choices=list(BACKFILL_GAMES), default=list(BACKFILL_GAMES), help="The games to backfill")
+parser.add_argument("--workers", type=int, default=configuration.backfill_workers, help="The number of draws fetched concurrently")
+parser.add_argument("--batch-size", type=int, default=configuration.backfill_batch_size, help="The number of draws inserted per commit")
+
+arguments = parser.parse_args()
+run_backfill(arguments.games, arguments.workers, arguments.batch_size)
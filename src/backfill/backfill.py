@@ -0,0 +1,128 @@
+import datetime
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Final, NamedTuple
+
+from sqlalchemy import Table
+
+from src.database.upserts import UpsertResult, to_row
+from src.exports.exports import export_years
+from src.games.game_repository import get_years_by_name
+from src.payloads.payloads import materialize_year
+
+from src.lottomax import lottomax_external_data
+from src.lottomax.entities.lotto_max_results import LottoMaxResults
+from src.lottomax.lottomax_factory import build_lotto_max_result
+from src.lottomax.models.numbers import Numbers
+
+from src.daily_grand import daily_grand_external_data
+from src.daily_grand.entities.daily_grand_results import DailyGrandResults
+from src.daily_grand.daily_grand_factory import build_daily_grand_new_result
+
+from src.six_fourty_nine import six_fourty_nine_external_data
+from src.six_fourty_nine.entities.six_fourty_nine_results import SixFourtyNineResults
+from src.six_fourty_nine.six_fourty_nine_factory import build_649_classic_prizes, build_649_new_result
+from src.six_fourty_nine.sixe_fourty_nine_repository import get_649_numbers_by_year
+from src.six_fourty_nine.models.result import Result as SixFourtyNineResult
+
+from .backfill_repository import get_backfill_checkpoint, get_saved_draw_dates, save_backfill_batch
+
+class BackfillGame(NamedTuple):
+    """Describe how to fetch and build the draw rows of a game"""
+    game_id: int
+    name: str
+    table: Table
+    extract_draws: Callable[[int], list[Any]]
+    get_draw_date: Callable[[Any], datetime.date]
+    build_row: Callable[[Any], dict]
+
+def run_backfill(game_names: list[str], workers: int, batch_size: int) -> None:
+    """Fill the draw results tables from the external data, resuming from the last checkpoint of each game"""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for game_name in game_names:
+            _backfill_game(BACKFILL_GAMES[game_name], executor, batch_size)
+
+def _backfill_game(game: BackfillGame, executor: Executor, batch_size: int) -> None:
+    checkpoint: Final[datetime.date | None] = get_backfill_checkpoint(game.game_id)
+    years: list[int] = sorted(get_years_by_name(game.name))
+
+    if checkpoint is not None:
+        print(f"Resuming {game.name} backfill after {checkpoint}")
+        years = list(filter(lambda year: year >= checkpoint.year, years))
+
+    backfilled_years: Final[list[int]] = []
+
+    for year in years:
+        draws: list[Any] = sorted(game.extract_draws(year), key=game.get_draw_date)
+
+        if checkpoint is not None:
+            draws = list(filter(lambda draw: game.get_draw_date(draw) > checkpoint, draws))
+
+        # the draws already ingested by the scheduler after the checkpoint are not fetched again
+        saved_dates: set[datetime.date] = get_saved_draw_dates(game.table, year)
+        draws = list(filter(lambda draw: game.get_draw_date(draw) not in saved_dates, draws))
+
+        print(f"Backfilling {len(draws)} {game.name} draws for the year {year}")
+
+        for start in range(0, len(draws), batch_size):
+            batch: list[Any] = draws[start:start + batch_size]
+            rows: list[dict] = list(executor.map(game.build_row, batch))
+            last_date: datetime.date = game.get_draw_date(batch[-1])
+
+            upsert_result: UpsertResult = save_backfill_batch(game.table, rows, game.game_id, last_date)
+            print(f"Saved {game.name} draws up to {last_date}: {len(upsert_result.inserted)} inserted, {len(upsert_result.skipped)} skipped")
+
+        if draws:
+            materialize_year(game.name, year)
+            backfilled_years.append(year)
+
+    if backfilled_years:
+        export_years(game.name, backfilled_years)
+
+def _build_lotto_max_row(number: Numbers) -> dict:
+    prize_breakdown, regions = lottomax_external_data.extract_lotto_result_with_regions(number.date)
+
+    return to_row(build_lotto_max_result(number, prize_breakdown, regions))
+
+def _build_daily_grand_row(date: datetime.date) -> dict:
+    response = daily_grand_external_data.fetch_daily_grand_result(date)
+    number_result = daily_grand_external_data.extract_daily_grand_result(date, response)
+    prize_breakdown = daily_grand_external_data.extract_daily_grand_prize_breakdown(response)
+
+    return to_row(build_daily_grand_new_result(number_result, prize_breakdown))
+
+def _extract_649_draws(year: int) -> list[SixFourtyNineResult]:
+    known_prizes: Final[dict[datetime.date, float | None]] = build_649_classic_prizes(get_649_numbers_by_year(year))
+
+    return six_fourty_nine_external_data.extract_649_results(year, known_prizes)
+
+def _build_649_row(result: SixFourtyNineResult) -> dict:
+    prize_breakdown = six_fourty_nine_external_data.extract_649_prize_breakdown(result.date)
+
+    return to_row(build_649_new_result(result, prize_breakdown))
+
+BACKFILL_GAMES: Final[dict[str, BackfillGame]] = {
+    "lottomax": BackfillGame(
+        game_id=1,
+        name="lottomax",
+        table=LottoMaxResults.__table__,
+        extract_draws=lottomax_external_data.extract_lotto_numbers_by_year,
+        get_draw_date=lambda number: number.date,
+        build_row=_build_lotto_max_row
+    ),
+    "dailygrand": BackfillGame(
+        game_id=2,
+        name="dailygrand",
+        table=DailyGrandResults.__table__,
+        extract_draws=daily_grand_external_data.extract_daily_grand_dates,
+        get_draw_date=lambda date: date,
+        build_row=_build_daily_grand_row
+    ),
+    "sixfourtynine": BackfillGame(
+        game_id=3,
+        name="sixfourtynine",
+        table=SixFourtyNineResults.__table__,
+        extract_draws=_extract_649_draws,
+        get_draw_date=lambda result: result.date,
+        build_row=_build_649_row
+    ),
+}
@@ -0,0 +1,34 @@
+import datetime
+from sqlalchemy import Table, func, select
+from sqlalchemy.dialects.postgresql import insert
+from src.database.database import database
+from src.database.predicates import is_in_year
+from src.database.upserts import UpsertResult, upsert_draw_results
+from src.payloads.payload_repository import delete_year_payloads
+from .entities.backfill_checkpoint import BackfillCheckpoint
+
+def get_backfill_checkpoint(game_id: int) -> datetime.date | None:
+  with database.get_db() as _database:
+    checkpoint: BackfillCheckpoint | None = _database.query(BackfillCheckpoint.last_date).filter(BackfillCheckpoint.game_id == game_id).first()
+    return checkpoint.last_date if checkpoint is not None else None
+
+def get_saved_draw_dates(table: Table, year: int) -> set[datetime.date]:
+  with database.get_db() as _database:
+    return set(_database.scalars(select(table.c.date).filter(is_in_year(table.c.date, year))).all())
+
+def save_backfill_batch(table: Table, rows: list[dict], game_id: int, last_date: datetime.date) -> UpsertResult:
+  """Insert a batch of draw results and move the game checkpoint within the same transaction.
+
+  The year payloads of the batch are deleted with it, so they are not served stale when the year fails to be materialized.
+  """
+  checkpoint_statement = insert(BackfillCheckpoint).values(game_id=game_id, last_date=last_date)
+  checkpoint_statement = checkpoint_statement.on_conflict_do_update(
+    index_elements=[BackfillCheckpoint.game_id],
+    set_={"last_date": checkpoint_statement.excluded.last_date, "updated_at": func.now()}
+  )
+
+  with database.unit_of_work() as _database:
+    upsert_result: UpsertResult = upsert_draw_results(_database, table, rows)
+    delete_year_payloads(game_id, sorted({row["date"].year for row in rows}), _database)
+    _database.execute(checkpoint_statement)
+    return upsert_result
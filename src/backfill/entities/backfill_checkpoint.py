@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Date, DateTime, Integer, func
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+class BackfillCheckpoint(Base):
+  __tablename__ = "backfill_checkpoints"
+
+  game_id: Column = Column(Integer, primary_key=True, nullable=False)
+  last_date: Column = Column(Date, nullable=False)
+  updated_at: Column = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,19 @@
+import datetime
+from typing import Final
+
+def get_draw_dates(since: datetime.date, until: datetime.date, draw_weekdays: list[int]) -> list[datetime.date]:
+    """Return the draw dates of the calendar from the since date up to the until date, both included"""
+    draw_dates: Final[list[datetime.date]] = []
+    date: datetime.date = since
+
+    while date <= until:
+        if date.weekday() in draw_weekdays:
+            draw_dates.append(date)
+
+        date += datetime.timedelta(days=1)
+
+    return draw_dates
+
+def get_missing_draw_dates(saved_dates: set[datetime.date], since: datetime.date, until: datetime.date, draw_weekdays: list[int]) -> list[datetime.date]:
+    """Return the draw dates of the calendar between the since and until dates that were not saved"""
+    return [date for date in get_draw_dates(since, until, draw_weekdays) if date not in saved_dates]
@@ -0,0 +1,54 @@
+from hashlib import sha256
+from io import BytesIO
+from threading import Lock
+from typing import Callable, Final
+from zipfile import ZipFile
+
+from pandas import DataFrame, read_csv, to_datetime
+from requests import Response
+
+from src.http_client.http_client import http_client
+
+DRAW_DATE_FIELD: Final[str] = "DRAW DATE"
+_DATE_FORMAT: Final[str] = "%Y-%m-%d"
+
+_frames: Final[dict[str, tuple[str, DataFrame]]] = {}
+_lock: Final[Lock] = Lock()
+
+def load_playnow_archive(url: str, file_name: str, dtypes: dict[str, str], prepare: Callable[[DataFrame], DataFrame] | None = None) -> DataFrame:
+    """Return the draws of a PlayNow archive as a date-indexed frame.
+
+    The csv is parsed once per archive content: only the DRAW DATE and the dtypes columns are read,
+    and the prepare callback runs once on the parsed frame instead of once per year.
+    """
+    response: Final[Response] = http_client.get(url)
+
+    if response.status_code != 200:
+        raise Exception(f"An error occured while fetching the archive {url} \n message: {response.text}")
+
+    content_hash: Final[str] = sha256(response.content).hexdigest()
+
+    with _lock:
+        if url in _frames and _frames[url][0] == content_hash:
+            return _frames[url][1]
+
+    zip_file: Final[ZipFile] = ZipFile(BytesIO(response.content))
+    frame: DataFrame = read_csv(zip_file.open(file_name), usecols=[DRAW_DATE_FIELD, *dtypes], dtype=dtypes)
+    frame[DRAW_DATE_FIELD] = to_datetime(frame[DRAW_DATE_FIELD], format=_DATE_FORMAT)
+    frame = frame.set_index(DRAW_DATE_FIELD, drop=False).rename_axis(None).sort_index(kind="stable")
+
+    if prepare is not None:
+        frame = prepare(frame)
+
+    with _lock:
+        _frames[url] = (content_hash, frame)
+
+    return frame
+
+def get_year_slice(frame: DataFrame, year: int) -> DataFrame:
+    """Return the draws of a year as a slice of the sorted date index, without copying the frame"""
+    return frame.loc[f"{year}-01-01":f"{year}-12-31"]
+
+def get_years(frame: DataFrame) -> list[int]:
+    """Return the years of the archive, the most recent first"""
+    return sorted(frame.index.year.unique().tolist(), reverse=True)
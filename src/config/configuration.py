@@ -9,13 +9,51 @@ class Configuration(BaseSettings):
     root_path: str = ""
     port: int = 8080
     host: str = "0.0.0.0"
+    workers: int = 1
     rapidapi_proxy_secret: str = ""
     database_connection_string: str = ""
+    database_pool_size: int = 10
+    database_max_overflow: int = 10
+    database_pool_pre_ping: bool = True
+    database_pool_recycle: int = 1800
+    database_pool_timeout: float = 30.0
     sender_email: str = ""
     sender_password: str = ""
     recipient_email: str = ""
     smtp_server: str = "smtp.gmail.com"
     smtp_port: int = 587
+    smtp_starttls: bool = True
+    notification_batch_size: int = 50
+    notification_max_attempts: int = 8
+    notification_retry_delay: float = 60.0
+    notification_claim_timeout: int = 300
+    notification_flush_interval: int = 60
+    http_connect_timeout: float = 5.0
+    http_read_timeout: float = 30.0
+    http_retries: int = 3
+    http_backoff_factor: float = 0.5
+    http_backoff_jitter: float = 0.5
+    http_pool_maxsize: int = 16
+    http_cache_directory: str = ".cache/http"
+    http_cache_ttl: int = 3600
+    http_cache_max_size: int = 536870912
+    scrape_workers: int = 4
+    scrape_rate_limit: float = 2.0
+    year_page_ttl: int = 600
+    backfill_workers: int = 8
+    backfill_batch_size: int = 100
+    export_directory: str = ".cache/exports"
+    response_cache_max_entries: int = 4096
+    response_cache_ttl: int = 86400
+    response_max_age_past_years: int = 31536000
+    response_max_age_current_year: int = 300
+    results_range_max_days: int = 366
+    results_page_max_size: int = 200
+    run_scheduler: bool = True
+    job_lease_duration: int = 3600
+    catch_up_days: int = 60
+    catch_up_retries: int = 4
+    catch_up_retry_delay: int = 1800
 
     model_config: SettingsConfigDict = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -1,12 +1,14 @@
 import datetime
 from typing import Final
-from requests import get, Response
-from zipfile import ZipFile
-from io import BytesIO
-from pandas import read_csv, DataFrame, to_datetime
+from httpx import Response as HttpxResponse
+from requests import Response
+from pandas import DataFrame
 
 from src.common.models.numbers_matched import NumbersMatched
 from src.common.models.summary import Summary
+from src.common.playnow_archive import DRAW_DATE_FIELD, get_year_slice, get_years, load_playnow_archive
+from src.http_client.async_http_client import async_http_client
+from src.http_client.http_client import http_client
 
 from .models.prize_breakdown import PrizeBreakdown
 from .models.detail_breakdown import DetailBreakDown
@@ -16,52 +18,41 @@ from .models.result import Result
 _DAILY_GRAND_BASE_URL: Final[str] = "https://www.playnow.com"
 _RESULT_FILE_PATH: Final[str] = "/resources/documents/downloadable-numbers/DailyGrand.zip"
 _FILE_NAME: Final[str] = "DailyGrand.csv"
+_PRIZE_DIVISION_FIELD: Final[str] = "PRIZE DIVISION"
 _DATE_FORMAT: Final[str] = "%Y-%m-%d"
+# the ingestion fetches the draws missing from the database, their pages are revalidated so a retry sees the draws published since the last fetch
+_MISSING_DRAW_MAX_AGE: Final[int] = 0
 
 _PRIZE_TYPE_ANNUITY: Final[str] = "annuity"
 
 def extract_all_years() -> list[int]:
     """Return all daily grand years played"""
-    draw_date_column: Final[str] = "DRAW DATE"
+    return get_years(_load_archive())
 
-    response: Response = get(f"{_DAILY_GRAND_BASE_URL}{_RESULT_FILE_PATH}")
+def extract_daily_grand_dates(year: int) -> list[datetime.date]:
+    """Return the draw dates of the selected year without fetching each draw"""
+    csv_file: Final[DataFrame] = _get_main_draws_by_year(year)
 
-    if response.status_code != 200:
-        raise Exception(f"An error occured while fetching the years \n message: {response.text}")
-    
-    zip_file = ZipFile(BytesIO(response.content))
-    csv_file: Final[DataFrame] = read_csv(zip_file.open(_FILE_NAME))
-    csv_file[draw_date_column] = to_datetime(csv_file[draw_date_column], format=_DATE_FORMAT)
-
-    return csv_file[draw_date_column].dt.year.unique().tolist()
-
-def extract_daily_grand_results(year: int) -> list[Result]:
-    """Return results by selected years"""
-    zip_file_response: Response = get(f"{_DAILY_GRAND_BASE_URL}{_RESULT_FILE_PATH}")
-
-    if zip_file_response.status_code != 200:
-        raise Exception(f"An error occured while fetching the results for the year {year} \n message: {zip_file_response.text}")
-
-    zip_file = ZipFile(BytesIO(zip_file_response.content))
-    csv_file: DataFrame = read_csv(zip_file.open(_FILE_NAME))
-    csv_file["DRAW DATE"] = to_datetime(csv_file["DRAW DATE"], format=_DATE_FORMAT)
-
-    csv_file = csv_file[(csv_file["DRAW DATE"].dt.year == year) & (csv_file["PRIZE DIVISION"] == 0)]
-    csv_file = csv_file.sort_values(by=["DRAW DATE"], ascending=False)
-
-    csv_file["JSON"] = csv_file.apply(lambda row: _build_result_from_zip(row), axis=1)
-
-    return csv_file["JSON"].tolist()
+    return sorted(csv_file[DRAW_DATE_FIELD].dt.date.unique().tolist())
 
 def fetch_daily_grand_result(date: datetime.date) -> Response:
-    detail_page: Response = get(f"{_DAILY_GRAND_BASE_URL}/services2/lotto/draw/dgrd/{date.strftime(_DATE_FORMAT)}")
+    detail_page: Response = http_client.get(_get_result_api_url(date))
 
     if detail_page.status_code != 200:
         raise Exception(f"The date {date} does not exist within the daily grand results \n message: {detail_page.text}")
     
     return detail_page
 
-def extract_daily_grand_result(date: datetime.date, response: Response) -> Result:
+async def fetch_daily_grand_result_async(date: datetime.date) -> HttpxResponse:
+    """Return the draw payload of the date without blocking the event loop"""
+    detail_page: Final[HttpxResponse] = await async_http_client.get(_get_result_api_url(date), _MISSING_DRAW_MAX_AGE)
+
+    if detail_page.status_code != 200:
+        raise Exception(f"The date {date} does not exist within the daily grand results \n message: {detail_page.text}")
+
+    return detail_page
+
+def extract_daily_grand_result(date: datetime.date, response: Response | HttpxResponse) -> Result:
     """Return the daily grand result from the response"""
     result_data: Final[dict] = response.json()
     numbers: Final[list[int]] = result_data["drawNbrs"]
@@ -71,7 +62,7 @@ def extract_daily_grand_result(date: datetime.date, response: Response) -> Resul
     
     return Result(date=date, numbers=numbers, grandNumber=grand_number, prize=prize, bonusesDraw=bonus_draw_details)
 
-def extract_daily_grand_prize_breakdown(response: Response) -> PrizeBreakdown:
+def extract_daily_grand_prize_breakdown(response: Response | HttpxResponse) -> PrizeBreakdown:
     """Return the daily grand prize breakdown from the response"""
     game_breakdown: Final[list[dict]] = response.json()["gameBreakdown"]
     main_breakdown: Final[DetailBreakDown] = _build_main_breakdown(list(filter(lambda breakdown: breakdown["prizeDiv"] != 20, game_breakdown)))
@@ -79,28 +70,18 @@ def extract_daily_grand_prize_breakdown(response: Response) -> PrizeBreakdown:
 
     return PrizeBreakdown(mainBreakdown=main_breakdown, bonusesBreakdown=bonus_breakdown)
 
-def _build_result_from_zip(row) -> Result:
-    """Return the grand price for the selected date"""
-    date: Final[str] = row["DRAW DATE"].strftime(_DATE_FORMAT)
-    result_page: Final[Response] = get(f"{_DAILY_GRAND_BASE_URL}/services2/lotto/draw/dgrd/{date}")
-
-    if result_page.status_code != 200:
-        raise Exception(f"An error occured while fetching the results for the date {date} \n message: {result_page.text}")
-    
-    result_payload: Final[dict] = result_page.json()
-    
-    numbers: list[int] = result_payload["drawNbrs"]
-    grand_number: int = result_payload["bonusNbr"]
-    prize: str = result_payload["gameBreakdown"][0]["prizeAmount"]
-
-    bonus_draw_details: list[dict] = result_payload["bonusDrawDetails"]
+def _get_result_api_url(date: datetime.date) -> str:
+    return f"{_DAILY_GRAND_BASE_URL}/services2/lotto/draw/dgrd/{date.strftime(_DATE_FORMAT)}"
 
-   # remove duplication bonus_draw details by using the key seqNbr
-    bonus_draw_details = {v['seqNbr']:v for v in bonus_draw_details}.values()
+def _load_archive() -> DataFrame:
+    """Return the daily grand archive, parsed once per download"""
+    return load_playnow_archive(f"{_DAILY_GRAND_BASE_URL}{_RESULT_FILE_PATH}", _FILE_NAME, {_PRIZE_DIVISION_FIELD: "int8"})
 
-    bonuses_draw: list[BonusDraw] = list(map(lambda bonus: BonusDraw(numbers=bonus["drawNbrs"], prize=bonus["prizeAmount"]), result_payload["bonusDrawDetails"]))
+def _get_main_draws_by_year(year: int) -> DataFrame:
+    """Return the main draw rows of the selected year"""
+    year_rows: Final[DataFrame] = get_year_slice(_load_archive(), year)
 
-    return Result(date=row["DRAW DATE"], numbers=numbers, grandNumber=grand_number, prize=prize, bonusesDraw=bonuses_draw)
+    return year_rows[year_rows[_PRIZE_DIVISION_FIELD] == 0]
 
 def _build_BonusDraw(bonus: dict) -> list[BonusDraw]:
     """Return the bonus draw"""    
@@ -1,5 +1,5 @@
 import datetime
-from json import loads, dumps
+from json import dumps
 from typing import Final
 
 from sqlalchemy import Column
@@ -28,8 +28,8 @@ def build_daily_grand_results(data: list[DailyGrandResults]) -> list[Result]:
 
 def build_daily_grand_prize_breakdown(data: DailyGrandResults) -> PrizeBreakdown:
     """Build daily grand prize breakdown"""
-    main_breakdown: Final[DetailBreakDown] = DetailBreakDown(**loads(data.main_breakdown))
-    bonuses_breakdown: Final[DetailBreakDown | None] = DetailBreakDown(**loads(data.bonus_breakdown)) if data.bonus_breakdown else None 
+    main_breakdown: Final[DetailBreakDown] = DetailBreakDown(**data.main_breakdown)
+    bonuses_breakdown: Final[DetailBreakDown | None] = DetailBreakDown(**data.bonus_breakdown) if data.bonus_breakdown else None 
 
     return PrizeBreakdown(mainBreakdown=main_breakdown, bonusesBreakdown=bonuses_breakdown)
 
@@ -40,10 +40,10 @@ def build_daily_grand_new_result(number_result: Result, prize_breakdown: PrizeBr
         game_id=2,
         numbers=number_result.numbers,
         grand_number=number_result.grand_number,
-        bonuses_draw=list(map(lambda bonus_draw: bonus_draw.model_dump_json(), number_result.bonuses_draw)),
+        bonuses_draw=list(map(lambda bonus_draw: bonus_draw.model_dump(mode="json"), number_result.bonuses_draw)),
         prize=number_result.prize,
-        main_breakdown=prize_breakdown.main_breakdown.model_dump_json(),
-        bonus_breakdown=prize_breakdown.bonuses_breakdown.model_dump_json() if prize_breakdown.bonuses_breakdown else None
+        main_breakdown=prize_breakdown.main_breakdown.model_dump(mode="json"),
+        bonus_breakdown=prize_breakdown.bonuses_breakdown.model_dump(mode="json") if prize_breakdown.bonuses_breakdown else None
     )
 
 def build_daily_grand_body_email(data: DailyGrandResults) -> str:
@@ -68,7 +68,7 @@ def _build_bonuses_draw(data: Column) -> list[BonusDraw]:
     bonuses_draw: list[BonusDraw] = []
 
     for value in data:
-        bonus_draw_dict: Final[dict] = loads(value)
+        bonus_draw_dict: Final[dict] = value
         bonuses_draw.append(BonusDraw(**bonus_draw_dict))
 
     return bonuses_draw
\ No newline at end of file
@@ -0,0 +1,100 @@
+import asyncio
+import datetime
+import traceback
+from typing import Final
+
+from httpx import Response as HttpxResponse
+from src.common.draw_calendar import get_missing_draw_dates
+from src.config.configuration import configuration
+from src.database.database import database
+from src.database.upserts import UpsertResult
+from src.exports.exports import export_years
+from src.games.game_repository import is_year_exist_by_name, save_new_year_by_name
+from src.games.game_years_registry import game_years_registry
+from src.notification.notification_outbox import notification_outbox
+from src.payloads.payloads import materialize_year
+from src.response_cache.response_cache import response_cache
+
+from .daily_grand_external_data import extract_daily_grand_prize_breakdown, extract_daily_grand_result, fetch_daily_grand_result_async
+from .daily_grand_factory import build_daily_grand_body_email, build_daily_grand_new_result
+from .daily_grand_repository import get_daily_grand_dates_since, save_daily_grand_results
+from .entities.daily_grand_results import DailyGrandResults
+
+from .models.prize_breakdown import PrizeBreakdown
+from .models.result import Result
+
+_GAME_NAME: Final[str] = "dailygrand"
+_DRAW_WEEKDAYS: Final[list[int]] = [0, 3]
+
+def find_missed_draw_dates(until: datetime.date) -> list[datetime.date]:
+    """Return the daily grand draw dates of the calendar missing from the saved results over the catch-up window"""
+    since: Final[datetime.date] = until - datetime.timedelta(days=configuration.catch_up_days)
+
+    return get_missing_draw_dates(set(get_daily_grand_dates_since(since)), since, until, _DRAW_WEEKDAYS)
+
+async def insert_new_daily_grand_results(dates: list[datetime.date]) -> None:
+    """Insert new daily grand results, the draw payload of every date is fetched concurrently and the draws are saved in one batch"""
+    responses: Final[list[HttpxResponse | BaseException]] = await asyncio.gather(*map(fetch_daily_grand_result_async, dates), return_exceptions=True)
+    new_results: Final[list[DailyGrandResults]] = []
+
+    for date, response_data in zip(dates, responses):
+        new_result: DailyGrandResults | None = await asyncio.to_thread(_build_new_daily_grand_result, date, response_data)
+
+        if new_result is not None:
+            new_results.append(new_result)
+
+    if new_results:
+        await asyncio.to_thread(_save_new_daily_grand_results, new_results)
+
+def _build_new_daily_grand_result(date: datetime.date, response_data: HttpxResponse | BaseException) -> DailyGrandResults | None:
+    """Build a fetched daily grand result, notify and return None when it cannot be built"""
+    try:
+        if isinstance(response_data, BaseException):
+            raise response_data
+
+        external_number_result: Final[Result] = extract_daily_grand_result(date, response_data)
+        external_prize_breakdown: Final[PrizeBreakdown] = extract_daily_grand_prize_breakdown(response_data)
+
+        return build_daily_grand_new_result(external_number_result, external_prize_breakdown)
+    except Exception:
+        notification_outbox.notify("ERROR Daily Grand", f"An error occurred while trying to add a new result for the date {date.strftime('%Y-%m-%d')}. <br> Error: {traceback.format_exc().replace('\n', '<br>')}")
+        return None
+
+def _save_new_daily_grand_results(daily_grand_results: list[DailyGrandResults]) -> None:
+    """Save the built daily grand results in one batch, the draws already saved are reported instead of inserted again"""
+    try:
+        new_years: Final[list[int]] = []
+
+        # the new years, the draws and their responses are committed together, so a failed rebuild never leaves a stale year response
+        with database.unit_of_work() as session:
+            for year in sorted({result.date.year for result in daily_grand_results}):
+                if not is_year_exist_by_name(_GAME_NAME, year, session):
+                    save_new_year_by_name(_GAME_NAME, year, session)
+                    new_years.append(year)
+
+            upsert_result: Final[UpsertResult] = save_daily_grand_results(daily_grand_results, session=session)
+            inserted_years: Final[list[int]] = sorted({date.year for date in upsert_result.inserted})
+
+            for year in inserted_years:
+                materialize_year(_GAME_NAME, year, session)
+
+        if new_years:
+            game_years_registry.refresh(_GAME_NAME)
+
+        for year in new_years:
+            notification_outbox.notify("New Year added to Daily Grand", f"New year {year} was added to the database")
+
+        print(f"daily grand results: {len(upsert_result.inserted)} inserted, {len(upsert_result.skipped)} skipped")
+
+        for date in upsert_result.skipped:
+            notification_outbox.notify("ERROR Daily Grand", f"The numbers for the date {date.strftime('%Y-%m-%d')} already exist")
+
+        response_cache.invalidate(_GAME_NAME)
+
+        if inserted_years:
+            export_years(_GAME_NAME, inserted_years)
+
+        for new_result in filter(lambda result: result.date in upsert_result.inserted, daily_grand_results):
+            notification_outbox.notify("New Daily Grand result added", build_daily_grand_body_email(new_result))
+    except Exception:
+        notification_outbox.notify("ERROR Daily Grand", f"An error occurred while saving the daily grand results. <br> Error: {traceback.format_exc().replace('\n', '<br>')}")
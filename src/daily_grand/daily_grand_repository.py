@@ -1,18 +1,26 @@
 import datetime
 
-from sqlalchemy import extract
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from src.database.database import database
+from src.database.predicates import is_in_year
+from src.database.upserts import UpsertResult, to_row, upsert_draw_results
 from .entities.daily_grand_results import DailyGrandResults
 
-with database.get_db() as _database:
-  def get_daily_grand_numbers_by_year(year: int) -> list[DailyGrandResults]:
-    return _database.query(DailyGrandResults.date, DailyGrandResults.numbers, DailyGrandResults.grand_number, DailyGrandResults.bonuses_draw, DailyGrandResults.prize).filter(extract('year', DailyGrandResults.date) == year).all()
-  
-  def get_daily_grand_numbers_by_date(date: datetime.date) -> DailyGrandResults:
+def get_daily_grand_numbers_by_year(year: int) -> list[DailyGrandResults]:
+  with database.get_db() as _database:
+    return _database.query(DailyGrandResults.date, DailyGrandResults.numbers, DailyGrandResults.grand_number, DailyGrandResults.bonuses_draw, DailyGrandResults.prize).filter(is_in_year(DailyGrandResults.date, year)).all()
+
+def get_daily_grand_numbers_by_date(date: datetime.date) -> DailyGrandResults:
+  with database.get_db() as _database:
     return _database.query(DailyGrandResults.main_breakdown, DailyGrandResults.bonus_breakdown).filter(DailyGrandResults.date == date).first()
-  
-  def save_daily_grand_result(daily_grand_result: DailyGrandResults) -> None:
-    _database.add(daily_grand_result)
-    _database.commit()
-    _database.refresh(daily_grand_result)
\ No newline at end of file
+
+def get_daily_grand_dates_since(since: datetime.date) -> list[datetime.date]:
+  with database.get_db() as _database:
+    return _database.scalars(select(DailyGrandResults.date).filter(DailyGrandResults.date >= since)).all()
+
+def save_daily_grand_results(daily_grand_results: list[DailyGrandResults], overwrite: bool = False, session: Session | None = None) -> UpsertResult:
+  """Save a batch of draws in one transaction, the one of the session when given, the draws already saved are skipped unless they are overwritten"""
+  with database.unit_of_work(session) as _database:
+    return upsert_draw_results(_database, DailyGrandResults.__table__, list(map(to_row, daily_grand_results)), overwrite)
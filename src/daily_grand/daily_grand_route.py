@@ -1,11 +1,17 @@
 import datetime
-from typing import Final
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Query
+
+from fastapi.responses import FileResponse, StreamingResponse
+
+from src.config.configuration import configuration
+from src.exports.export_files import EXPORT_MEDIA_TYPES, ExportFormat
+from src.payloads.draw_range import ResultsFormat
+from src.response_cache.http_caching import build_json_response
 
 from .models.prize_breakdown import PrizeBreakdown
 
 from .models.result import Result
-from .daily_grand_service import find_all_years, find_daily_grand_results_by_year, find_daily_grand_result_by_date
+from .daily_grand_service import find_all_years, find_daily_grand_results_by_year_json, find_daily_grand_result_by_date_json, find_daily_grand_results_between, find_daily_grand_export
 
 router = APIRouter(
     prefix="/daily-grand",
@@ -13,28 +19,38 @@ router = APIRouter(
     responses={404: {"description": "Not Found"}, 500: {"description": "Internal server error"}}
 )
 
-_DAILY_GRAND_YEARS: Final[list[int]] = find_all_years()
-_DAILT_GRAND_START_YEAR: Final[int] = min(_DAILY_GRAND_YEARS)
-_DAILY_GRAND_LAST_YEAR: Final[int] = max(_DAILY_GRAND_YEARS)
-
 @router.get("/years", response_model=list[int])
 async def get_daily_grand_years() -> list[int]:
     """Get all years from daily grand"""
-    return _DAILY_GRAND_YEARS
+    return find_all_years()
 
 @router.get("/years/{year}", response_model=list[Result])
-async def get_daily_grand_result_by_year(year: int = Path(
-        title="The year of daily grand results to get",
-        ge=_DAILT_GRAND_START_YEAR,
-        le=_DAILY_GRAND_LAST_YEAR
+def get_daily_grand_result_by_year(year: int = Path(
+        title="The year of daily grand results to get"
 )):
     """Get the daily grand numbers result by year"""
-    return find_daily_grand_results_by_year(year)
+    return build_json_response(find_daily_grand_results_by_year_json(year), year)
+
+@router.get("/results", response_class=StreamingResponse, responses={200: {"content": {"application/x-ndjson": {}, "application/json": {}}}})
+def get_daily_grand_results(
+    date_from: datetime.date = Query(alias="from", title="The date of the first draw"),
+    date_to: datetime.date = Query(alias="to", title="The date of the last draw"),
+    cursor: datetime.date | None = Query(None, title="The X-Next-Cursor header of the previous page"),
+    limit: int = Query(configuration.results_page_max_size, ge=1, le=configuration.results_page_max_size, title="The maximum number of draws of the page"),
+    results_format: ResultsFormat = Query(ResultsFormat.NDJSON, alias="format", title="Newline-delimited JSON or a JSON array")):
+    """Stream the winning numbers and prize payouts of the draws between two dates"""
+    return find_daily_grand_results_between(date_from, date_to, cursor, limit, results_format)
 
 @router.get("/results/{date}", response_model=PrizeBreakdown)
-async def get_daily_grand_result_by_date(
+def get_daily_grand_result_by_date(
     date: datetime.date = Path(
         title="The date to view the winning numbers and prize payouts that took place"
     )):
     """Get the winning numbers and prise payouts for a specific date"""
-    return find_daily_grand_result_by_date(date)
\ No newline at end of file
+    return build_json_response(find_daily_grand_result_by_date_json(date), date.year)
+
+@router.get("/export", response_class=FileResponse, responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}})
+def get_daily_grand_export(
+    export_format: ExportFormat = Query(ExportFormat.PARQUET, alias="format", title="Parquet or Arrow IPC")):
+    """Get the full daily grand draw history as a columnar file"""
+    return find_daily_grand_export(export_format)
@@ -1,15 +1,16 @@
 import datetime
-import traceback
 from typing import Final
 
 from fastapi import HTTPException
-from requests import Response
-from src.games.game_repository import get_years_by_name, is_year_exist_by_name, save_new_year_by_name
-from src.notification.email_sender import email_sender
-
-from .daily_grand_external_data import extract_daily_grand_prize_breakdown, extract_daily_grand_result, fetch_daily_grand_result
-from .daily_grand_factory import build_daily_grand_body_email, build_daily_grand_new_result, build_daily_grand_prize_breakdown, build_daily_grand_results
-from .daily_grand_repository import get_daily_grand_numbers_by_date, get_daily_grand_numbers_by_year, save_daily_grand_result
+from fastapi.responses import FileResponse, StreamingResponse
+from src.exports.export_files import ExportFormat, build_export_response
+from src.games.game_years_registry import game_years_registry
+from src.payloads.draw_range import ResultsFormat, build_draw_range_response
+from src.payloads.payloads import RESULTS_VARIANT, get_draw_payload, get_year_payload
+from src.response_cache.response_cache import CachedResponse, response_cache, to_json
+
+from .daily_grand_factory import build_daily_grand_prize_breakdown, build_daily_grand_results
+from .daily_grand_repository import get_daily_grand_numbers_by_date, get_daily_grand_numbers_by_year
 from .entities.daily_grand_results import DailyGrandResults
 
 from .models.prize_breakdown import PrizeBreakdown
@@ -19,7 +20,7 @@ _GAME_NAME: Final[str] = "dailygrand"
 
 def find_all_years() -> list[int]:
     """Return all Daily grand years"""
-    return get_years_by_name(_GAME_NAME)
+    return game_years_registry.get_years(_GAME_NAME)
 
 def find_daily_grand_results_by_year(year: int) -> list[Result]:
     """Return all daily grand results by year"""
@@ -30,6 +31,11 @@ def find_daily_grand_results_by_year(year: int) -> list[Result]:
 
     return build_daily_grand_results(result)
 
+def find_daily_grand_results_by_year_json(year: int) -> CachedResponse:
+    """Return all daily grand results by year as the serialized response"""
+    game_years_registry.validate_year(_GAME_NAME, year)
+    return response_cache.get_or_build((_GAME_NAME, "years", year), lambda: get_year_payload(_GAME_NAME, year) or to_json(list[Result], find_daily_grand_results_by_year(year)))
+
 def find_daily_grand_result_by_date(date: datetime.date) -> PrizeBreakdown:
     """Return the daily grand result within a specific date"""
     result: Final[DailyGrandResults] = get_daily_grand_numbers_by_date(date)
@@ -39,26 +45,14 @@ def find_daily_grand_result_by_date(date: datetime.date) -> PrizeBreakdown:
     
     return build_daily_grand_prize_breakdown(result)
 
-def insert_new_daily_grand_result(date: datetime.date) -> None:
-    """Insert new daily grand result"""
-    try:
-        if get_daily_grand_numbers_by_date(date) is not None:
-            email_sender.notify("ERROR Daily Grand", f"The numbers for the date {date.strftime('%Y-%m-%d')} already exist")
-            return
-
-        response_data: Response = fetch_daily_grand_result(date)
-        external_number_result: Final[Result] = extract_daily_grand_result(date, response_data)
-        external_prize_breakdown: Final[PrizeBreakdown] = extract_daily_grand_prize_breakdown(response_data)
-        
-        year: Final[int] = date.year
+def find_daily_grand_result_by_date_json(date: datetime.date) -> CachedResponse:
+    """Return the daily grand result within a specific date as the serialized response"""
+    return response_cache.get_or_build((_GAME_NAME, "results", date), lambda: get_draw_payload(_GAME_NAME, RESULTS_VARIANT, date) or to_json(PrizeBreakdown, find_daily_grand_result_by_date(date)))
 
-        if not is_year_exist_by_name(_GAME_NAME, year):
-            save_new_year_by_name(_GAME_NAME, year)
-            email_sender.notify("New Year added to Daily Grand", f"New year {year} was added to the database")
+def find_daily_grand_results_between(date_from: datetime.date, date_to: datetime.date, cursor: datetime.date | None, limit: int, results_format: ResultsFormat) -> StreamingResponse:
+    """Stream a page of the daily grand results of a date range"""
+    return build_draw_range_response(_GAME_NAME, RESULTS_VARIANT, date_from, date_to, cursor, limit, results_format)
 
-        new_result: Final[DailyGrandResults] = build_daily_grand_new_result(external_number_result, external_prize_breakdown)
-        save_daily_grand_result(new_result)
-        
-        email_sender.notify("New Daily Grand result added", build_daily_grand_body_email(new_result))
-    except Exception:
-        email_sender.notify("ERROR Daily Grand", f"An error occurred while trying to add a new result for the date {date.strftime('%Y-%m-%d')}. <br> Error: {traceback.format_exc().replace('\n', '<br>')}")
+def find_daily_grand_export(export_format: ExportFormat) -> FileResponse:
+    """Return the file of the full daily grand draw history"""
+    return build_export_response(_GAME_NAME, export_format)
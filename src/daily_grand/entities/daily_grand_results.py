@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Date, Float, Integer, JSON, ARRAY, UniqueConstraint
+from sqlalchemy import Column, Date, Float, Integer, ARRAY, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -10,10 +11,10 @@ class DailyGrandResults(Base):
   game_id: Column = Column(Integer, primary_key=True, nullable=False)
   numbers: Column = Column(ARRAY(Integer), nullable=False)
   grand_number: Column = Column(Integer, nullable=False)
-  bonuses_draw: Column = Column(JSON, nullable=True)
+  bonuses_draw: Column = Column(JSONB, nullable=True)
   prize: Column = Column(Float, nullable=False)
-  main_breakdown: Column = Column(JSON, nullable=False)
-  bonus_breakdown: Column = Column(JSON, nullable=False)
+  main_breakdown: Column = Column(JSONB, nullable=False)
+  bonus_breakdown: Column = Column(JSONB, nullable=False)
 
   __table_args__ = (
     UniqueConstraint("date", "game_id"),
@@ -1,18 +1,61 @@
 from contextlib import contextmanager
+from typing import Final, Iterator
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from src.config.configuration import configuration
 
 class Database:
-    def __init__(self, connection_string: str) -> None:
-        self.engine: Engine = create_engine(connection_string)
-        self.SessionLocal: Session = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+    def __init__(self, connection_string: str, pool_size: int, max_overflow: int, pool_pre_ping: bool, pool_recycle: int, pool_timeout: float) -> None:
+        self.engine: Engine = create_engine(
+            connection_string,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+            pool_timeout=pool_timeout
+        )
+        # the saved entities are still read after the commit to build the notifications
+        self.SessionLocal: Session = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine)
 
     @contextmanager
-    def get_db(self) -> Session:
+    def get_db(self, session: Session | None = None) -> Iterator[Session]:
+        """Open a session for the duration of a single call, the sessions are not shared between threads.
+
+        The session of a caller is reused instead, so the call reads within its transaction.
+        """
+        if session is not None:
+            yield session
+            return
+
+        session = self.SessionLocal()
         try:
-            yield self.SessionLocal()
+            yield session
         finally:
-            self.SessionLocal().close()
+            session.close()
+
+    @contextmanager
+    def unit_of_work(self, session: Session | None = None) -> Iterator[Session]:
+        """Open a session committed when the block succeeds and rolled back when it raises.
+
+        The session of a caller is joined instead, it is committed or rolled back by the unit of work of the caller.
+        """
+        if session is not None:
+            yield session
+            return
+
+        with self.get_db() as session:
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
 
-database = Database(configuration.database_connection_string)
\ No newline at end of file
+database = Database(
+    configuration.database_connection_string,
+    configuration.database_pool_size,
+    configuration.database_max_overflow,
+    configuration.database_pool_pre_ping,
+    configuration.database_pool_recycle,
+    configuration.database_pool_timeout
+)
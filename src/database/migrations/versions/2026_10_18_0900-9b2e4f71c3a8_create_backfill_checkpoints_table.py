@@ -0,0 +1,41 @@
+"""create backfill checkpoints table
+
+Revision ID: 9b2e4f71c3a8
+Revises: 6193c89488ba
+Create Date: 2026-10-18 09:00:12.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e4f71c3a8'
+down_revision: Union[str, None] = '6193c89488ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table("backfill_checkpoints",
+        sa.Column("game_id", sa.Integer, nullable=False, primary_key=True),
+        sa.Column("last_date", sa.Date, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
+    )
+    _seed_checkpoints()
+
+
+def _seed_checkpoints() -> None:
+    # the tables filled by the populate migration resume after their last saved draw instead of being scraped again
+    for table_name in ("lotto_max_draw_results", "daily_grand_draw_results", "six_fourty_nine_draw_results"):
+        op.execute(
+            f"INSERT INTO backfill_checkpoints (game_id, last_date) "
+            f"SELECT game_id, max(date) FROM {table_name} GROUP BY game_id "
+            f"ON CONFLICT (game_id) DO NOTHING"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("backfill_checkpoints")
@@ -0,0 +1,38 @@
+"""create payloads tables
+
+Revision ID: 4c8d1a6e52f9
+Revises: 9b2e4f71c3a8
+Create Date: 2026-10-18 12:00:41.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8d1a6e52f9'
+down_revision: Union[str, None] = '9b2e4f71c3a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table("draw_payloads",
+        sa.Column("game_id", sa.Integer, nullable=False, primary_key=True),
+        sa.Column("variant", sa.String, nullable=False, primary_key=True),
+        sa.Column("date", sa.Date, nullable=False, primary_key=True),
+        sa.Column("payload", sa.LargeBinary, nullable=False)
+    )
+
+    op.create_table("year_payloads",
+        sa.Column("game_id", sa.Integer, nullable=False, primary_key=True),
+        sa.Column("year", sa.Integer, nullable=False, primary_key=True),
+        sa.Column("payload", sa.LargeBinary, nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("year_payloads")
+    op.drop_table("draw_payloads")
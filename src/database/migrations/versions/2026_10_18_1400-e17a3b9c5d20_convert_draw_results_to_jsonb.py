@@ -0,0 +1,112 @@
+"""convert draw results to jsonb
+
+Revision ID: e17a3b9c5d20
+Revises: 4c8d1a6e52f9
+Create Date: 2026-10-18 14:00:27.554316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e17a3b9c5d20'
+down_revision: Union[str, None] = '4c8d1a6e52f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the columns of every table with whether they are nullable
+_JSON_COLUMNS: dict[str, dict[str, bool]] = {
+    "lotto_max_draw_results": {
+        "summary": False,
+        "numbers_matched": False,
+        "numbers_matched_atlantic": False,
+        "numbers_matched_british_columbia": False,
+        "numbers_matched_ontario": False,
+        "numbers_matched_quebec": False,
+        "numbers_matched_western_canada": False,
+    },
+    "daily_grand_draw_results": {
+        "bonuses_draw": True,
+        "main_breakdown": False,
+        "bonus_breakdown": False,
+    },
+    "six_fourty_nine_draw_results": {
+        "classic": False,
+        "guaranteed": True,
+        "gold_ball": True,
+        "summary": False,
+        "number_matched": False,
+    },
+}
+
+# the models were saved with model_dump_json, so the JSON columns hold JSON strings or arrays of JSON strings
+_DECODE_FUNCTION: str = """
+CREATE OR REPLACE FUNCTION pg_temp.decode_json(value jsonb) RETURNS jsonb LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE jsonb_typeof(value)
+        WHEN 'string' THEN (value #>> '{}')::jsonb
+        WHEN 'array' THEN coalesce(
+            (SELECT jsonb_agg(CASE jsonb_typeof(element) WHEN 'string' THEN (element #>> '{}')::jsonb ELSE element END ORDER BY position)
+             FROM jsonb_array_elements(value) WITH ORDINALITY AS elements(element, position)),
+            '[]'::jsonb)
+        ELSE value
+    END
+$$
+"""
+
+_ENCODE_FUNCTION: str = """
+CREATE FUNCTION pg_temp.encode_json(value jsonb) RETURNS json LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE jsonb_typeof(value)
+        WHEN 'object' THEN to_json(value::text)
+        WHEN 'array' THEN coalesce(
+            (SELECT json_agg(to_json(element::text) ORDER BY position)
+             FROM jsonb_array_elements(value) WITH ORDINALITY AS elements(element, position)),
+            '[]'::json)
+        ELSE value::json
+    END
+$$
+"""
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    # the temporary function lives as long as the connection, across the transactions of the batches
+    connection.execute(sa.text(_DECODE_FUNCTION))
+
+    for table, columns in _JSON_COLUMNS.items():
+        for column in columns:
+            op.add_column(table, sa.Column(f"{column}_jsonb", postgresql.JSONB, nullable=True))
+
+    # the rows are converted one year per transaction so the table is never locked for the whole conversion
+    with op.get_context().autocommit_block():
+        for table, columns in _JSON_COLUMNS.items():
+            assignments: str = ", ".join(f"{column}_jsonb = pg_temp.decode_json({column}::jsonb)" for column in columns)
+            years: list[int] = connection.execute(sa.text(f"SELECT DISTINCT extract(year FROM date)::int FROM {table} ORDER BY 1")).scalars().all()
+
+            for year in years:
+                connection.execute(
+                    sa.text(f"UPDATE {table} SET {assignments} WHERE date >= make_date(:year, 1, 1) AND date < make_date(:year + 1, 1, 1)"),
+                    {"year": year}
+                )
+
+    for table, columns in _JSON_COLUMNS.items():
+        # the draws inserted while the batches were running
+        pending: str = " OR ".join(f"({column}_jsonb IS NULL AND {column} IS NOT NULL)" for column in columns)
+        assignments: str = ", ".join(f"{column}_jsonb = pg_temp.decode_json({column}::jsonb)" for column in columns)
+        connection.execute(sa.text(f"UPDATE {table} SET {assignments} WHERE {pending}"))
+
+        for column, nullable in columns.items():
+            op.drop_column(table, column)
+            op.alter_column(table, f"{column}_jsonb", new_column_name=column, nullable=nullable)
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    connection.execute(sa.text(_ENCODE_FUNCTION))
+
+    for table, columns in _JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=sa.JSON, postgresql_using=f"pg_temp.encode_json({column})")
@@ -0,0 +1,26 @@
+"""index draw payloads by date
+
+Revision ID: 7f3e9d2b8a41
+Revises: e17a3b9c5d20
+Create Date: 2026-10-18 15:00:03.128864
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3e9d2b8a41'
+down_revision: Union[str, None] = 'e17a3b9c5d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # the primary key starts with (game_id, variant), so the year ranges of a game could not use it
+    op.create_index("ix_draw_payloads_game_id_date", "draw_payloads", ["game_id", "date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_draw_payloads_game_id_date", table_name="draw_payloads")
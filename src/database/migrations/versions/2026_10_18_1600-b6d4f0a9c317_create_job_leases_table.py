@@ -0,0 +1,30 @@
+"""create job leases table
+
+Revision ID: b6d4f0a9c317
+Revises: 7f3e9d2b8a41
+Create Date: 2026-10-18 16:00:27.093516
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d4f0a9c317'
+down_revision: Union[str, None] = '7f3e9d2b8a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table("job_leases",
+        sa.Column("job_name", sa.String, nullable=False, primary_key=True),
+        sa.Column("holder", sa.String, nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_leases")
@@ -0,0 +1,7 @@
+import datetime
+
+from sqlalchemy import Column, ColumnElement, and_
+
+def is_in_year(date_column: Column, year: int) -> ColumnElement[bool]:
+    """Return a half-open date range predicate of the year, which an index on the date column can serve unlike extract('year', ...)"""
+    return and_(date_column >= datetime.date(year, 1, 1), date_column < datetime.date(year + 1, 1, 1))
@@ -0,0 +1,42 @@
+import datetime
+from typing import Any, Final, NamedTuple
+
+from sqlalchemy import Boolean, Table, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+_ROWS_PER_STATEMENT: Final[int] = 500
+
+class UpsertResult(NamedTuple):
+    """Dates of the draws inserted, overwritten and skipped by a bulk upsert"""
+    inserted: list[datetime.date]
+    updated: list[datetime.date]
+    skipped: list[datetime.date]
+
+def upsert_draw_results(session: Session, table: Table, rows: list[dict], overwrite: bool = False) -> UpsertResult:
+    """Insert the draw rows with multi-row statements, the draws already saved are skipped or overwritten"""
+    inserted: Final[list[datetime.date]] = []
+    updated: Final[list[datetime.date]] = []
+
+    for start in range(0, len(rows), _ROWS_PER_STATEMENT):
+        statement = insert(table).values(rows[start:start + _ROWS_PER_STATEMENT])
+
+        if overwrite:
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.date, table.c.game_id],
+                set_={column.name: statement.excluded[column.name] for column in table.columns if not column.primary_key}
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=[table.c.date, table.c.game_id])
+
+        # xmax is only set on the rows overwritten by the conflict update
+        for date, is_inserted in session.execute(statement.returning(table.c.date, literal_column("xmax = 0", Boolean))):
+            (inserted if is_inserted else updated).append(date)
+
+    returned_dates: Final[set[datetime.date]] = {*inserted, *updated}
+
+    return UpsertResult(inserted, updated, [row["date"] for row in rows if row["date"] not in returned_dates])
+
+def to_row(entity: Any) -> dict:
+    """Convert an entity to the values of a bulk insert"""
+    return {column.name: getattr(entity, column.name) for column in entity.__table__.columns}
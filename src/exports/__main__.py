@@ -0,0 +1,18 @@
+"""Export the draw history of the games as Parquet and Arrow files: python -m src.exports"""
+from argparse import ArgumentParser
+
+from src.games.game_repository import get_years_by_name
+from .exports import EXPORT_GAMES, export_years, is_exported
+
+parser = ArgumentParser(prog="python -m src.exports", description="Write the draw history of the games as Parquet and Arrow IPC files partitioned by year")
+parser.add_argument("--games", nargs="+", choices=list(EXPORT_GAMES), default=list(EXPORT_GAMES), help="The games to export")
+parser.add_argument("--missing", action="store_true", help="Only export the games without export files")
+
+arguments = parser.parse_args()
+
+for game_name in arguments.games:
+    if arguments.missing and is_exported(game_name):
+        continue
+
+    export_years(game_name, sorted(get_years_by_name(game_name)))
+    print(f"Exported the {game_name} draw history")
@@ -0,0 +1,40 @@
+from enum import Enum
+from pathlib import Path
+from typing import Final
+
+from fastapi import HTTPException
+from fastapi.responses import FileResponse
+
+from src.config.configuration import configuration
+
+class ExportFormat(str, Enum):
+    """Enum of the file formats of the draw history exports"""
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+EXPORT_MEDIA_TYPES: Final[dict[ExportFormat, str]] = {
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.file",
+}
+
+def get_export_path(game_name: str, export_format: ExportFormat) -> Path:
+    """Return the path of the full draw history of a game"""
+    return Path(configuration.export_directory) / f"{game_name}.{export_format.value}"
+
+def get_partition_path(game_name: str, year: int) -> Path:
+    """Return the path of the draws of a year, the full history is concatenated from these partitions"""
+    return Path(configuration.export_directory) / game_name / f"year={year}.parquet"
+
+def build_export_response(game_name: str, export_format: ExportFormat) -> FileResponse:
+    """Serve the export file with its ETag and Last-Modified, it changes after every new draw like the current year"""
+    path: Final[Path] = get_export_path(game_name, export_format)
+
+    if not path.exists():
+        raise HTTPException(status_code=404, detail=f"The {export_format.value} export of {game_name} was not generated yet.")
+
+    return FileResponse(
+        path,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        filename=path.name,
+        headers={"Cache-Control": f"public, max-age={configuration.response_max_age_current_year}"}
+    )
@@ -0,0 +1,132 @@
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, Final, NamedTuple
+
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet
+
+from src.daily_grand.entities.daily_grand_results import DailyGrandResults
+from src.lottomax.entities.lotto_max_results import LottoMaxResults
+from src.payloads import payload_repository
+from src.six_fourty_nine.entities.six_fourty_nine_results import SixFourtyNineResults
+
+from .export_files import ExportFormat, get_export_path, get_partition_path
+
+_NUMBERS: Final[pyarrow.DataType] = pyarrow.list_(pyarrow.int8())
+
+class ExportGame(NamedTuple):
+    """Describe the columns of the draw history of a game"""
+    entity: Any
+    schema: pyarrow.Schema
+    build_record: Callable[[Any], dict]
+
+def export_years(game_name: str, years: list[int]) -> None:
+    """Rewrite the partitions of the years then the full history files of the game"""
+    for year in years:
+        _export_year(game_name, year)
+
+    _export_game(game_name)
+
+def is_exported(game_name: str) -> bool:
+    return all(get_export_path(game_name, export_format).exists() for export_format in ExportFormat)
+
+def _export_year(game_name: str, year: int) -> None:
+    game: Final[ExportGame] = EXPORT_GAMES[game_name]
+    rows: Final[list[Any]] = payload_repository.get_draw_rows_by_year(game.entity, year)
+    partition_path: Final[Path] = get_partition_path(game_name, year)
+
+    if not rows:
+        partition_path.unlink(missing_ok=True)
+        return
+
+    records: Final[list[dict]] = sorted(map(game.build_record, rows), key=lambda record: record["date"])
+    table: Final[pyarrow.Table] = pyarrow.Table.from_pylist(records, schema=game.schema)
+
+    _write_atomically(partition_path, lambda path: pyarrow.parquet.write_table(table, path))
+
+def _export_game(game_name: str) -> None:
+    """Concatenate the partitions of the game, the draw results tables are not read again"""
+    game: Final[ExportGame] = EXPORT_GAMES[game_name]
+    partition_paths: Final[list[Path]] = sorted(get_partition_path(game_name, 0).parent.glob("year=*.parquet"))
+    table: Final[pyarrow.Table] = pyarrow.concat_tables(
+        [pyarrow.parquet.read_table(path, schema=game.schema) for path in partition_paths] or [game.schema.empty_table()]
+    ).sort_by("date")
+
+    _write_atomically(get_export_path(game_name, ExportFormat.PARQUET), lambda path: pyarrow.parquet.write_table(table, path))
+    _write_atomically(get_export_path(game_name, ExportFormat.ARROW), lambda path: _write_arrow_file(table, path))
+
+def _write_arrow_file(table: pyarrow.Table, path: str) -> None:
+    with pyarrow.ipc.new_file(path, table.schema) as writer:
+        writer.write_table(table)
+
+def _write_atomically(path: Path, write: Callable[[str], None]) -> None:
+    """Write the file through a temporary file so the served file is never partial"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with NamedTemporaryFile(dir=path.parent, prefix=".tmp-", delete=False) as temporary_file:
+        pass
+
+    try:
+        write(temporary_file.name)
+        os.replace(temporary_file.name, path)
+    except Exception:
+        os.unlink(temporary_file.name)
+        raise
+
+def _build_lotto_max_record(row: LottoMaxResults) -> dict:
+    return {"date": row.date, "numbers": row.numbers, "bonus": row.bonus, "prize": row.prize}
+
+def _build_daily_grand_record(row: DailyGrandResults) -> dict:
+    return {"date": row.date, "numbers": row.numbers, "grand_number": row.grand_number, "prize": row.prize, "bonuses_draw": row.bonuses_draw or []}
+
+def _build_649_record(row: SixFourtyNineResults) -> dict:
+    return {
+        "date": row.date,
+        "numbers": row.classic["numbers"],
+        "bonus": row.classic["bonus"],
+        "prize": row.classic["prize"],
+        "guaranteed": row.guaranteed,
+        "gold_ball_number": row.gold_ball["number"] if row.gold_ball else None,
+        "gold_ball_prize": row.gold_ball["prize"] if row.gold_ball else None,
+        "is_gold_ball_drawn": row.gold_ball["is_gold_ball_drawn"] if row.gold_ball else None
+    }
+
+EXPORT_GAMES: Final[dict[str, ExportGame]] = {
+    "lottomax": ExportGame(
+        entity=LottoMaxResults,
+        schema=pyarrow.schema([
+            ("date", pyarrow.date32()),
+            ("numbers", _NUMBERS),
+            ("bonus", pyarrow.int8()),
+            ("prize", pyarrow.float64())
+        ]),
+        build_record=_build_lotto_max_record
+    ),
+    "dailygrand": ExportGame(
+        entity=DailyGrandResults,
+        schema=pyarrow.schema([
+            ("date", pyarrow.date32()),
+            ("numbers", _NUMBERS),
+            ("grand_number", pyarrow.int8()),
+            ("prize", pyarrow.float64()),
+            ("bonuses_draw", pyarrow.list_(pyarrow.struct([("numbers", _NUMBERS), ("prize", pyarrow.float64())])))
+        ]),
+        build_record=_build_daily_grand_record
+    ),
+    "sixfourtynine": ExportGame(
+        entity=SixFourtyNineResults,
+        schema=pyarrow.schema([
+            ("date", pyarrow.date32()),
+            ("numbers", _NUMBERS),
+            ("bonus", pyarrow.int8()),
+            ("prize", pyarrow.float64()),
+            ("guaranteed", pyarrow.list_(pyarrow.struct([("numbers", pyarrow.list_(pyarrow.string())), ("prize", pyarrow.float64())]))),
+            ("gold_ball_number", pyarrow.string()),
+            ("gold_ball_prize", pyarrow.float64()),
+            ("is_gold_ball_drawn", pyarrow.bool_())
+        ]),
+        build_record=_build_649_record
+    ),
+}
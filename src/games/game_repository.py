@@ -1,18 +1,26 @@
+from sqlalchemy.orm import Session
 from src.database.database import database
 from .entities.games import Games
 
-with database.get_db() as _database:
-    def get_years_by_name(name: str) -> list[int]:
+def get_years_by_name(name: str, session: Session | None = None) -> list[int]:
+    with database.get_db(session) as _database:
         return _database.query(Games).filter(Games.name == name).first().years
 
-    def get_all_lotto_games() -> list[str]:
+def get_all_lotto_games() -> list[str]:
+    with database.get_db() as _database:
         return _database.query(Games).all().name
-    
-    def is_year_exist_by_name(name: str, year: int) -> bool:
-        return year in get_years_by_name(name)
-    
-    def save_new_year_by_name(name: str, year: int) -> None:
-        game: Games = _database.query(Games).filter(Games.name == name).first()
-        game.years.insert(0, year)
-        _database.commit()
-        _database.refresh(game)
\ No newline at end of file
+
+def get_all_years() -> dict[str, list[int]]:
+    with database.get_db() as _database:
+        return {game.name: game.years for game in _database.query(Games.name, Games.years).all()}
+
+def is_year_exist_by_name(name: str, year: int, session: Session | None = None) -> bool:
+    return year in get_years_by_name(name, session)
+
+def save_new_year_by_name(name: str, year: int, session: Session | None = None) -> None:
+    with database.unit_of_work(session) as _database:
+        # the row is locked until the commit, so the backfill and the ingestion do not overwrite the years of each other
+        game: Games = _database.query(Games).filter(Games.name == name).with_for_update().first()
+        if year not in game.years:
+            # a new list is assigned because the in-place changes of an ARRAY column are not tracked
+            game.years = [year, *game.years]
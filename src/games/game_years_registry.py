@@ -0,0 +1,64 @@
+import time
+from threading import Lock
+from typing import Final
+
+from fastapi import HTTPException
+
+from src.config.configuration import configuration
+from .game_repository import get_all_years, get_years_by_name
+
+_MISS_REFRESH_INTERVAL: Final[float] = 60.0
+
+class GameYearsRegistry:
+    """In-memory years of every game, loaded at startup and refreshed when the ingestion adds a year.
+
+    With a refresh interval, the years older than it are reloaded, so the years added by another process are listed.
+    """
+    def __init__(self, refresh_interval: float | None = None) -> None:
+        self.refresh_interval = refresh_interval
+        self._years: dict[str, list[int]] = {}
+        self._refreshed_at: dict[str, float] = {}
+        self._lock: Lock = Lock()
+
+    def load(self) -> None:
+        """Load the years of every game"""
+        years: Final[dict[str, list[int]]] = get_all_years()
+
+        with self._lock:
+            self._years = years
+            self._refreshed_at = {name: time.monotonic() for name in years}
+
+    def refresh(self, name: str) -> None:
+        """Reload the years of a game"""
+        years: Final[list[int]] = get_years_by_name(name)
+
+        with self._lock:
+            self._years[name] = years
+            self._refreshed_at[name] = time.monotonic()
+
+    def get_years(self, name: str) -> list[int]:
+        """Return the years of a game, loading them when the registry was not loaded yet or they are older than the refresh interval"""
+        if name not in self._years or self._is_expired(name):
+            self.refresh(name)
+
+        return self._years[name]
+
+    def validate_year(self, name: str, year: int) -> None:
+        """Raise a 400 when the year was not played, the years are reloaded at most once a minute on a miss"""
+        if year in self.get_years(name):
+            return
+
+        if time.monotonic() - self._refreshed_at.get(name, 0.0) >= _MISS_REFRESH_INTERVAL:
+            self.refresh(name)
+
+            if year in self._years[name]:
+                return
+
+        years: Final[list[int]] = self._years[name]
+        raise HTTPException(status_code=400, detail=f"The year {year} is not available. The years go from {min(years)} to {max(years)}.")
+
+    def _is_expired(self, name: str) -> bool:
+        return self.refresh_interval is not None and time.monotonic() - self._refreshed_at.get(name, 0.0) >= self.refresh_interval
+
+# without the scheduler, the years are added by another process which cannot refresh the registry of this one
+game_years_registry: GameYearsRegistry = GameYearsRegistry(None if configuration.run_scheduler else configuration.response_max_age_current_year)
@@ -0,0 +1,91 @@
+import asyncio
+import random
+from typing import Final
+
+from httpx import AsyncClient, Limits, Request, Response, Timeout, TransportError
+
+from src.config.configuration import configuration
+from .disk_cache import CacheEntry, DiskCache
+from .http_client import RETRY_STATUS_CODES, get_conditional_headers, http_client
+
+class AsyncHttpClient:
+    """Asyncio counterpart of the HttpClient used by the ingestion to fetch the draws concurrently.
+
+    It shares the disk cache of the HttpClient, so both clients serve and revalidate the same documents.
+    """
+    def __init__(self, connect_timeout: float, read_timeout: float, retries: int, backoff_factor: float, backoff_jitter: float, max_connections: int, cache: DiskCache) -> None:
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.backoff_jitter = backoff_jitter
+        self.cache = cache
+        self.client: AsyncClient = AsyncClient(
+            timeout=Timeout(read_timeout, connect=connect_timeout),
+            limits=Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            follow_redirects=True
+        )
+
+    async def get(self, url: str, max_age: int | None = None) -> Response:
+        """Send a GET request, serving the cached document while it is fresh and revalidating it otherwise.
+
+        The disk cache is read and written in worker threads, so its file I/O does not block the event loop.
+        """
+        entry: Final[CacheEntry | None] = await asyncio.to_thread(self.cache.get, url)
+
+        if entry is not None and self.cache.is_fresh(entry, max_age):
+            cached_response: Response | None = await asyncio.to_thread(self._to_response, entry)
+
+            if cached_response is not None:
+                return cached_response
+
+        response: Response = await self._get_with_retries(url, get_conditional_headers(entry))
+
+        if response.status_code == 304 and entry is not None:
+            cached_response = await asyncio.to_thread(self._to_response, entry)
+
+            if cached_response is not None:
+                await asyncio.to_thread(self.cache.touch, entry)
+                return cached_response
+
+            # the document was evicted while it was revalidated, so it is downloaded again
+            response = await self._get_with_retries(url, {})
+
+        if response.status_code == 200:
+            await asyncio.to_thread(self.cache.put, url, response)
+
+        return response
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    async def _get_with_retries(self, url: str, headers: dict[str, str]) -> Response:
+        for attempt in range(self.retries + 1):
+            is_last_attempt: bool = attempt == self.retries
+
+            try:
+                response: Response = await self.client.get(url, headers=headers)
+            except TransportError:
+                if is_last_attempt:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or is_last_attempt:
+                    return response
+
+            await asyncio.sleep(self.backoff_factor * 2 ** attempt + random.uniform(0, self.backoff_jitter))
+
+    def _to_response(self, entry: CacheEntry) -> Response | None:
+        content: Final[bytes | None] = self.cache.get_content(entry)
+
+        if content is None:
+            return None
+
+        return Response(200, headers=entry.headers, content=content, request=Request("GET", entry.url))
+
+async_http_client: AsyncHttpClient = AsyncHttpClient(
+    configuration.http_connect_timeout,
+    configuration.http_read_timeout,
+    configuration.http_retries,
+    configuration.http_backoff_factor,
+    configuration.http_backoff_jitter,
+    configuration.http_pool_maxsize,
+    http_client.cache
+)
@@ -0,0 +1,175 @@
+import json
+import os
+import time
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Final, NamedTuple
+
+from httpx import Response as HttpxResponse
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+_CACHED_HEADERS: Final[list[str]] = ["Content-Type", "ETag", "Last-Modified"]
+_TEMPORARY_PREFIX: Final[str] = ".tmp-"
+# the eviction frees some room below the maximum size so the next puts do not scan the cache again
+_EVICTION_TARGET_RATIO: Final[float] = 0.9
+
+class CacheEntry(NamedTuple):
+    """Metadata of a cached response"""
+    url: str
+    content_hash: str
+    headers: dict[str, str]
+    encoding: str | None
+    stored_at: float
+
+class DiskCache:
+    """Content-addressed cache of the downloaded documents with TTL and size-based LRU eviction.
+
+    The entries are keyed by url and point to a blob named after the sha256 of its content,
+    so identical documents served by several urls are stored once. The total size of the blobs
+    is scanned once and then tracked by the puts, the entries are only listed when it goes above
+    the maximum size, which also recounts the blobs written by the other processes sharing the directory.
+    """
+    def __init__(self, directory: str, ttl: int, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries_directory: Path = Path(directory) / "entries"
+        self._objects_directory: Path = Path(directory) / "objects"
+        self._lock: Lock = Lock()
+        self._total_size: int | None = None
+
+        self._entries_directory.mkdir(parents=True, exist_ok=True)
+        self._objects_directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the entry of the url and mark it as recently used"""
+        entry_path: Final[Path] = self._get_entry_path(url)
+
+        try:
+            entry: Final[CacheEntry] = CacheEntry(**json.loads(entry_path.read_text()))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            return None
+
+        if not self._get_object_path(entry.content_hash).exists():
+            return None
+
+        os.utime(entry_path)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry, max_age: int | None = None) -> bool:
+        """Return whether the entry can be served without revalidation"""
+        return time.time() - entry.stored_at < (self.ttl if max_age is None else max_age)
+
+    def get_content(self, entry: CacheEntry) -> bytes | None:
+        """Return the document of a cached entry, None when it was evicted since the entry was read"""
+        try:
+            return self._get_object_path(entry.content_hash).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def to_response(self, entry: CacheEntry) -> Response | None:
+        """Rebuild the response of a cached entry, None when its document was evicted"""
+        content: Final[bytes | None] = self.get_content(entry)
+
+        if content is None:
+            return None
+
+        response: Final[Response] = Response()
+        response.status_code = 200
+        response.url = entry.url
+        response.encoding = entry.encoding
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = content
+
+        return response
+
+    def put(self, url: str, response: Response | HttpxResponse) -> None:
+        """Store a successful response and evict the least recently used entries above the maximum size"""
+        content_hash: Final[str] = sha256(response.content).hexdigest()
+        object_path: Final[Path] = self._get_object_path(content_hash)
+
+        entry: Final[CacheEntry] = CacheEntry(
+            url=url,
+            content_hash=content_hash,
+            headers={header: response.headers[header] for header in _CACHED_HEADERS if header in response.headers},
+            encoding=response.encoding,
+            stored_at=time.time()
+        )
+
+        # the blobs are content-addressed and written atomically, so the threads only wait on each other to count and evict
+        is_new_object: Final[bool] = not object_path.exists()
+
+        if is_new_object:
+            _write_atomically(object_path, response.content)
+
+        _write_atomically(self._get_entry_path(url), json.dumps(entry._asdict()).encode())
+
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = self._get_objects_size()
+            elif is_new_object:
+                self._total_size += len(response.content)
+
+            if self._total_size > self.max_size:
+                self._evict()
+
+    def touch(self, entry: CacheEntry) -> None:
+        """Restart the TTL of an entry revalidated by the server"""
+        with self._lock:
+            _write_atomically(self._get_entry_path(entry.url), json.dumps(entry._replace(stored_at=time.time())._asdict()).encode())
+
+    def _evict(self) -> None:
+        entries: Final[list[tuple[Path, str]]] = []
+
+        for entry_path in sorted(self._entries_directory.glob("*.json"), key=lambda path: path.stat().st_mtime):
+            try:
+                entries.append((entry_path, json.loads(entry_path.read_text())["content_hash"]))
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                entry_path.unlink(missing_ok=True)
+
+        object_sizes: Final[dict[str, int]] = {
+            path.name: path.stat().st_size
+            for path in self._objects_directory.iterdir()
+            if not path.name.startswith(_TEMPORARY_PREFIX)
+        }
+        referenced_hashes: Final[set[str]] = {content_hash for _, content_hash in entries}
+
+        for content_hash in list(object_sizes):
+            if content_hash not in referenced_hashes:
+                self._get_object_path(content_hash).unlink(missing_ok=True)
+                object_sizes.pop(content_hash)
+
+        total_size: int = sum(object_sizes.values())
+        target_size: Final[int] = int(self.max_size * _EVICTION_TARGET_RATIO)
+
+        while entries and total_size > target_size:
+            entry_path, content_hash = entries.pop(0)
+            entry_path.unlink(missing_ok=True)
+
+            if all(other_hash != content_hash for _, other_hash in entries):
+                self._get_object_path(content_hash).unlink(missing_ok=True)
+                total_size -= object_sizes.pop(content_hash, 0)
+
+        self._total_size = total_size
+
+    def _get_objects_size(self) -> int:
+        return sum(
+            path.stat().st_size
+            for path in self._objects_directory.iterdir()
+            if not path.name.startswith(_TEMPORARY_PREFIX)
+        )
+
+    def _get_entry_path(self, url: str) -> Path:
+        return self._entries_directory / f"{sha256(url.encode()).hexdigest()}.json"
+
+    def _get_object_path(self, content_hash: str) -> Path:
+        return self._objects_directory / content_hash
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """Write the file through a temporary file so readers never see a partial document"""
+    with NamedTemporaryFile(dir=path.parent, prefix=_TEMPORARY_PREFIX, delete=False) as temporary_file:
+        temporary_file.write(content)
+
+    os.replace(temporary_file.name, path)
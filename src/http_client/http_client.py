@@ -0,0 +1,87 @@
+from typing import Final
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config.configuration import configuration
+from .disk_cache import CacheEntry, DiskCache
+
+RETRY_STATUS_CODES: Final[list[int]] = [429, 500, 502, 503, 504]
+_HOST_POOLS: Final[int] = 10
+
+class HttpClient:
+    """Shared HTTP client of the scrapers with keep-alive connections, retries, conditional GETs and a disk cache"""
+    def __init__(self, connect_timeout: float, read_timeout: float, retries: int, backoff_factor: float, backoff_jitter: float, pool_maxsize: int, cache: DiskCache) -> None:
+        self.timeout: tuple[float, float] = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.session: Session = Session()
+
+        retry: Final[Retry] = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter: Final[HTTPAdapter] = HTTPAdapter(pool_connections=_HOST_POOLS, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, max_age: int | None = None) -> Response:
+        """Send a GET request, serving the cached document while it is fresh and revalidating it otherwise.
+
+        The max_age in seconds overrides the TTL of the cache, 0 always revalidates the document.
+        """
+        entry: Final[CacheEntry | None] = self.cache.get(url)
+
+        if entry is not None and self.cache.is_fresh(entry, max_age):
+            cached_response: Response | None = self.cache.to_response(entry)
+
+            if cached_response is not None:
+                return cached_response
+
+        response: Response = self.session.get(url, headers=get_conditional_headers(entry), timeout=self.timeout)
+
+        if response.status_code == 304 and entry is not None:
+            cached_response = self.cache.to_response(entry)
+
+            if cached_response is not None:
+                self.cache.touch(entry)
+                return cached_response
+
+            # the document was evicted while it was revalidated, so it is downloaded again
+            response = self.session.get(url, timeout=self.timeout)
+
+        if response.status_code == 200:
+            self.cache.put(url, response)
+
+        return response
+
+def get_conditional_headers(entry: CacheEntry | None) -> dict[str, str]:
+    """Return the If-None-Match and If-Modified-Since headers of a cached document"""
+    headers: Final[dict[str, str]] = {}
+
+    if entry is None:
+        return headers
+
+    if "ETag" in entry.headers:
+        headers["If-None-Match"] = entry.headers["ETag"]
+
+    if "Last-Modified" in entry.headers:
+        headers["If-Modified-Since"] = entry.headers["Last-Modified"]
+
+    return headers
+
+http_client: HttpClient = HttpClient(
+    configuration.http_connect_timeout,
+    configuration.http_read_timeout,
+    configuration.http_retries,
+    configuration.http_backoff_factor,
+    configuration.http_backoff_jitter,
+    configuration.http_pool_maxsize,
+    DiskCache(configuration.http_cache_directory, configuration.http_cache_ttl, configuration.http_cache_max_size)
+)
@@ -0,0 +1,18 @@
+from threading import Lock
+from time import monotonic, sleep
+
+class RateLimiter:
+    """Space the calls shared by several threads to at most rate calls per second"""
+    def __init__(self, rate: float) -> None:
+        self.interval: float = 1 / rate
+        self._next_call: float = monotonic()
+        self._lock: Lock = Lock()
+
+    def wait(self) -> None:
+        """Block until the next call is allowed"""
+        with self._lock:
+            now: float = monotonic()
+            call_at: float = max(self._next_call, now)
+            self._next_call = call_at + self.interval
+
+        sleep(call_at - now)
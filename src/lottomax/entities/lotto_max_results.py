@@ -1,4 +1,5 @@
-from sqlalchemy import ARRAY, Column, Date, Float, Integer, JSON, UniqueConstraint
+from sqlalchemy import ARRAY, Column, Date, Float, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -11,13 +12,13 @@ class LottoMaxResults(Base):
   numbers: Column = Column(ARRAY(Integer), nullable=False)
   bonus: Column = Column(Integer, nullable=False)
   prize: Column = Column(Float, nullable=False)
-  summary: Column = Column(JSON, nullable=False)
-  numbers_matched: Column = Column(JSON, nullable=False)
-  numbers_matched_atlantic: Column = Column(JSON, nullable=False)
-  numbers_matched_british_columbia: Column = Column(JSON, nullable=False)
-  numbers_matched_ontario: Column = Column(JSON, nullable=False)
-  numbers_matched_quebec: Column = Column(JSON, nullable=False)
-  numbers_matched_western_canada: Column = Column(JSON, nullable=False)
+  summary: Column = Column(JSONB, nullable=False)
+  numbers_matched: Column = Column(JSONB, nullable=False)
+  numbers_matched_atlantic: Column = Column(JSONB, nullable=False)
+  numbers_matched_british_columbia: Column = Column(JSONB, nullable=False)
+  numbers_matched_ontario: Column = Column(JSONB, nullable=False)
+  numbers_matched_quebec: Column = Column(JSONB, nullable=False)
+  numbers_matched_western_canada: Column = Column(JSONB, nullable=False)
 
   __table_args__ = (
     UniqueConstraint("date", "game_id"),
@@ -1,8 +1,17 @@
-from requests import get, Response
-from datetime import date, datetime
-from typing import Final
+import asyncio
+import time
+from httpx import Response as HttpxResponse
+from requests import Response
+from datetime import date, datetime, timedelta
+from threading import Lock
+from typing import Callable, Collection, Final, Iterable, Iterator, NamedTuple
 from bs4 import BeautifulSoup, ResultSet
 
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    lxml_html = None
+
 from .models.region import Region
 from .models.prize_breakdown import PrizeBreakdown
 from .models.summary import Summary
@@ -10,8 +19,29 @@ from .models.location import Location
 from .models.numbers import Numbers
 
 from src.common.models.numbers_matched import NumbersMatched
+from src.config.configuration import configuration
+from src.http_client.async_http_client import async_http_client
+from src.http_client.http_client import http_client
 
 _LOTTOMAX_BASE_URL: Final[str] = "https://www.lottomaxnumbers.com"
+# the ingestion fetches the draws missing from the database, their pages are revalidated so a retry sees the draws published since the last fetch
+_MISSING_DRAW_MAX_AGE: Final[int] = 0
+
+class _YearRow(NamedTuple):
+    """Texts of a draw row of a year page"""
+    date: str
+    jackpot: str
+    balls: list[str]
+    bonus: str
+
+class _YearIndex(NamedTuple):
+    """Numbers of a year page with the set of its draw dates"""
+    numbers: list[Numbers]
+    dates: frozenset[date]
+    loaded_at: float
+
+_year_indexes: Final[dict[int, _YearIndex]] = {}
+_year_indexes_lock: Final[Lock] = Lock()
 
 def extract_all_years() -> list[int]:
     """Return all lotto max years played"""
@@ -19,23 +49,76 @@ def extract_all_years() -> list[int]:
 
 def extract_lotto_numbers_by_year(year: int) -> list[Numbers]:
     """Return result by selected years"""
+    return _get_year_index(year).numbers
 
-    results: ResultSet = _get_table_result_by_year(year)
+async def extract_lotto_numbers_by_year_async(year: int, dates: Collection[date] = ()) -> list[Numbers]:
+    """Return result by selected years without blocking the event loop.
 
-    if not results:
-        raise Exception(f"The year {year} is not found in the external data")
+    A memoized page missing one of the dates can predate its draw, so it is reloaded once like in _get_result_page_by_date.
+    """
+    year_index: Final[_YearIndex | None] = _get_memoized_year_index(year)
 
-    return list(map(lambda row: Numbers(
-            date=_format_date(row.a.text), 
-            prize=row.find(class_="jackpot").text[1:].replace(",", ""), 
-            numbers=_get_numbers(row.find_all(class_="ball")),
-            bonus=row.find(class_="bonus-ball").text
-        ), results))
-
-def extract_lotto_result(date: datetime.date) -> PrizeBreakdown:
-    """return the lottomax result within a specific date"""
+    if year_index is not None and year_index.dates.issuperset(dates):
+        return year_index.numbers
+
+    year_page: Final[HttpxResponse] = await async_http_client.get(_get_year_page_url(year), _get_year_page_max_age(year, reload=year_index is not None))
+
+    if year_page.status_code != 200:
+        raise Exception(f"The year {year} is not found in the external data. \n message: {year_page.text}")
+
+    year_numbers: Final[list[Numbers]] = await asyncio.to_thread(_parse_year_page, year, year_page.text)
+
+    return _save_year_index(year, year_numbers).numbers
+
+def extract_lotto_result_with_regions(date: datetime.date) -> tuple[PrizeBreakdown, dict[Region, list[NumbersMatched]]]:
+    """Return the lottomax result and the results of every region from a single fetch of the result page"""
     html_content = _get_result_page_by_date(date)
 
+    return _get_result_with_regions(html_content)
+
+async def extract_lotto_result_with_regions_async(date: datetime.date) -> tuple[PrizeBreakdown, dict[Region, list[NumbersMatched]]]:
+    """Return the lottomax result and the results of every region without blocking the event loop.
+
+    The date is not checked against the year page, the caller already fetched it with extract_lotto_numbers_by_year_async.
+    """
+    result_page: Final[HttpxResponse] = await async_http_client.get(_get_result_page_url(date), _MISSING_DRAW_MAX_AGE)
+
+    if result_page.status_code != 200:
+        raise Exception(f"The date {date} is not found in the external data \n message: {result_page.text}")
+
+    return await asyncio.to_thread(_parse_result_page, result_page.text)
+
+def _parse_year_page(year: int, year_page: str) -> list[Numbers]:
+    """Return the numbers of a year page, run in a worker thread by the async extractor"""
+    return _build_numbers(year, _get_year_rows(year_page))
+
+def _parse_result_page(result_page: str) -> tuple[PrizeBreakdown, dict[Region, list[NumbersMatched]]]:
+    """Return the result and the results of every region of a result page, run in a worker thread by the async extractor"""
+    return _get_result_with_regions(BeautifulSoup(result_page, "html.parser"))
+
+def _build_numbers(year: int, rows: list[_YearRow]) -> list[Numbers]:
+    """Return the numbers of the rows of a year page"""
+    if not rows:
+        raise Exception(f"The year {year} is not found in the external data")
+
+    return list(map(lambda row: Numbers(
+            date=_format_date(row.date),
+            prize=row.jackpot[1:].replace(",", ""),
+            numbers=_get_numbers(row.balls),
+            bonus=row.bonus
+        ), rows))
+
+def _get_result_with_regions(html_content: BeautifulSoup) -> tuple[PrizeBreakdown, dict[Region, list[NumbersMatched]]]:
+    """Return the national prize breakdown and the numbers matched of every region of a result page"""
+    regions: Final[dict[Region, list[NumbersMatched]]] = {
+        region: _get_region_numbers_matched(html_content, region)
+        for region in Region
+    }
+
+    return _get_prize_breakdown(html_content), regions
+
+def _get_prize_breakdown(html_content: BeautifulSoup) -> PrizeBreakdown:
+    """Return the national prize breakdown of a result page"""
     div_summary: Final[list[ResultSet]] = [
         div.find(class_="contentBox")
         for div in html_content.find(class_="prizeStatsBox").find_all(class_="box")
@@ -52,13 +135,9 @@ def extract_lotto_result(date: datetime.date) -> PrizeBreakdown:
 
     return PrizeBreakdown(summary=summary, numbers_matched=numbers_matched)
 
-def extract_lotto_result_by_date_and_region(
-    date: datetime.date,
-    region: Region) -> list[NumbersMatched]:
-    """Return the lotto result from specific date and region"""
-
+def _get_region_numbers_matched(html_content: BeautifulSoup, region: Region) -> list[NumbersMatched]:
+    """Return the numbers matched of a region from a result page"""
     region_class: Final[str] = _get_class_by_region(region)
-    html_content = _get_result_page_by_date(date)
 
     table_content: Final[list[ResultSet]] = html_content.find(
         class_=region_class).tbody.find_all("tr")
@@ -69,23 +148,20 @@ def _get_result_page_by_date(date: datetime.date) -> ResultSet:
     """Return the result website within a specific date"""
     year: Final[int] = date.year
 
-    results: ResultSet = _get_table_result_by_year(year)
-
-    date_results: Final[list[date]] = list(map(
-        lambda row: _format_date(row.a.text),
-        results
-        ))
-
-    if date not in date_results:
+    # a memoized page can predate the draw, so it is reloaded once before the date is rejected
+    if date not in _get_year_index(year).dates and date not in _get_year_index(year, reload=True).dates:
       raise Exception(f"The date {date} is not found in the external data")
 
-    result_page: Response = get(f"{_LOTTOMAX_BASE_URL}/numbers/lotto-max-result-{date.strftime('%m-%d-%Y')}")
+    result_page: Response = http_client.get(_get_result_page_url(date))
     
     if result_page.status_code != 200:
         raise Exception(f"The date {date} is not found in the external data \n message: {result_page.text}")
     
     return BeautifulSoup(result_page.text, "html.parser")
 
+def _get_result_page_url(date: datetime.date) -> str:
+    return f"{_LOTTOMAX_BASE_URL}/numbers/lotto-max-result-{date.strftime('%m-%d-%Y')}"
+
 def _get_class_by_region(region: Region) -> str:
     if region not in Region:
         raise Exception(f"The region {region} is invalid")
@@ -195,25 +271,103 @@ def _get_stats_summary(summary_contents: list[ResultSet], total_prize_fund: floa
         sales_difference_previous_draw=sales_difference
     )
 
-def _get_table_result_by_year(year: int) -> ResultSet:
-    year_page: Response = get(f"{_LOTTOMAX_BASE_URL}/numbers/{year}")
+def _get_table_result_by_year(year: int, reload: bool = False) -> list[_YearRow]:
+    year_page: Response = http_client.get(_get_year_page_url(year), _get_year_page_max_age(year, reload))
 
     if year_page.status_code != 200:
         raise Exception(f"The year {year} is not found in the external data. \n message: {year_page.text}")
 
-    html_content = BeautifulSoup(year_page.text, "html.parser")
+    return _get_year_rows(year_page.text)
+
+def _get_year_index(year: int, reload: bool = False) -> _YearIndex:
+    """Return the memoized index of a year page, loading it on a miss or when reloaded"""
+    year_index: Final[_YearIndex | None] = None if reload else _get_memoized_year_index(year)
+
+    if year_index is not None:
+        return year_index
+
+    return _save_year_index(year, _build_numbers(year, _get_table_result_by_year(year, reload)))
+
+def _get_memoized_year_index(year: int) -> _YearIndex | None:
+    """Return the index of a year page, a page loaded before the year was closed expires after the year page TTL"""
+    with _year_indexes_lock:
+        year_index: Final[_YearIndex | None] = _year_indexes.get(year)
+
+    if year_index is None:
+        return None
+
+    if not _is_year_closed(year, year_index.loaded_at) and time.time() - year_index.loaded_at >= configuration.year_page_ttl:
+        return None
+
+    return year_index
+
+def _save_year_index(year: int, numbers: list[Numbers]) -> _YearIndex:
+    year_index: Final[_YearIndex] = _YearIndex(numbers, frozenset(number.date for number in numbers), time.time())
+
+    with _year_indexes_lock:
+        _year_indexes[year] = year_index
+
+    return year_index
+
+def _get_year_page_url(year: int) -> str:
+    return f"{_LOTTOMAX_BASE_URL}/numbers/{year}"
+
+def _get_year_page_max_age(year: int, reload: bool = False) -> int | None:
+    # the page of a year still open grows after every draw and a reloaded page missed a draw, so they are always revalidated
+    return 0 if reload or not _is_year_closed(year, time.time()) else None
+
+def _is_year_closed(year: int, timestamp: float) -> bool:
+    """Return whether the draws of the year were all published at the timestamp, the catch-up can still look for the last draws of the year until then"""
+    closed_at: Final[datetime] = datetime(year + 1, 1, 1) + timedelta(days=configuration.catch_up_days)
+
+    return timestamp >= closed_at.timestamp()
+
+def _get_year_rows(year_page: str) -> list[_YearRow]:
+    """Return the draw rows of a year page, parsed with lxml when it is installed and html.parser otherwise"""
+    if lxml_html is not None:
+        rows: Iterable[Iterator[tuple[str, list[str], Callable[[], str]]]] = (
+            ((element.tag, element.get("class", "").split(), element.text_content) for element in row.iterdescendants(etree.Element))
+            for row in lxml_html.fromstring(year_page).iter("tr")
+        )
+    else:
+        rows = (
+            ((element.name, element.get("class", []), element.get_text) for element in row.find_all(True))
+            for row in BeautifulSoup(year_page, "html.parser").find_all("tr")
+        )
+
+    return [year_row for year_row in map(_get_year_row, rows) if year_row is not None]
+
+def _get_year_row(elements: Iterator[tuple[str, list[str], Callable[[], str]]]) -> _YearRow | None:
+    """Read the date, the jackpot, the balls and the bonus of a row in one traversal, None when the row is not a draw"""
+    has_balls: bool = False
+    date_text: str | None = None
+    jackpot: str | None = None
+    balls: Final[list[str]] = []
+    bonus: str | None = None
+
+    for name, classes, get_text in elements:
+        if name == "ul" and "balls" in classes:
+            has_balls = True
+        elif name == "a" and date_text is None:
+            date_text = get_text()
+
+        if "jackpot" in classes and jackpot is None:
+            jackpot = get_text()
+
+        if "ball" in classes:
+            balls.append(get_text())
 
-    result_rows: ResultSet = html_content.find_all("tr")
+        if "bonus-ball" in classes and bonus is None:
+            bonus = get_text()
 
-    for i, row in enumerate(result_rows):
-        if not row.find("ul", class_="balls"):
-            result_rows.pop(i)
+    if not has_balls:
+        return None
 
-    return result_rows
+    return _YearRow(date=date_text, jackpot=jackpot, balls=balls, bonus=bonus)
 
 def _get_lottomax_years() -> list[int]:
     """Return all lotto max years"""
-    year_past_page: Response = get(
+    year_past_page: Response = http_client.get(
         f"{_LOTTOMAX_BASE_URL}/past-numbers").text
     html_content = BeautifulSoup(year_past_page, "html.parser")
 
@@ -226,6 +380,6 @@ def _format_date(date_value: str) -> date:
     """Map the date to MM-DD-YYYY"""
     return datetime.strptime(date_value, "%B %d %Y").date()
 
-def _get_numbers(li_tags) -> list[int]:
-    """Extract the number results with the li tags"""
-    return list(map(lambda li: int(li.text), li_tags))
+def _get_numbers(balls: list[str]) -> list[int]:
+    """Extract the number results from the texts of the balls"""
+    return list(map(int, balls))
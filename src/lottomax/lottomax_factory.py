@@ -1,4 +1,4 @@
-from json import loads, dumps
+from json import dumps
 from typing import Final
 from sqlalchemy import Column
 
@@ -8,6 +8,7 @@ from .entities.lotto_max_results import LottoMaxResults
 
 from .models.numbers import Numbers
 from .models.prize_breakdown import PrizeBreakdown
+from .models.region import Region
 from .models.summary import Summary
 
 def build_lotto_max_numbers(data: list[LottoMaxResults]) -> list[Numbers]:
@@ -26,7 +27,7 @@ def build_lotto_max_numbers_matched(data: Column) -> list[NumbersMatched]:
     """Build lotto max numbers matched"""
     return _build_match_numbers(data)
 
-def build_lotto_max_result(number: Numbers, prize_breakdown: PrizeBreakdown, quebec: list[NumbersMatched], ontario: list[NumbersMatched], atlantic: list[NumbersMatched], western_canada: list[NumbersMatched], british_columbia: list[NumbersMatched]) -> LottoMaxResults:
+def build_lotto_max_result(number: Numbers, prize_breakdown: PrizeBreakdown, regions: dict[Region, list[NumbersMatched]]) -> LottoMaxResults:
     """Build lotto max result"""
     return LottoMaxResults(
         date=number.date,
@@ -34,13 +35,13 @@ def build_lotto_max_result(number: Numbers, prize_breakdown: PrizeBreakdown, que
         numbers=number.numbers,
         bonus=number.bonus,
         prize=number.prize,
-        summary=prize_breakdown.summary.model_dump_json(),
-        numbers_matched=list(map(lambda x: x.model_dump_json(), prize_breakdown.numbers_matched)),
-        numbers_matched_quebec=_build_region_json(quebec),
-        numbers_matched_ontario=_build_region_json(ontario),
-        numbers_matched_atlantic=_build_region_json(atlantic),
-        numbers_matched_western_canada=_build_region_json(western_canada),
-        numbers_matched_british_columbia=_build_region_json(british_columbia)
+        summary=prize_breakdown.summary.model_dump(mode="json"),
+        numbers_matched=list(map(lambda x: x.model_dump(mode="json"), prize_breakdown.numbers_matched)),
+        numbers_matched_quebec=_build_region_json(regions[Region.QUEBEC]),
+        numbers_matched_ontario=_build_region_json(regions[Region.ONTARIO]),
+        numbers_matched_atlantic=_build_region_json(regions[Region.ATLANTIC]),
+        numbers_matched_western_canada=_build_region_json(regions[Region.WESTERN_CANADA]),
+        numbers_matched_british_columbia=_build_region_json(regions[Region.BRITISH_COLUMBIA])
     )
 
 def build_lotto_max_body_email(data: LottoMaxResults) -> str:
@@ -70,7 +71,7 @@ def build_lotto_max_body_email(data: LottoMaxResults) -> str:
 
 def _build_summary(summary: Column) -> Summary:
     """Build summary"""
-    summary_dict: Final[dict] = loads(summary)
+    summary_dict: Final[dict] = summary
     return Summary(**summary_dict)
 
 def _build_match_numbers(numbers_matched: Column) -> list[NumbersMatched]:
@@ -78,11 +79,11 @@ def _build_match_numbers(numbers_matched: Column) -> list[NumbersMatched]:
     result: Final[list[NumbersMatched]] = []
     
     for value in numbers_matched:
-        match_dict = loads(value)
+        match_dict = value
         result.append(NumbersMatched(**match_dict))
 
     return result
 
-def _build_region_json(data: list[NumbersMatched]) -> list[str]:
+def _build_region_json(data: list[NumbersMatched]) -> list[dict]:
     """Build region dict"""
-    return list(map(lambda x: x.model_dump_json(), data))
+    return list(map(lambda x: x.model_dump(mode="json"), data))
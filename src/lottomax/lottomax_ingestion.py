@@ -0,0 +1,111 @@
+import asyncio
+import datetime
+import traceback
+from typing import Final
+
+from src.common.draw_calendar import get_missing_draw_dates
+from src.config.configuration import configuration
+from src.common.models.numbers_matched import NumbersMatched
+from src.database.database import database
+from src.database.upserts import UpsertResult
+from src.exports.exports import export_years
+from src.games.game_repository import is_year_exist_by_name, save_new_year_by_name
+from src.games.game_years_registry import game_years_registry
+from src.notification.notification_outbox import notification_outbox
+from src.payloads.payloads import materialize_year
+from src.response_cache.response_cache import response_cache
+from .entities.lotto_max_results import LottoMaxResults
+from .lottomax_repository import get_lotto_max_dates_since, save_lotto_max_results
+from .models.numbers import Numbers
+from .models.prize_breakdown import PrizeBreakdown
+from .models.region import Region
+from .lottomax_factory import build_lotto_max_body_email, build_lotto_max_result
+from .lottomax_external_data import extract_lotto_numbers_by_year_async, extract_lotto_result_with_regions_async
+
+_GAME_NAME: Final[str] = "lottomax"
+_DRAW_WEEKDAYS: Final[list[int]] = [1, 4]
+
+def find_missed_draw_dates(until: datetime.date) -> list[datetime.date]:
+    """Find the lotto max draw dates of the calendar missing from the saved results over the catch-up window"""
+    since: Final[datetime.date] = until - datetime.timedelta(days=configuration.catch_up_days)
+
+    return get_missing_draw_dates(set(get_lotto_max_dates_since(since)), since, until, _DRAW_WEEKDAYS)
+
+async def insert_new_lotto_results(dates: list[datetime.date]) -> None:
+    """Insert new lotto results, the year pages and the result pages of every date are fetched concurrently and the draws are saved in one batch"""
+    years: Final[list[int]] = sorted({date.year for date in dates})
+    years_numbers: Final[list[list[Numbers] | BaseException]] = await asyncio.gather(*(extract_lotto_numbers_by_year_async(year, [date for date in dates if date.year == year]) for year in years), return_exceptions=True)
+    numbers_by_year: Final[dict[int, list[Numbers] | BaseException]] = dict(zip(years, years_numbers))
+    external_results: Final[list[tuple[PrizeBreakdown, dict[Region, list[NumbersMatched]]] | BaseException]] = await asyncio.gather(*map(extract_lotto_result_with_regions_async, dates), return_exceptions=True)
+    new_results: Final[list[LottoMaxResults]] = []
+
+    for date, external_result in zip(dates, external_results):
+        new_result: LottoMaxResults | None = await asyncio.to_thread(_build_new_lotto_result, date, numbers_by_year[date.year], external_result)
+
+        if new_result is not None:
+            new_results.append(new_result)
+
+    if new_results:
+        await asyncio.to_thread(_save_new_lotto_results, new_results)
+
+def _build_new_lotto_result(date: datetime.date, year_numbers: list[Numbers] | BaseException, external_result: tuple[PrizeBreakdown, dict[Region, list[NumbersMatched]]] | BaseException) -> LottoMaxResults | None:
+    """Build a fetched lotto result, notify and return None when it cannot be built"""
+    try:
+        for error in (year_numbers, external_result):
+            if isinstance(error, BaseException):
+                raise error
+
+        external_number_result: Final[Numbers] = next(filter(lambda number: number.date == date, year_numbers), None)
+        external_prize_breakdown, external_regions = external_result
+
+        if external_number_result is None:
+            notification_outbox.notify("ERROR Lotto Max numbers", f"The numbers for the date {date.strftime('%Y-%m-%d')} were not found")
+            return None
+    
+        if external_prize_breakdown is None:
+            notification_outbox.notify("ERROR Lotto Max prize breakdown", f"The prize breakdown for the date {date.strftime('%Y-%m-%d')} were not found")
+            return None
+
+        return build_lotto_max_result(external_number_result, external_prize_breakdown, external_regions)
+    except Exception:
+        notification_outbox.notify("ERROR Lotto Max", f"An error occurred while inserting the lotto max result for the date {date.strftime('%Y-%m-%d')}.<br> Error: {traceback.format_exc().replace('\n', '<br>')}")
+        return None
+
+def _save_new_lotto_results(lotto_max_results: list[LottoMaxResults]) -> None:
+    """Save the built lotto results in one batch, the draws already saved are reported instead of inserted again"""
+    try:
+        new_years: Final[list[int]] = []
+
+        # the new years, the draws and their responses are committed together, so a failed rebuild never leaves a stale year response
+        with database.unit_of_work() as session:
+            for year in sorted({result.date.year for result in lotto_max_results}):
+                if not is_year_exist_by_name(_GAME_NAME, year, session):
+                    save_new_year_by_name(_GAME_NAME, year, session)
+                    new_years.append(year)
+
+            upsert_result: Final[UpsertResult] = save_lotto_max_results(lotto_max_results, session=session)
+            inserted_years: Final[list[int]] = sorted({date.year for date in upsert_result.inserted})
+
+            for year in inserted_years:
+                materialize_year(_GAME_NAME, year, session)
+
+        if new_years:
+            game_years_registry.refresh(_GAME_NAME)
+
+        for year in new_years:
+            notification_outbox.notify("New year added to Lotto Max", f"The year {year} was added to the database")
+
+        print(f"lotto max results: {len(upsert_result.inserted)} inserted, {len(upsert_result.skipped)} skipped")
+
+        for date in upsert_result.skipped:
+            notification_outbox.notify("ERROR Lotto Max", f"The numbers for the date {date.strftime('%Y-%m-%d')} already exist")
+
+        response_cache.invalidate(_GAME_NAME)
+
+        if inserted_years:
+            export_years(_GAME_NAME, inserted_years)
+
+        for lotto_max_result in filter(lambda result: result.date in upsert_result.inserted, lotto_max_results):
+            notification_outbox.notify("New Lotto Max result", build_lotto_max_body_email(lotto_max_result))
+    except Exception:
+        notification_outbox.notify("ERROR Lotto Max", f"An error occurred while saving the lotto max results.<br> Error: {traceback.format_exc().replace('\n', '<br>')}")
@@ -1,19 +1,28 @@
-from datetime import datetime
-from sqlalchemy import extract
+import datetime
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 from src.database.database import database
+from src.database.predicates import is_in_year
+from src.database.upserts import UpsertResult, to_row, upsert_draw_results
 from .entities.lotto_max_results import LottoMaxResults
 
-with database.get_db() as _database:
-  def get_lotto_numbers_by_year(year: int) -> list[LottoMaxResults]:
-    return _database.query(LottoMaxResults.date, LottoMaxResults.prize, LottoMaxResults.numbers, LottoMaxResults.bonus).filter(extract('year', LottoMaxResults.date) == year).all()
-  
-  def get_lotto_numbers_by_date(date: datetime.date) -> LottoMaxResults:
+def get_lotto_numbers_by_year(year: int) -> list[LottoMaxResults]:
+  with database.get_db() as _database:
+    return _database.query(LottoMaxResults.date, LottoMaxResults.prize, LottoMaxResults.numbers, LottoMaxResults.bonus).filter(is_in_year(LottoMaxResults.date, year)).all()
+
+def get_lotto_numbers_by_date(date: datetime.date) -> LottoMaxResults:
+  with database.get_db() as _database:
     return _database.query(LottoMaxResults.summary, LottoMaxResults.numbers_matched).filter(LottoMaxResults.date == date).first()
-  
-  def get_regions_numbers_matched_by_date(date: datetime.date) -> LottoMaxResults:
+
+def get_regions_numbers_matched_by_date(date: datetime.date) -> LottoMaxResults:
+  with database.get_db() as _database:
     return _database.query(LottoMaxResults.numbers_matched_atlantic, LottoMaxResults.numbers_matched_british_columbia, LottoMaxResults.numbers_matched_ontario, LottoMaxResults.numbers_matched_quebec, LottoMaxResults.numbers_matched_western_canada).filter(LottoMaxResults.date == date).first()
-  
-  def save_lotto_max_result(lotto_max_result: LottoMaxResults) -> None:
-    _database.add(lotto_max_result)
-    _database.commit()
-    _database.refresh(lotto_max_result)
\ No newline at end of file
+
+def get_lotto_max_dates_since(since: datetime.date) -> list[datetime.date]:
+  with database.get_db() as _database:
+    return _database.scalars(select(LottoMaxResults.date).filter(LottoMaxResults.date >= since)).all()
+
+def save_lotto_max_results(lotto_max_results: list[LottoMaxResults], overwrite: bool = False, session: Session | None = None) -> UpsertResult:
+  """Save a batch of draws in one transaction, the one of the session when given, the draws already saved are skipped unless they are overwritten"""
+  with database.unit_of_work(session) as _database:
+    return upsert_draw_results(_database, LottoMaxResults.__table__, list(map(to_row, lotto_max_results)), overwrite)
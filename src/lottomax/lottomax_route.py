@@ -1,14 +1,19 @@
 import datetime
-from typing import Final
-from fastapi import APIRouter, Path, status
+from fastapi import APIRouter, Path, Query, status
 
 from .models.region import Region
 
 from src.common.models.numbers_matched import NumbersMatched
+from fastapi.responses import FileResponse, StreamingResponse
+
+from src.config.configuration import configuration
+from src.exports.export_files import EXPORT_MEDIA_TYPES, ExportFormat
+from src.payloads.draw_range import ResultsFormat
+from src.response_cache.http_caching import build_json_response
 from .models.prize_breakdown import PrizeBreakdown
 from .models.numbers import Numbers
 
-from .lottomax_service import find_all_years, find_lotto_numbers_by_year, find_lotto_result, find_lotto_result_by_date_and_region
+from .lottomax_service import find_all_years, find_lotto_numbers_by_year_json, find_lotto_result_json, find_lotto_result_by_date_and_region_json, find_lotto_results_between, find_lotto_max_export
 
 router = APIRouter(
     prefix="/lottomax",
@@ -16,43 +21,53 @@ router = APIRouter(
     responses={400: {"description": "Bad Request"}, 404: {"description": "Not Found"}, 500: {"description": "Internal server error"}}
 )
 
-_LOTTOMAX_YEARS: Final[list[int]] = find_all_years()
-
-_LOTTOMAX_START_YEAR: Final[int] = min(_LOTTOMAX_YEARS)
-_LOTTOMAX_LAST_YEAR: Final[int] = max(_LOTTOMAX_YEARS)
-
 @router.get("/years", response_model=list[int])
 async def get_lotto_max_years() -> list[int]:
     """Get all years from lotto max"""
-    return _LOTTOMAX_YEARS
+    return find_all_years()
 
 @router.get("/years/{year}", response_model=list[Numbers])
-async def get_lottomax_result_by_year(
+def get_lottomax_result_by_year(
     year: int = Path(
-        title="The year of lotto max results to get",
-        ge=_LOTTOMAX_START_YEAR,
-        le=_LOTTOMAX_LAST_YEAR
+        title="The year of lotto max results to get"
         )):
     """Get the lotto max numbers result by year"""
-    return find_lotto_numbers_by_year(year)
+    return build_json_response(find_lotto_numbers_by_year_json(year), year)
+
+@router.get("/results", response_class=StreamingResponse, responses={200: {"content": {"application/x-ndjson": {}, "application/json": {}}}})
+def get_lottomax_results(
+    date_from: datetime.date = Query(alias="from", title="The date of the first draw"),
+    date_to: datetime.date = Query(alias="to", title="The date of the last draw"),
+    region: Region | None = Query(None, title="The region of the numbers matched to get instead of the prize payouts"),
+    cursor: datetime.date | None = Query(None, title="The X-Next-Cursor header of the previous page"),
+    limit: int = Query(configuration.results_page_max_size, ge=1, le=configuration.results_page_max_size, title="The maximum number of draws of the page"),
+    results_format: ResultsFormat = Query(ResultsFormat.NDJSON, alias="format", title="Newline-delimited JSON or a JSON array")):
+    """Stream the winning numbers and prize payouts of the draws between two dates"""
+    return find_lotto_results_between(date_from, date_to, cursor, limit, results_format, region)
 
 @router.get("/results/{date}", response_model=PrizeBreakdown)
-async def get_lottomax_result_by_date(
+def get_lottomax_result_by_date(
     date: datetime.date = Path(
         title="The date to view the winning numbers and prize payouts that took place"
     )):
     """Get the winning numbers and prise payouts for a specific date"""
-    return find_lotto_result(date)
+    return build_json_response(find_lotto_result_json(date), date.year)
 
 @router.get("/results/{date}/regions/{region}",
 response_model=list[NumbersMatched],
 status_code=status.HTTP_200_OK
 )
-async def get_lottomax_result_by_date_and_location(
+def get_lottomax_result_by_date_and_location(
     date: datetime.date = Path(...,
         title="The date"
     ),
     region: Region = Path(..., title="The region")
     ):
     """Get the winning numbers and prise payouts for a specific date and Region"""
-    return find_lotto_result_by_date_and_region(date, region)
+    return build_json_response(find_lotto_result_by_date_and_region_json(date, region), date.year)
+
+@router.get("/export", response_class=FileResponse, responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}})
+def get_lottomax_export(
+    export_format: ExportFormat = Query(ExportFormat.PARQUET, alias="format", title="Parquet or Arrow IPC")):
+    """Get the full lotto max draw history as a columnar file"""
+    return find_lotto_max_export(export_format)
@@ -1,25 +1,27 @@
 import datetime
-import traceback
 from typing import Final
 
 from fastapi import HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy import Column
 from src.common.models.numbers_matched import NumbersMatched
-from src.games.game_repository import get_years_by_name, is_year_exist_by_name, save_new_year_by_name
-from src.notification.email_sender import email_sender
+from src.exports.export_files import ExportFormat, build_export_response
+from src.games.game_years_registry import game_years_registry
+from src.payloads.draw_range import ResultsFormat, build_draw_range_response
+from src.payloads.payloads import RESULTS_VARIANT, get_draw_payload, get_region_variant, get_year_payload
+from src.response_cache.response_cache import CachedResponse, response_cache, to_json
 from .entities.lotto_max_results import LottoMaxResults
-from .lottomax_repository import get_lotto_numbers_by_year, get_lotto_numbers_by_date, get_regions_numbers_matched_by_date, save_lotto_max_result
+from .lottomax_repository import get_lotto_numbers_by_year, get_lotto_numbers_by_date, get_regions_numbers_matched_by_date
 from .models.numbers import Numbers
 from .models.prize_breakdown import PrizeBreakdown
 from .models.region import Region
-from .lottomax_factory import build_lotto_max_body_email, build_lotto_max_numbers, build_lotto_max_prize_breakdown, build_lotto_max_numbers_matched, build_lotto_max_result
-from .lottomax_external_data import extract_lotto_numbers_by_year, extract_lotto_result, extract_lotto_result_by_date_and_region
+from .lottomax_factory import build_lotto_max_numbers, build_lotto_max_prize_breakdown, build_lotto_max_numbers_matched
 
 _GAME_NAME: Final[str] = "lottomax"
 
 def find_all_years() -> list[int]:
     """Find all years from lotto max"""
-    return get_years_by_name(_GAME_NAME)
+    return game_years_registry.get_years(_GAME_NAME)
 
 def find_lotto_numbers_by_year(year: int) -> list[Numbers]:
     """Find lotto numbers by year"""
@@ -30,6 +32,11 @@ def find_lotto_numbers_by_year(year: int) -> list[Numbers]:
     
     return build_lotto_max_numbers(year_results)
 
+def find_lotto_numbers_by_year_json(year: int) -> CachedResponse:
+    """Find lotto numbers by year as the serialized response"""
+    game_years_registry.validate_year(_GAME_NAME, year)
+    return response_cache.get_or_build((_GAME_NAME, "years", year), lambda: get_year_payload(_GAME_NAME, year) or to_json(list[Numbers], find_lotto_numbers_by_year(year)))
+
 def find_lotto_result(date: datetime.date) -> PrizeBreakdown:
     """Find lotto result by date"""
     lotto_max_result: LottoMaxResults = get_lotto_numbers_by_date(date)
@@ -39,6 +46,10 @@ def find_lotto_result(date: datetime.date) -> PrizeBreakdown:
 
     return build_lotto_max_prize_breakdown(lotto_max_result)
 
+def find_lotto_result_json(date: datetime.date) -> CachedResponse:
+    """Find lotto result by date as the serialized response"""
+    return response_cache.get_or_build((_GAME_NAME, "results", date), lambda: get_draw_payload(_GAME_NAME, RESULTS_VARIANT, date) or to_json(PrizeBreakdown, find_lotto_result(date)))
+
 def find_lotto_result_by_date_and_region(date: datetime.date, region: Region) -> list[NumbersMatched]:
     """Find lotto result by date and region"""
     number_matched: LottoMaxResults = _get_results_by_region_and_date(date, region)
@@ -48,41 +59,18 @@ def find_lotto_result_by_date_and_region(date: datetime.date, region: Region) ->
     
     return build_lotto_max_numbers_matched(number_matched)
 
-def insert_new_lotto_result(date: datetime.date) -> None:
-    """Insert new lotto result"""
-    try:
-        if get_lotto_numbers_by_date(date) is not None:
-            email_sender.notify("ERROR Lotto Max", f"The numbers for the date {date.strftime('%Y-%m-%d')} already exist")
-            return
+def find_lotto_result_by_date_and_region_json(date: datetime.date, region: Region) -> CachedResponse:
+    """Find lotto result by date and region as the serialized response"""
+    return response_cache.get_or_build((_GAME_NAME, "results", date, region), lambda: get_draw_payload(_GAME_NAME, get_region_variant(region), date) or to_json(list[NumbersMatched], find_lotto_result_by_date_and_region(date, region)))
 
-        year: Final[int] = date.year
-        external_number_result: Final[Numbers] = next(filter(lambda number: number.date == date, extract_lotto_numbers_by_year(year)), None)
-        external_result: Final[PrizeBreakdown] = extract_lotto_result(date)
+def find_lotto_results_between(date_from: datetime.date, date_to: datetime.date, cursor: datetime.date | None, limit: int, results_format: ResultsFormat, region: Region | None = None) -> StreamingResponse:
+    """Stream a page of the lotto max results of a date range, the numbers matched of the region when it is given"""
+    variant: Final[str] = RESULTS_VARIANT if region is None else get_region_variant(region)
+    return build_draw_range_response(_GAME_NAME, variant, date_from, date_to, cursor, limit, results_format)
 
-        if external_number_result is None:
-            email_sender.notify("ERROR Lotto Max numbers", f"The numbers for the date {date.strftime('%Y-%m-%d')} were not found")
-            return
-    
-        if external_result is None:
-            email_sender.notify("ERROR Lotto Max prize breakdown", f"The prize breakdown for the date {date.strftime('%Y-%m-%d')} were not found")
-            return
-        
-        if not is_year_exist_by_name(_GAME_NAME, year):
-            save_new_year_by_name(_GAME_NAME, year)
-            email_sender.notify("New year added to Lotto Max" f"The year {year} was added to the database")
-
-        result_quebec: Final[list[NumbersMatched]] = extract_lotto_result_by_date_and_region(date, Region.QUEBEC)
-        result_ontario: Final[list[NumbersMatched]] = extract_lotto_result_by_date_and_region(date, Region.ONTARIO)
-        result_atlantic: Final[list[NumbersMatched]] = extract_lotto_result_by_date_and_region(date, Region.ATLANTIC)
-        result_western_canada: Final[list[NumbersMatched]] = extract_lotto_result_by_date_and_region(date, Region.WESTERN_CANADA)
-        result_british_columbia: Final[list[NumbersMatched]] = extract_lotto_result_by_date_and_region(date, Region.BRITISH_COLUMBIA)
-
-        lotto_max_result: Final[LottoMaxResults] = build_lotto_max_result(external_number_result, external_result, result_quebec, result_ontario, result_atlantic, result_western_canada, result_british_columbia)
-        save_lotto_max_result(lotto_max_result)
-
-        email_sender.notify("New Lotto Max result", build_lotto_max_body_email(lotto_max_result))
-    except Exception:
-        email_sender.notify("ERROR Lotto Max", f"An error occurred while inserting the lotto max result for the date {date.strftime('%Y-%m-%d')}.<br> Error: {traceback.format_exc().replace('\n', '<br>')}")
+def find_lotto_max_export(export_format: ExportFormat) -> FileResponse:
+    """Return the file of the full lotto max draw history"""
+    return build_export_response(_GAME_NAME, export_format)
 
 def _get_results_by_region_and_date(date: datetime.date, region: Region) -> Column:
     """Get results by region and date"""
@@ -1,4 +1,5 @@
 """"main.py"""
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Final
 import uvicorn
@@ -10,14 +11,23 @@ from daily_grand import daily_grand_route
 from config.configuration import configuration, Environnement
 from security.security_service import validate_rapidapi_proxy_secret
 from scheduler.scheduler import Scheduler
+from src.database.database import database
+from src.games.game_years_registry import game_years_registry
+from response_cache.http_caching import ConditionalRequestMiddleware
 
 scheduler: Final[Scheduler] = Scheduler()
 
 @asynccontextmanager
 async def life_span(app: FastAPI) :
-    scheduler.start()
+    # the first database connection is opened here rather than while importing the routers
+    await asyncio.to_thread(game_years_registry.load)
+
+    if configuration.run_scheduler:
+        scheduler.start()
+
     yield
-    scheduler.stop()
+    await scheduler.stop()
+    database.engine.dispose()
 
 app = FastAPI(
     title="Canada lottery API",
@@ -38,6 +48,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(ConditionalRequestMiddleware)
+
 app.include_router(lottomax_route.router)
 app.include_router(six_fourty_nine_route.router)
 app.include_router(daily_grand_route.router)
@@ -48,4 +60,4 @@ async def root():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app="main:app", host=configuration.host, port=configuration.port, reload=configuration.environnement == Environnement.DEV)
\ No newline at end of file
+    uvicorn.run(app="main:app", host=configuration.host, port=configuration.port, workers=configuration.workers, reload=configuration.environnement == Environnement.DEV)
\ No newline at end of file
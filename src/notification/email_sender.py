@@ -1,27 +1,62 @@
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from threading import Lock
 
 from src.config.configuration import configuration
 
 class EmailSender:
-    def __init__(self, sender_email: str, sender_password: str, recipient_email: str, smtp_server: str, smtp_port: int) -> None:
+    """Send the emails through one SMTP connection, authenticated once and reopened when the server closed it"""
+    def __init__(self, sender_email: str, sender_password: str, recipient_email: str, smtp_server: str, smtp_port: int, smtp_starttls: bool) -> None:
         self.sender_email = sender_email
         self.sender_password = sender_password
         self.recipient_email = recipient_email
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
+        self.smtp_starttls = smtp_starttls
+        self._server: smtplib.SMTP | None = None
+        self._lock: Lock = Lock()
     
-    def notify(self, subject: str, body: str) -> None:
-       self._send_email(subject, body)
-
-    def _send_email(self, subject: str, body: str) -> None:
+    def send(self, subject: str, body: str) -> None:
+        """Send an email, raise when the SMTP server rejects it"""
         message = self._build_message(subject, body)
-    
-        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            server.sendmail(self.sender_email, self.recipient_email, message.as_string())
+
+        with self._lock:
+            self._get_server().sendmail(self.sender_email, self.recipient_email, message.as_string())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except (smtplib.SMTPException, OSError):
+                    # a dropped connection cannot be quit, it only has to be forgotten
+                    self._server.close()
+
+                self._server = None
+
+    def _get_server(self) -> smtplib.SMTP:
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+
+        try:
+            if self.smtp_starttls:
+                server.starttls()
+
+            if self.sender_password:
+                server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+
+        self._server = server
+        return server
 
     def _build_message(self, subject: str, body: str) -> MIMEMultipart:
         message = MIMEMultipart()
@@ -32,4 +67,4 @@ class EmailSender:
 
         return message
 
-email_sender: EmailSender = EmailSender(configuration.sender_email, configuration.sender_password, configuration.recipient_email, configuration.smtp_server, configuration.smtp_port)
\ No newline at end of file
+email_sender: EmailSender = EmailSender(configuration.sender_email, configuration.sender_password, configuration.recipient_email, configuration.smtp_server, configuration.smtp_port, configuration.smtp_starttls)
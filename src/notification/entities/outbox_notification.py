@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+class OutboxNotification(Base):
+  __tablename__ = "notification_outbox"
+
+  id: Column = Column(Integer, primary_key=True, autoincrement=True)
+  subject: Column = Column(String, nullable=False)
+  body: Column = Column(Text, nullable=False)
+  attempts: Column = Column(Integer, nullable=False, server_default="0")
+  created_at: Column = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+  next_attempt_at: Column = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+  sent_at: Column = Column(DateTime(timezone=True), nullable=True)
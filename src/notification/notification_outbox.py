@@ -0,0 +1,71 @@
+import traceback
+from typing import Final
+
+from src.config.configuration import configuration
+
+from .email_sender import EmailSender, email_sender
+from .entities.outbox_notification import OutboxNotification
+from .notification_repository import claim_pending_notifications, mark_notifications_sent, postpone_notifications, save_notification
+
+class NotificationOutbox:
+    """Notifications saved in the database by the ingestion and sent later by the scheduler.
+
+    Saving a notification never reaches the SMTP server, so the ingestion does not wait on it and an SMTP failure
+    cannot hide the error being reported. The pending notifications are sent as one digest per flush.
+    """
+    def __init__(self, sender: EmailSender, batch_size: int, max_attempts: int, retry_delay: float, claim_timeout: int) -> None:
+        self.sender = sender
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.claim_timeout = claim_timeout
+
+    def notify(self, subject: str, body: str) -> None:
+        """Save a notification to send, print it when it cannot be saved"""
+        try:
+            save_notification(subject, body)
+        except Exception:
+            print(f"Cannot save the notification {subject}: {body}\n{traceback.format_exc()}")
+
+    def flush(self) -> int:
+        """Send the pending notifications as digests, return the number of notifications sent"""
+        sent: int = 0
+
+        while True:
+            notifications: list[OutboxNotification] = claim_pending_notifications(self.batch_size, self.max_attempts, self.claim_timeout)
+
+            if not notifications:
+                return sent
+
+            ids: list[int] = [notification.id for notification in notifications]
+
+            try:
+                self.sender.send(*_build_digest(notifications))
+            except Exception:
+                print(f"Cannot send the notifications {ids}\n{traceback.format_exc()}")
+                postpone_notifications(ids, self.retry_delay)
+                return sent
+
+            mark_notifications_sent(ids)
+            sent += len(ids)
+
+def _build_digest(notifications: list[OutboxNotification]) -> tuple[str, str]:
+    """Return the subject and the body of the email grouping the notifications"""
+    if len(notifications) == 1:
+        return notifications[0].subject, notifications[0].body
+
+    subject: Final[str] = f"{len(notifications)} notifications: {', '.join(dict.fromkeys(notification.subject for notification in notifications))}"
+    body: Final[str] = "<hr>".join(
+        f"<h2>{notification.subject}</h2><p>{notification.created_at:%Y-%m-%d %H:%M:%S}</p>{notification.body}"
+        for notification in notifications
+    )
+
+    return subject, body
+
+notification_outbox: NotificationOutbox = NotificationOutbox(
+    email_sender,
+    configuration.notification_batch_size,
+    configuration.notification_max_attempts,
+    configuration.notification_retry_delay,
+    configuration.notification_claim_timeout
+)
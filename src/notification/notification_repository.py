@@ -0,0 +1,43 @@
+import datetime
+from sqlalchemy import func, insert, select, update
+from src.database.database import database
+from .entities.outbox_notification import OutboxNotification
+
+def save_notification(subject: str, body: str) -> None:
+  with database.unit_of_work() as _database:
+    _database.execute(insert(OutboxNotification).values(subject=subject, body=body))
+
+def claim_pending_notifications(limit: int, max_attempts: int, claim_timeout: int) -> list[OutboxNotification]:
+  """Postpone the pending notifications by the claim timeout and return them, SKIP LOCKED lets a single sender claim each one"""
+  pending = (
+    select(OutboxNotification.id)
+    .filter(OutboxNotification.sent_at.is_(None), OutboxNotification.next_attempt_at <= func.now(), OutboxNotification.attempts < max_attempts)
+    .order_by(OutboxNotification.id)
+    .limit(limit)
+    .with_for_update(skip_locked=True)
+  )
+  statement = (
+    update(OutboxNotification)
+    .filter(OutboxNotification.id.in_(pending.scalar_subquery()))
+    .values(next_attempt_at=func.now() + datetime.timedelta(seconds=claim_timeout))
+    .returning(OutboxNotification.id, OutboxNotification.subject, OutboxNotification.body, OutboxNotification.attempts, OutboxNotification.created_at)
+  )
+
+  with database.unit_of_work() as _database:
+    return sorted(_database.execute(statement).all(), key=lambda notification: notification.id)
+
+def mark_notifications_sent(ids: list[int]) -> None:
+  with database.unit_of_work() as _database:
+    _database.execute(update(OutboxNotification).filter(OutboxNotification.id.in_(ids)).values(sent_at=func.now()))
+
+def postpone_notifications(ids: list[int], retry_delay: float) -> None:
+  """Count a failed attempt and retry the notifications after the retry delay, doubled after every attempt"""
+  with database.unit_of_work() as _database:
+    _database.execute(
+      update(OutboxNotification)
+      .filter(OutboxNotification.id.in_(ids))
+      .values(
+        attempts=OutboxNotification.attempts + 1,
+        next_attempt_at=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, retry_delay * func.power(2, OutboxNotification.attempts))
+      )
+    )
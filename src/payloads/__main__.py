@@ -0,0 +1,29 @@
+"""Check or rebuild the materialized API responses: python -m src.payloads"""
+import sys
+from argparse import ArgumentParser
+
+from src.games.game_repository import get_years_by_name
+from .payloads import PAYLOAD_GAMES, check_year, materialize_year
+
+parser = ArgumentParser(prog="python -m src.payloads", description="Check or rebuild the API responses materialized from the draw results tables")
+parser.add_argument("command", choices=["check", "rebuild"], help="check compares the stored responses with a rebuild, rebuild rewrites them")
+parser.add_argument("--games", nargs="+", choices=list(PAYLOAD_GAMES), default=list(PAYLOAD_GAMES), help="The games to process")
+parser.add_argument("--repair", action="store_true", help="With check, rebuild the years that do not match")
+
+arguments = parser.parse_args()
+mismatches: int = 0
+
+for game_name in arguments.games:
+    for year in sorted(get_years_by_name(game_name)):
+        if arguments.command == "rebuild":
+            materialize_year(game_name, year)
+            print(f"Rebuilt the {game_name} responses of {year}")
+        elif not check_year(game_name, year):
+            mismatches += 1
+            print(f"The {game_name} responses of {year} do not match the draw results")
+
+            if arguments.repair:
+                materialize_year(game_name, year)
+                print(f"Rebuilt the {game_name} responses of {year}")
+
+sys.exit(1 if mismatches and not arguments.repair else 0)
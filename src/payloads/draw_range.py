@@ -0,0 +1,65 @@
+import datetime
+from enum import Enum
+from typing import Final, Iterator
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.config.configuration import configuration
+
+from .payloads import get_next_draw_cursor, iter_draw_payloads
+
+class ResultsFormat(str, Enum):
+    """Enum of the formats of the streamed results"""
+    NDJSON = "ndjson"
+    JSON = "json"
+
+_MEDIA_TYPES: Final[dict[ResultsFormat, str]] = {
+    ResultsFormat.NDJSON: "application/x-ndjson",
+    ResultsFormat.JSON: "application/json",
+}
+
+def build_draw_range_response(game_name: str, variant: str, date_from: datetime.date, date_to: datetime.date, cursor: datetime.date | None, limit: int, results_format: ResultsFormat) -> StreamingResponse:
+    """Stream a page of the materialized draws of the date range, each draw as {"date": ..., "result": ...}.
+
+    The page starts after the cursor, the date of the last draw of the previous page, and the cursor of the next page
+    is sent in the X-Next-Cursor header.
+    """
+    _validate_range(date_from, date_to, cursor)
+
+    since: Final[datetime.date] = date_from if cursor is None else cursor + datetime.timedelta(days=1)
+    next_cursor: Final[datetime.date | None] = get_next_draw_cursor(game_name, variant, since, date_to, limit)
+    headers: Final[dict[str, str]] = {} if next_cursor is None else {"X-Next-Cursor": next_cursor.isoformat()}
+    draws: Final[Iterator[tuple[datetime.date, bytes]]] = iter_draw_payloads(game_name, variant, since, date_to, limit)
+
+    return StreamingResponse(_stream_draws(draws, results_format), media_type=_MEDIA_TYPES[results_format], headers=headers)
+
+def _validate_range(date_from: datetime.date, date_to: datetime.date, cursor: datetime.date | None) -> None:
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail=f"The date to {date_to} is before the date from {date_from}.")
+
+    if (date_to - date_from).days >= configuration.results_range_max_days:
+        raise HTTPException(status_code=400, detail=f"The date range cannot exceed {configuration.results_range_max_days} days.")
+
+    if cursor is not None and not date_from <= cursor <= date_to:
+        raise HTTPException(status_code=400, detail=f"The cursor {cursor} is outside of the date range.")
+
+def _stream_draws(draws: Iterator[tuple[datetime.date, bytes]], results_format: ResultsFormat) -> Iterator[bytes]:
+    """Wrap the materialized responses without parsing them, a single draw is held in memory at a time"""
+    try:
+        if results_format is ResultsFormat.JSON:
+            yield b"["
+
+        for index, (date, payload) in enumerate(draws):
+            line: bytes = b'{"date":"%s","result":%s}' % (date.isoformat().encode(), payload)
+
+            if results_format is ResultsFormat.NDJSON:
+                yield line + b"\n"
+            else:
+                yield line if index == 0 else b"," + line
+
+        if results_format is ResultsFormat.JSON:
+            yield b"]"
+    finally:
+        # closes the database session when the client disconnects before the end of the stream
+        draws.close()
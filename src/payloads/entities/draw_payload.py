@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Date, Index, Integer, LargeBinary, String
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+class DrawPayload(Base):
+  __tablename__ = "draw_payloads"
+
+  game_id: Column = Column(Integer, primary_key=True, nullable=False)
+  variant: Column = Column(String, primary_key=True, nullable=False)
+  date: Column = Column(Date, primary_key=True, nullable=False)
+  payload: Column = Column(LargeBinary, nullable=False)
+
+  __table_args__ = (
+    Index("ix_draw_payloads_game_id_date", "game_id", "date"),
+  )
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, LargeBinary
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+class YearPayload(Base):
+  __tablename__ = "year_payloads"
+
+  game_id: Column = Column(Integer, primary_key=True, nullable=False)
+  year: Column = Column(Integer, primary_key=True, nullable=False)
+  payload: Column = Column(LargeBinary, nullable=False)
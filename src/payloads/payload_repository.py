@@ -0,0 +1,68 @@
+import datetime
+from typing import Any, Final, Iterator
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from src.database.database import database
+from src.database.predicates import is_in_year
+from .entities.draw_payload import DrawPayload
+from .entities.year_payload import YearPayload
+
+_STREAMED_ROWS_PER_FETCH: Final[int] = 50
+
+def get_draw_payload(game_id: int, variant: str, date: datetime.date) -> bytes | None:
+  with database.get_db() as _database:
+    payload: bytes | None = _database.query(DrawPayload.payload).filter(DrawPayload.game_id == game_id, DrawPayload.variant == variant, DrawPayload.date == date).scalar()
+    return bytes(payload) if payload is not None else None
+
+def get_year_payload(game_id: int, year: int) -> bytes | None:
+  with database.get_db() as _database:
+    payload: bytes | None = _database.query(YearPayload.payload).filter(YearPayload.game_id == game_id, YearPayload.year == year).scalar()
+    return bytes(payload) if payload is not None else None
+
+def get_draw_payloads_by_year(game_id: int, year: int) -> dict[tuple[str, datetime.date], bytes]:
+  with database.get_db() as _database:
+    payloads: list[DrawPayload] = _database.query(DrawPayload.variant, DrawPayload.date, DrawPayload.payload).filter(DrawPayload.game_id == game_id, is_in_year(DrawPayload.date, year)).all()
+    return {(payload.variant, payload.date): bytes(payload.payload) for payload in payloads}
+
+def iter_draw_payloads_between(game_id: int, variant: str, since: datetime.date, until: datetime.date, limit: int) -> Iterator[tuple[datetime.date, bytes]]:
+  """Stream the draw payloads of the date range from a server-side cursor, the session stays open until the iterator is closed"""
+  with database.get_db() as _database:
+    rows = _database.execute(
+      select(DrawPayload.date, DrawPayload.payload)
+      .filter(DrawPayload.game_id == game_id, DrawPayload.variant == variant, DrawPayload.date >= since, DrawPayload.date <= until)
+      .order_by(DrawPayload.date)
+      .limit(limit)
+      .execution_options(yield_per=_STREAMED_ROWS_PER_FETCH)
+    )
+    for row in rows:
+      yield row.date, bytes(row.payload)
+
+def get_draw_payload_dates_between(game_id: int, variant: str, since: datetime.date, until: datetime.date, offset: int, limit: int) -> list[datetime.date]:
+  with database.get_db() as _database:
+    return _database.scalars(
+      select(DrawPayload.date)
+      .filter(DrawPayload.game_id == game_id, DrawPayload.variant == variant, DrawPayload.date >= since, DrawPayload.date <= until)
+      .order_by(DrawPayload.date)
+      .offset(offset)
+      .limit(limit)
+    ).all()
+
+def get_draw_rows_by_year(entity: Any, year: int, session: Session | None = None) -> list[Any]:
+  with database.get_db(session) as _database:
+    return _database.query(entity).filter(is_in_year(entity.date, year)).all()
+
+def delete_year_payloads(game_id: int, years: list[int], session: Session | None = None) -> None:
+  """Delete the year payloads, the years are then served from the draw rows until they are materialized again"""
+  with database.unit_of_work(session) as _database:
+    _database.query(YearPayload).filter(YearPayload.game_id == game_id, YearPayload.year.in_(years)).delete(synchronize_session=False)
+
+def save_year_payloads(game_id: int, year: int, draw_payloads: list[dict], year_payload: bytes | None, session: Session | None = None) -> None:
+  """Replace the draw payloads and the year payload of a year within the same transaction, the one of the session when given"""
+  with database.unit_of_work(session) as _database:
+    _database.query(DrawPayload).filter(DrawPayload.game_id == game_id, is_in_year(DrawPayload.date, year)).delete(synchronize_session=False)
+    _database.query(YearPayload).filter(YearPayload.game_id == game_id, YearPayload.year == year).delete(synchronize_session=False)
+    if draw_payloads:
+      _database.execute(insert(DrawPayload), draw_payloads)
+    if year_payload is not None:
+      _database.execute(insert(YearPayload).values(game_id=game_id, year=year, payload=year_payload))
@@ -0,0 +1,134 @@
+import datetime
+from typing import Any, Callable, Final, Iterator, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from src.common.models.numbers_matched import NumbersMatched
+from src.response_cache.response_cache import to_json
+
+from src.lottomax.entities.lotto_max_results import LottoMaxResults
+from src.lottomax.lottomax_factory import build_lotto_max_numbers, build_lotto_max_numbers_matched, build_lotto_max_prize_breakdown
+from src.lottomax.models.numbers import Numbers
+from src.lottomax.models.prize_breakdown import PrizeBreakdown as LottoMaxPrizeBreakdown
+from src.lottomax.models.region import Region
+
+from src.daily_grand.entities.daily_grand_results import DailyGrandResults
+from src.daily_grand.daily_grand_factory import build_daily_grand_prize_breakdown, build_daily_grand_results
+from src.daily_grand.models.prize_breakdown import PrizeBreakdown as DailyGrandPrizeBreakdown
+from src.daily_grand.models.result import Result as DailyGrandResult
+
+from src.six_fourty_nine.entities.six_fourty_nine_results import SixFourtyNineResults
+from src.six_fourty_nine.six_fourty_nine_factory import build_649_prize_breakdown, build_649_results
+from src.six_fourty_nine.models.prize_breakdown import PrizeBreakdown as SixFourtyNinePrizeBreakdown
+from src.six_fourty_nine.models.result import Result as SixFourtyNineResult
+
+from . import payload_repository
+
+RESULTS_VARIANT: Final[str] = "results"
+
+class PayloadGame(NamedTuple):
+    """Describe how to build the API responses of a game from its draw rows"""
+    game_id: int
+    entity: Any
+    build_draw_payloads: Callable[[Any], dict[str, bytes]]
+    build_year_payload: Callable[[list[Any]], bytes]
+
+def get_region_variant(region: Region) -> str:
+    return f"regions/{region.value}"
+
+def get_draw_payload(game_name: str, variant: str, date: datetime.date) -> bytes | None:
+    """Return the materialized response of a draw, None when it was not materialized"""
+    return payload_repository.get_draw_payload(PAYLOAD_GAMES[game_name].game_id, variant, date)
+
+def get_year_payload(game_name: str, year: int) -> bytes | None:
+    """Return the materialized response of a year, None when it was not materialized"""
+    return payload_repository.get_year_payload(PAYLOAD_GAMES[game_name].game_id, year)
+
+def iter_draw_payloads(game_name: str, variant: str, since: datetime.date, until: datetime.date, limit: int) -> Iterator[tuple[datetime.date, bytes]]:
+    """Stream the materialized responses of the draws of the date range, oldest first"""
+    return payload_repository.iter_draw_payloads_between(PAYLOAD_GAMES[game_name].game_id, variant, since, until, limit)
+
+def get_next_draw_cursor(game_name: str, variant: str, since: datetime.date, until: datetime.date, limit: int) -> datetime.date | None:
+    """Return the date of the last draw of the page when more draws follow it, None on the last page"""
+    dates: Final[list[datetime.date]] = payload_repository.get_draw_payload_dates_between(PAYLOAD_GAMES[game_name].game_id, variant, since, until, limit - 1, 2)
+
+    return dates[0] if len(dates) == 2 else None
+
+def materialize_year(game_name: str, year: int, session: Session | None = None) -> None:
+    """Rebuild the responses of every draw of the year and of the year itself from the draw rows.
+
+    Within the session of the caller, the responses are rebuilt from the draws it saved and committed with them.
+    """
+    game: Final[PayloadGame] = PAYLOAD_GAMES[game_name]
+    draw_payloads, year_payload = _build_year_payloads(game, year, session)
+
+    payload_repository.save_year_payloads(
+        game.game_id,
+        year,
+        [{"game_id": game.game_id, "variant": variant, "date": date, "payload": payload} for (variant, date), payload in draw_payloads.items()],
+        year_payload,
+        session
+    )
+
+def check_year(game_name: str, year: int) -> bool:
+    """Return whether the materialized responses of the year match a rebuild from the draw rows"""
+    game: Final[PayloadGame] = PAYLOAD_GAMES[game_name]
+    draw_payloads, year_payload = _build_year_payloads(game, year)
+
+    return payload_repository.get_year_payload(game.game_id, year) == year_payload and payload_repository.get_draw_payloads_by_year(game.game_id, year) == draw_payloads
+
+def _build_year_payloads(game: PayloadGame, year: int, session: Session | None = None) -> tuple[dict[tuple[str, datetime.date], bytes], bytes | None]:
+    rows: Final[list[Any]] = payload_repository.get_draw_rows_by_year(game.entity, year, session)
+
+    draw_payloads: Final[dict[tuple[str, datetime.date], bytes]] = {
+        (variant, row.date): payload
+        for row in rows
+        for variant, payload in game.build_draw_payloads(row).items()
+    }
+
+    # a year without draws has no response, the endpoint answers 400
+    return draw_payloads, game.build_year_payload(rows) if rows else None
+
+def _build_lotto_max_draw_payloads(row: LottoMaxResults) -> dict[str, bytes]:
+    payloads: Final[dict[str, bytes]] = {RESULTS_VARIANT: to_json(LottoMaxPrizeBreakdown, build_lotto_max_prize_breakdown(row))}
+
+    for region, column in _LOTTO_MAX_REGION_COLUMNS.items():
+        payloads[get_region_variant(region)] = to_json(list[NumbersMatched], build_lotto_max_numbers_matched(getattr(row, column)))
+
+    return payloads
+
+def _build_649_draw_payloads(row: SixFourtyNineResults) -> dict[str, bytes]:
+    # the draws saved by the backfill without a prize breakdown have no results response
+    if row.summary is None or row.number_matched is None:
+        return {}
+
+    return {RESULTS_VARIANT: to_json(SixFourtyNinePrizeBreakdown, build_649_prize_breakdown(row))}
+
+_LOTTO_MAX_REGION_COLUMNS: Final[dict[Region, str]] = {
+    Region.ATLANTIC: "numbers_matched_atlantic",
+    Region.BRITISH_COLUMBIA: "numbers_matched_british_columbia",
+    Region.ONTARIO: "numbers_matched_ontario",
+    Region.QUEBEC: "numbers_matched_quebec",
+    Region.WESTERN_CANADA: "numbers_matched_western_canada",
+}
+
+PAYLOAD_GAMES: Final[dict[str, PayloadGame]] = {
+    "lottomax": PayloadGame(
+        game_id=1,
+        entity=LottoMaxResults,
+        build_draw_payloads=_build_lotto_max_draw_payloads,
+        build_year_payload=lambda rows: to_json(list[Numbers], build_lotto_max_numbers(rows))
+    ),
+    "dailygrand": PayloadGame(
+        game_id=2,
+        entity=DailyGrandResults,
+        build_draw_payloads=lambda row: {RESULTS_VARIANT: to_json(DailyGrandPrizeBreakdown, build_daily_grand_prize_breakdown(row))},
+        build_year_payload=lambda rows: to_json(list[DailyGrandResult], build_daily_grand_results(rows))
+    ),
+    "sixfourtynine": PayloadGame(
+        game_id=3,
+        entity=SixFourtyNineResults,
+        build_draw_payloads=_build_649_draw_payloads,
+        build_year_payload=lambda rows: to_json(list[SixFourtyNineResult], build_649_results(rows))
+    ),
+}
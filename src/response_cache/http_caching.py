@@ -0,0 +1,77 @@
+import datetime
+from typing import Final
+
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.configuration import configuration
+
+from .response_cache import CachedResponse
+
+def build_json_response(cached_response: CachedResponse, year: int) -> Response:
+    """Return the cached JSON with its ETag, the draws of the years closed to the catch-up never change so they are cached for long"""
+    max_age: Final[int] = configuration.response_max_age_past_years if _is_year_closed(year) else configuration.response_max_age_current_year
+
+    return Response(
+        cached_response.content,
+        media_type="application/json",
+        headers={"ETag": cached_response.etag, "Cache-Control": f"public, max-age={max_age}"}
+    )
+
+class ConditionalRequestMiddleware:
+    """Answer 304 Not Modified when the If-None-Match header of a GET request matches the ETag of the response"""
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match: Final[str | None] = Headers(scope=scope).get("if-none-match")
+
+        if if_none_match is None:
+            await self.app(scope, receive, send)
+            return
+
+        is_not_modified: bool = False
+
+        async def send_conditional(message: Message) -> None:
+            nonlocal is_not_modified
+
+            if message["type"] == "http.response.start":
+                headers: MutableHeaders = MutableHeaders(raw=message["headers"])
+                is_not_modified = message["status"] == 200 and _is_etag_matching(if_none_match, headers.get("etag"))
+
+                if is_not_modified:
+                    await send({"type": "http.response.start", "status": 304, "headers": _get_not_modified_headers(headers)})
+                    return
+            elif is_not_modified:
+                if not message.get("more_body", False):
+                    await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_conditional)
+
+def _is_year_closed(year: int) -> bool:
+    """Return whether the last possible draw of the year is older than the catch-up window, which can still insert draws in the previous year"""
+    catch_up_start: Final[datetime.date] = datetime.date.today() - datetime.timedelta(days=configuration.catch_up_days)
+
+    return datetime.date(year, 12, 31) < catch_up_start
+
+def _is_etag_matching(if_none_match: str, etag: str | None) -> bool:
+    if etag is None:
+        return False
+
+    candidates: Final[list[str]] = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+def _get_not_modified_headers(headers: MutableHeaders) -> list[tuple[bytes, bytes]]:
+    """Keep the validators and the caching headers, a 304 has no body"""
+    kept_headers: Final[list[str]] = ["etag", "cache-control", "vary", "access-control-allow-origin", "access-control-allow-credentials"]
+
+    return [(name, value) for name, value in headers.raw if name.decode("latin-1") in kept_headers]
@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Callable, Final, Hashable, NamedTuple
+
+from pydantic import TypeAdapter
+
+from src.config.configuration import configuration
+
+class CachedResponse(NamedTuple):
+    """Serialized response of a saved draw with its strong ETag"""
+    content: bytes
+    etag: str
+
+class ResponseCache:
+    """LRU cache with TTL of the serialized responses of the saved draws.
+
+    The keys start with the game name, so every response of a game is dropped when a new draw of the game is saved.
+    """
+    def __init__(self, max_entries: int, ttl: int) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[float, CachedResponse]] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def get_or_build(self, key: tuple[Hashable, ...], build: Callable[[], bytes]) -> CachedResponse:
+        """Return the cached response of the key, building and storing it on a miss"""
+        with self._lock:
+            entry: tuple[float, CachedResponse] | None = self._entries.get(key)
+
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        content: Final[bytes] = build()
+        response: Final[CachedResponse] = CachedResponse(content, f'"{sha256(content).hexdigest()}"')
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return response
+
+    def invalidate(self, game: str) -> None:
+        """Drop every cached response of the game"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == game]:
+                del self._entries[key]
+
+def to_json(response_type: Any, value: Any) -> bytes:
+    """Serialize the value like FastAPI serializes a response_model, with the camelCase aliases"""
+    return _get_type_adapter(response_type).dump_json(value, by_alias=True)
+
+@lru_cache
+def _get_type_adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+# without the scheduler, the draws are saved by another process which cannot drop the responses of this one
+response_cache: ResponseCache = ResponseCache(
+    configuration.response_cache_max_entries,
+    configuration.response_cache_ttl if configuration.run_scheduler else min(configuration.response_cache_ttl, configuration.response_max_age_current_year)
+)
@@ -0,0 +1,21 @@
+"""Run the ingestion scheduler in its own process: python -m src.scheduler"""
+import asyncio
+import signal
+
+from .scheduler import Scheduler
+
+async def run_worker() -> None:
+    """Run the scheduled ingestion jobs until the process is stopped"""
+    scheduler: Scheduler = Scheduler()
+    stopped: asyncio.Event = asyncio.Event()
+
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(signal_number, stopped.set)
+
+    scheduler.start()
+    print("Ingestion worker started")
+
+    await stopped.wait()
+    await scheduler.stop()
+
+asyncio.run(run_worker())
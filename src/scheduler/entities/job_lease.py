@@ -0,0 +1,11 @@
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+class JobLease(Base):
+  __tablename__ = "job_leases"
+
+  job_name: Column = Column(String, primary_key=True, nullable=False)
+  holder: Column = Column(String, nullable=False)
+  expires_at: Column = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,18 @@
+import datetime
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert
+from src.database.database import database
+from .entities.job_lease import JobLease
+
+def acquire_job_lease(job_name: str, holder: str, duration: int) -> bool:
+  """Take or extend the lease of a job when it is free, expired or already held by the holder, the row lock makes a single holder win a concurrent run"""
+  expires_at = func.now() + datetime.timedelta(seconds=duration)
+  statement = insert(JobLease).values(job_name=job_name, holder=holder, expires_at=expires_at)
+  statement = statement.on_conflict_do_update(
+    index_elements=[JobLease.job_name],
+    set_={"holder": statement.excluded.holder, "expires_at": statement.excluded.expires_at},
+    where=or_(JobLease.expires_at <= func.now(), JobLease.holder == statement.excluded.holder)
+  ).returning(JobLease.job_name)
+
+  with database.unit_of_work() as _database:
+    return _database.execute(statement).first() is not None
@@ -1,36 +1,138 @@
+import asyncio
 import datetime
-from typing import Final
-from apscheduler.schedulers.background import BackgroundScheduler
+import os
+import socket
+import sys
+from typing import Awaitable, Callable, Final
 
-from src.daily_grand.daily_grand_service import insert_new_daily_grand_result
-from src.lottomax.lottomax_service import insert_new_lotto_result
-from src.six_fourty_nine.six_fourty_nine_service import insert_new_649_result
+from src.config.configuration import configuration
+from .job_lease_repository import acquire_job_lease
 
 class Scheduler:
+  """Run the ingestion jobs on the event loop of the application.
+
+  Every job compares the saved draws with the draw calendar over the catch-up window and inserts all the missing
+  ones, so the draws missed by a downtime or a failed scrape are fetched concurrently on the next run. APScheduler and the ingestion modules, which pull
+  the scrapers and pandas, are only imported when the scheduler starts and when a job runs.
+
+  Several processes can run the scheduler: a job only runs in the process that takes its lease in the database.
+  The lease is kept until it expires rather than released after the run, so a node whose clock is a little late
+  cannot run the same job again, while the retries of the holder extend it.
+  """
   def __init__(self) -> None:
-    self.scheduler = BackgroundScheduler({'apscheduler.timezone': 'America/Toronto'})
+    self.scheduler = None
+    self.holder: Final[str] = f"{socket.gethostname()}:{os.getpid()}"
+    self.running_jobs: int = 0
+
+  async def _insert_missed_lotto_max_results(self) -> list[datetime.date]:
+    from src.lottomax import lottomax_ingestion
+
+    dates: Final[list[datetime.date]] = await asyncio.to_thread(lottomax_ingestion.find_missed_draw_dates, _get_date_yesterday())
+    print(f"insert missed lotto max results {dates}")
 
-    self.scheduler.add_job(self._insert_latest_lotto_max_result, 'cron', id="lotto_max", day_of_week='wed,sat', hour=5, minute=30)
-    self.scheduler.add_job(self._insert_latest_649_result, 'cron', id="6_49", day_of_week='thu,sun', hour=5, minute=30)
-    self.scheduler.add_job(self._insert_latest_daily_grand_result, 'cron', id="daily_grand", day_of_week='tue,fri', hour=5, minute=30)
+    if dates:
+      await lottomax_ingestion.insert_new_lotto_results(dates)
 
-  def _insert_latest_lotto_max_result(self):
-    date_yesterday: Final[datetime.date] = datetime.date.today() - datetime.timedelta(days=1)
-    print(f"insert latest lotto max result {date_yesterday}")
-    insert_new_lotto_result(date_yesterday)
+    return await asyncio.to_thread(lottomax_ingestion.find_missed_draw_dates, _get_date_yesterday())
   
-  def _insert_latest_649_result(self):
-    date_yesterday: Final[datetime.date] = datetime.date.today() - datetime.timedelta(days=1)
-    print(f"insert latest 649 result {date_yesterday}")
-    insert_new_649_result(date_yesterday)
-
-  def _insert_latest_daily_grand_result(self):
-    date_yesterday: Final[datetime.date] = datetime.date.today() - datetime.timedelta(days=1)
-    print(f"insert latest daily grand result {date_yesterday}")
-    insert_new_daily_grand_result(date_yesterday)
+  async def _insert_missed_649_results(self) -> list[datetime.date]:
+    from src.six_fourty_nine import six_fourty_nine_ingestion
+
+    dates: Final[list[datetime.date]] = await asyncio.to_thread(six_fourty_nine_ingestion.find_missed_draw_dates, _get_date_yesterday())
+    print(f"insert missed 649 results {dates}")
+
+    if dates:
+      await six_fourty_nine_ingestion.insert_new_649_results(dates)
+
+    return await asyncio.to_thread(six_fourty_nine_ingestion.find_missed_draw_dates, _get_date_yesterday())
+
+  async def _insert_missed_daily_grand_results(self) -> list[datetime.date]:
+    from src.daily_grand import daily_grand_ingestion
+
+    dates: Final[list[datetime.date]] = await asyncio.to_thread(daily_grand_ingestion.find_missed_draw_dates, _get_date_yesterday())
+    print(f"insert missed daily grand results {dates}")
+
+    if dates:
+      await daily_grand_ingestion.insert_new_daily_grand_results(dates)
+
+    return await asyncio.to_thread(daily_grand_ingestion.find_missed_draw_dates, _get_date_yesterday())
   
+  async def _run_with_lease(self, job_name: str, job: Callable[[], Awaitable[list[datetime.date]]], attempt: int = 0) -> None:
+    """Run the job when this process takes its lease, skip it when another process holds it.
+
+    The draws still missing after the run, usually not published yet, are retried with an exponential backoff.
+    """
+    if not await asyncio.to_thread(acquire_job_lease, job_name, self.holder, configuration.job_lease_duration):
+      print(f"skip {job_name}, the lease is held by another process")
+      return
+
+    self.running_jobs += 1
+
+    try:
+      missing_dates: Final[list[datetime.date]] = await job()
+    finally:
+      self.running_jobs -= 1
+
+    # the notifications of the run are sent together as one digest
+    await self._send_notifications()
+
+    if not missing_dates or attempt >= configuration.catch_up_retries:
+      return
+
+    delay: Final[float] = configuration.catch_up_retry_delay * 2 ** attempt
+    print(f"retry {job_name} in {delay} seconds for the missing draws {missing_dates}")
+
+    self.scheduler.add_job(
+      self._run_with_lease,
+      'date',
+      args=[job_name, job, attempt + 1],
+      id=f"{job_name}_retry",
+      replace_existing=True,
+      run_date=datetime.datetime.now(self.scheduler.timezone) + datetime.timedelta(seconds=delay)
+    )
+
+  async def _send_pending_notifications(self) -> None:
+    """Send the notifications left by the other processes or by the failed sends, the running jobs send their own"""
+    if self.running_jobs == 0:
+      await self._send_notifications()
+
+  async def _send_notifications(self) -> None:
+    from src.notification.notification_outbox import notification_outbox
+
+    sent: Final[int] = await asyncio.to_thread(notification_outbox.flush)
+
+    if sent:
+      print(f"sent {sent} notifications")
+
   def start(self):
+    """Start the scheduler, must be called from the running event loop"""
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+    self.scheduler = AsyncIOScheduler({'apscheduler.timezone': 'America/Toronto'})
+
+    self.scheduler.add_job(self._run_with_lease, 'cron', args=["lotto_max", self._insert_missed_lotto_max_results], id="lotto_max", day_of_week='wed,sat', hour=5, minute=30)
+    self.scheduler.add_job(self._run_with_lease, 'cron', args=["6_49", self._insert_missed_649_results], id="6_49", day_of_week='thu,sun', hour=5, minute=30)
+    self.scheduler.add_job(self._run_with_lease, 'cron', args=["daily_grand", self._insert_missed_daily_grand_results], id="daily_grand", day_of_week='tue,fri', hour=5, minute=30)
+    self.scheduler.add_job(self._send_pending_notifications, 'interval', id="notifications", seconds=configuration.notification_flush_interval)
+
     self.scheduler.start()
   
-  def stop(self):
-    self.scheduler.shutdown()
\ No newline at end of file
+  async def stop(self):
+    if self.scheduler is None:
+      return
+
+    self.scheduler.shutdown()
+
+    # the clients are only created by the jobs
+    async_http_client_module = sys.modules.get("src.http_client.async_http_client")
+
+    if async_http_client_module is not None:
+      await async_http_client_module.async_http_client.close()
+
+    email_sender_module = sys.modules.get("src.notification.email_sender")
+
+    if email_sender_module is not None:
+      await asyncio.to_thread(email_sender_module.email_sender.close)
+
+def _get_date_yesterday() -> datetime.date:
+  return datetime.date.today() - datetime.timedelta(days=1)
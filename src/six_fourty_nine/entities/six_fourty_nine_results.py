@@ -1,5 +1,6 @@
 
-from sqlalchemy import Column, Date, Integer, JSON, UniqueConstraint
+from sqlalchemy import Column, Date, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -9,11 +10,11 @@ class SixFourtyNineResults(Base):
 
   date: Column = Column(Date, primary_key=True, nullable=False) 
   game_id: Column = Column(Integer, primary_key=True, nullable=False)
-  classic: Column = Column(JSON, nullable=False)
-  guaranteed: Column = Column(JSON, nullable=True)
-  gold_ball: Column = Column(JSON, nullable=True)
-  summary: Column = Column(JSON, nullable=False)
-  number_matched: Column = Column(JSON, nullable=False)
+  classic: Column = Column(JSONB, nullable=False)
+  guaranteed: Column = Column(JSONB, nullable=True)
+  gold_ball: Column = Column(JSONB, nullable=True)
+  summary: Column = Column(JSONB, nullable=False)
+  number_matched: Column = Column(JSONB, nullable=False)
 
   __table_args__ = (
     UniqueConstraint("date", "game_id"),
@@ -1,14 +1,21 @@
-from datetime import  datetime
-from io import BytesIO
+import asyncio
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Final
-from zipfile import ZipFile
 from bs4 import BeautifulSoup, ResultSet
 import re
-from pandas import DataFrame, read_csv, to_datetime
-from requests import Response, get
+from pandas import DataFrame, Timestamp
+from httpx import Response as HttpxResponse
+from requests import Response
 
 from src.common.models.numbers_matched import NumbersMatched
 from src.common.models.summary import Summary
+from src.common.playnow_archive import DRAW_DATE_FIELD, get_year_slice, load_playnow_archive
+from src.config.configuration import configuration
+from src.http_client.async_http_client import async_http_client
+from src.http_client.http_client import http_client
+from src.http_client.rate_limiter import RateLimiter
 
 from .models.prize_breakdown import PrizeBreakdown
 
@@ -22,76 +29,91 @@ _6_49_PAGE: Final[str] = "/lotto-649"
 _6_49_CLASSIC_FILE_PATH_URL: Final[str] = "https://www.playnow.com/resources/documents/downloadable-numbers/649.zip"
 _6_49_GP_FILE_PATH_URL: Final[str] = "https://www.playnow.com/resources/documents/downloadable-numbers/649GPs.zip"
 _6_49_RESULT_API: Final[str] = "https://www.playnow.com/services2/lotto/draw/six49"
+# the ingestion fetches the draws missing from the database, their pages are revalidated so a retry sees the draws published since the last fetch
+_MISSING_DRAW_MAX_AGE: Final[int] = 0
 
-_DRAW_DATE_FIELD: Final[str] = "DRAW DATE"
+_DRAW_DATE_FIELD: Final[str] = DRAW_DATE_FIELD
 _PRIZE_WON_FIELD: Final[str] = "PRIZE WON"
 _NUMBER_DRAWN_FIELD: Final[str] = "NUMBER DRAWN"
 _BALL_DRAWN_FIELD: Final[str] = "BALL DRAWN"
 _IS_GOLD_BALL_DRAWN_FIELD: Final[str] = "IS GOLD BALL DRAWN"
 _BONUS_NUMBER_FIELD: Final[str] = "BONUS NUMBER"
 _NUMBERS_FIELDS: Final[str] = "NUMBERS"
+_NUMBER_COLUMNS: Final[list[str]] = ["NUMBER DRAWN 1", "NUMBER DRAWN 2", "NUMBER DRAWN 3", "NUMBER DRAWN 4", "NUMBER DRAWN 5", "NUMBER DRAWN 6"]
 _DATE_FORMAT: Final[str] = "%Y-%m-%d"
 
+_LOTTO_NUMBERS_RATE_LIMITER: Final[RateLimiter] = RateLimiter(configuration.scrape_rate_limit)
+_classic_prizes: Final[dict[datetime.date, float]] = {}
+_classic_prizes_lock: Final[Lock] = Lock()
+
 def extract_all_years() -> list[int]:
     """Return all 6/49 years played"""
     return _get_6_49_years()
 
-def extract_649_results(year: int) -> list[Result]:
-    """Return results by selected years"""
-    zip_file_classic_response: Response = get(_6_49_CLASSIC_FILE_PATH_URL)
-    zip_file_gp_response: Response = get(_6_49_GP_FILE_PATH_URL)
-
-    if zip_file_classic_response.status_code != 200:
-        raise Exception(f"An error occured while fetching the classic results for the year {year}. \n message: {zip_file_classic_response.text}")
-    
-    if zip_file_gp_response.status_code != 200:
-        raise Exception(f"An error occured while fetching the guaranteed prize results for the year {year}. \n message: {zip_file_gp_response.text}")
-    
-    zip_file_classic = ZipFile(BytesIO(zip_file_classic_response.content))
-    zip_file_gp = ZipFile(BytesIO(zip_file_gp_response.content))
+def extract_649_results(year: int, known_prizes: dict[datetime.date, float | None] | None = None) -> list[Result]:
+    """Return results by selected years, known_prizes are the classic prizes already saved in the database"""
+    csv_file_classic: Final[DataFrame] = get_year_slice(_load_classic_archive(), year)
+    csv_file_gp: Final[DataFrame] = get_year_slice(_load_gp_archive(), year)
 
-    csv_file_classic = read_csv(zip_file_classic.open("649.csv"))
-    csv_file_gp = read_csv(zip_file_gp.open("649GPs.csv"))
+    classic_data = _process_classic_results_from_zip(csv_file_classic, known_prizes or {})
+    guaranteed_data = _process_guaranteed_data_from_zip(csv_file_gp)
+    gold_ball_data = _process_gold_ball_data_from_zip(csv_file_gp)
 
-    csv_file_classic[_DRAW_DATE_FIELD] = to_datetime(csv_file_classic[_DRAW_DATE_FIELD], format=_DATE_FORMAT)
-    csv_file_gp[_DRAW_DATE_FIELD] = to_datetime(csv_file_gp[_DRAW_DATE_FIELD], format=_DATE_FORMAT)
+    guaranteed_by_date: Final[dict[Timestamp, list[Guaranteed]]] = _group_guaranteed_by_date(guaranteed_data)
+    gold_ball_by_date: Final[dict[Timestamp, GoldBall]] = _group_gold_ball_by_date(gold_ball_data)
 
-    csv_file_classic = csv_file_classic[csv_file_classic[_DRAW_DATE_FIELD].dt.year == year]
-    csv_file_gp = csv_file_gp[csv_file_gp[_DRAW_DATE_FIELD].dt.year == year]
+    return list(map(
+        lambda date, prize, numbers, bonus: _build_result(date, prize, numbers, bonus, guaranteed_by_date.get(date), gold_ball_by_date.get(date)),
+        classic_data[_DRAW_DATE_FIELD],
+        classic_data[_PRIZE_WON_FIELD],
+        classic_data[_NUMBERS_FIELDS],
+        classic_data[_BONUS_NUMBER_FIELD]
+    ))
 
-    classic_data = _process_classic_results_from_zip(csv_file_classic)
-    guaranteed_data = _process_guaranteed_data_from_zip(csv_file_gp)
-    gold_ball_data = _process_gold_ball_data_from_zip(csv_file_gp)
+async def extract_649_result_async(date: datetime.date) -> Result:
+    """Return the 6/49 result within a specific date without blocking the event loop"""
+    result_page: Final[HttpxResponse] = await async_http_client.get(_get_result_api_url(date), _MISSING_DRAW_MAX_AGE)
 
-    classic_data["RESULT"] = classic_data.apply(lambda row: _build_result(row, gold_ball_data, guaranteed_data), axis=1)
+    if result_page.status_code != 200:
+        raise Exception(f"An error occured while fetching the results for the date {date.strftime(_DATE_FORMAT)}. \n message: {result_page.text}")
 
-    return classic_data["RESULT"].tolist()
+    return await asyncio.to_thread(lambda: _build_result_from_json(date, result_page.json()))
 
-def extract_649_result(date: datetime.date) -> Result:
+def extract_649_prize_breakdown(date: datetime.date) -> PrizeBreakdown | None:
     """Return the 6/49 result within a specific date"""
-    date_string: Final[str] = date.strftime(_DATE_FORMAT)
-    result_page: Response = get(f"{_6_49_RESULT_API}/{date_string}")
+    date_result_page: Response = http_client.get(_get_result_page_url(date))
 
-    if result_page.status_code != 200:
-        raise Exception(f"An error occured while fetching the results for the date {date_string}. \n message: {result_page.text}")
+    if date_result_page.status_code != 200:
+        raise Exception(f"An error occured while fetching the results for the date {date.strftime(_DATE_FORMAT)}. \n message: {date_result_page.text}")
+    
+    return _build_prize_breakdown_from_page(date_result_page.text)
 
-    result_json: Final[dict] = result_page.json()
+async def extract_649_prize_breakdown_async(date: datetime.date) -> PrizeBreakdown | None:
+    """Return the 6/49 prize breakdown within a specific date without blocking the event loop"""
+    date_result_page: Final[HttpxResponse] = await async_http_client.get(_get_result_page_url(date), _MISSING_DRAW_MAX_AGE)
 
+    if date_result_page.status_code != 200:
+        raise Exception(f"An error occured while fetching the results for the date {date.strftime(_DATE_FORMAT)}. \n message: {date_result_page.text}")
+
+    return await asyncio.to_thread(_build_prize_breakdown_from_page, date_result_page.text)
+
+def _get_result_api_url(date: datetime.date) -> str:
+    return f"{_6_49_RESULT_API}/{date.strftime(_DATE_FORMAT)}"
+
+def _get_result_page_url(date: datetime.date) -> str:
+    return f"{_6_49_BASE_URL}{_6_49_PAGE}/numbers/{date.strftime(_DATE_FORMAT)}"
+
+def _build_result_from_json(date: datetime.date, result_json: dict) -> Result:
+    """Return the 6/49 result of a PlayNow draw payload"""
     classic: Final[Classic] = _process_classic_results_from_json(result_json)
     guaranteed: Final[list[Guaranteed] | None] =_process_guaranteed_data_from_json(result_json)
     gold_ball: Final[GoldBall | None] = _process_gold_ball_from_json(result_json)
 
     return Result(date=date, classic=classic, guaranteed=guaranteed, goldBall=gold_ball)
 
-def extract_649_prize_breakdown(date: datetime.date) -> PrizeBreakdown | None:
-    """Return the 6/49 result within a specific date"""
-    date_string: Final[str] = date.strftime(_DATE_FORMAT)
-    date_result_page: Response = get(f"{_6_49_BASE_URL}{_6_49_PAGE}/numbers/{date_string}")
-
-    if date_result_page.status_code != 200:
-        raise Exception(f"An error occured while fetching the results for the date {date_string}. \n message: {date_result_page.text}")
-    
-    html_content: BeautifulSoup = BeautifulSoup(date_result_page.text, "html.parser")
+def _build_prize_breakdown_from_page(date_result_page: str) -> PrizeBreakdown | None:
+    """Return the prize breakdown of a result page, None when the page has no breakdown table"""
+    html_content: BeautifulSoup = BeautifulSoup(date_result_page, "html.parser")
     table_breakdown_result: Final[ResultSet] = html_content.find("table")
 
     if table_breakdown_result is None:
@@ -103,7 +125,7 @@ def extract_649_prize_breakdown(date: datetime.date) -> PrizeBreakdown | None:
 
 def _get_6_49_years() -> list[int]:
     """Return all lotto 6/49 years played"""
-    six_foyrty_nine_page: Response = get(f"{_6_49_BASE_URL}{_6_49_PAGE}/past-numbers")
+    six_foyrty_nine_page: Response = http_client.get(f"{_6_49_BASE_URL}{_6_49_PAGE}/past-numbers")
 
     if six_foyrty_nine_page.status_code != 200:
         raise Exception(f"Unable to fetch the years results.\n message: {six_foyrty_nine_page.text}")
@@ -170,33 +192,91 @@ def _process_gold_ball_from_json(result: dict) -> GoldBall | None:
 
 
 # ZIP FILE PROCESSING
-def _process_classic_results_from_zip(csv_file_classic: DataFrame) -> DataFrame:
-    number_columns: Final[list[str]] = ["NUMBER DRAWN 1", "NUMBER DRAWN 2", "NUMBER DRAWN 3", "NUMBER DRAWN 4", "NUMBER DRAWN 5", "NUMBER DRAWN 6"]
+def _load_classic_archive() -> DataFrame:
+    """Return the classic draws archive, parsed once per download"""
+    dtypes: Final[dict[str, str]] = {number_column: "int8" for number_column in _NUMBER_COLUMNS}
+    dtypes[_BONUS_NUMBER_FIELD] = "int8"
 
-    csv_file_classic[_PRIZE_WON_FIELD] = csv_file_classic.apply(lambda row: _get_classic_prize(row), axis=1)
-    csv_file_classic[_NUMBERS_FIELDS] = csv_file_classic[number_columns].values.tolist() 
-    
-    return csv_file_classic.loc[:, [_DRAW_DATE_FIELD, _PRIZE_WON_FIELD, _NUMBERS_FIELDS, _BONUS_NUMBER_FIELD]]
+    return load_playnow_archive(_6_49_CLASSIC_FILE_PATH_URL, "649.csv", dtypes)
 
-def _process_guaranteed_data_from_zip(csv_file_gp: DataFrame) -> DataFrame:
-    csv_file_gp[_PRIZE_WON_FIELD] = csv_file_gp[_PRIZE_WON_FIELD].replace("[\$,]", "", regex=True).astype(float)
-    csv_file_gp[_NUMBER_DRAWN_FIELD] = csv_file_gp[_NUMBER_DRAWN_FIELD].replace(" ", "", regex=True)
+def _load_gp_archive() -> DataFrame:
+    """Return the guaranteed prize and gold ball draws archive, parsed once per download"""
+    dtypes: Final[dict[str, str]] = {_PRIZE_WON_FIELD: "str", _NUMBER_DRAWN_FIELD: "str", _BALL_DRAWN_FIELD: "category"}
 
+    return load_playnow_archive(_6_49_GP_FILE_PATH_URL, "649GPs.csv", dtypes, _prepare_gp_archive)
+
+def _prepare_gp_archive(csv_file_gp: DataFrame) -> DataFrame:
+    """Convert the prizes to float and remove the spaces of the numbers drawn"""
+    return csv_file_gp.assign(**{
+        _PRIZE_WON_FIELD: csv_file_gp[_PRIZE_WON_FIELD].replace("[\\$,]", "", regex=True).astype(float),
+        _NUMBER_DRAWN_FIELD: csv_file_gp[_NUMBER_DRAWN_FIELD].replace(" ", "", regex=True)
+    })
+
+def _process_classic_results_from_zip(csv_file_classic: DataFrame, known_prizes: dict[datetime.date, float | None]) -> DataFrame:
+    dates: Final[list[datetime.date]] = csv_file_classic[_DRAW_DATE_FIELD].dt.date.tolist()
+    prizes: Final[dict[datetime.date, float | None]] = _resolve_classic_prizes(dates, known_prizes)
+
+    return DataFrame({
+        _DRAW_DATE_FIELD: csv_file_classic[_DRAW_DATE_FIELD],
+        _PRIZE_WON_FIELD: list(map(lambda date: prizes[date], dates)),
+        _NUMBERS_FIELDS: csv_file_classic[_NUMBER_COLUMNS].values.tolist(),
+        _BONUS_NUMBER_FIELD: csv_file_classic[_BONUS_NUMBER_FIELD]
+    })
+
+def _process_guaranteed_data_from_zip(csv_file_gp: DataFrame) -> DataFrame:
     guaranteed_data: DataFrame = csv_file_gp[csv_file_gp[_BALL_DRAWN_FIELD] == "Not Applicable"].groupby([_DRAW_DATE_FIELD, _PRIZE_WON_FIELD]).agg({_NUMBER_DRAWN_FIELD: _collect_number}).reset_index()
     return guaranteed_data.loc[:, [_DRAW_DATE_FIELD, _PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD]]
 
 def _process_gold_ball_data_from_zip(csv_file_gp: DataFrame) -> DataFrame:
     gold_ball_data: DataFrame = csv_file_gp[csv_file_gp[_BALL_DRAWN_FIELD] != "Not Applicable"]
-    gold_ball_data.loc[:, [_IS_GOLD_BALL_DRAWN_FIELD]] = gold_ball_data[_BALL_DRAWN_FIELD] == "Gold"
+    gold_ball_data = gold_ball_data.assign(**{_IS_GOLD_BALL_DRAWN_FIELD: gold_ball_data[_BALL_DRAWN_FIELD] == "Gold"})
     return gold_ball_data.loc[:, [_DRAW_DATE_FIELD, _PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD, _IS_GOLD_BALL_DRAWN_FIELD]]
 
-def _get_classic_prize(row) -> float | None:
+def _resolve_classic_prizes(dates: list[datetime.date], known_prizes: dict[datetime.date, float | None]) -> dict[datetime.date, float | None]:
+    """Return the classic prize of every date.
+
+    The prizes come from the database and the prizes already resolved by this process first,
+    then from the PlayNow draw API and only the remaining dates are scraped, under the rate limit.
+    Only the published prizes are memoized, a prize still missing is fetched again by the next call.
+    """
+    with _classic_prizes_lock:
+        prizes: Final[dict[datetime.date, float | None]] = {date: _classic_prizes[date] for date in dates if date in _classic_prizes}
+
+    prizes.update((date, known_prizes[date]) for date in dates if date in known_prizes and date not in prizes)
+
+    missing_dates: list[datetime.date] = [date for date in dates if date not in prizes]
+
+    with ThreadPoolExecutor(max_workers=configuration.scrape_workers) as executor:
+        for date, prize in zip(missing_dates, executor.map(_get_classic_prize_from_api, missing_dates)):
+            if prize is not None:
+                prizes[date] = prize
+
+        missing_dates = [date for date in missing_dates if date not in prizes]
+        prizes.update(zip(missing_dates, executor.map(_get_classic_prize, missing_dates)))
+
+    with _classic_prizes_lock:
+        _classic_prizes.update((date, prize) for date, prize in prizes.items() if prize is not None)
+
+    return prizes
+
+def _get_classic_prize_from_api(date: datetime.date) -> float | None:
+    """Return the 6/49 classic prize from the PlayNow draw API, None when the draw is not available"""
+    result_page: Final[Response] = http_client.get(_get_result_api_url(date))
+
+    if result_page.status_code != 200:
+        return None
+
+    return _process_classic_results_from_json(result_page.json()).prize
+
+def _get_classic_prize(date: datetime.date) -> float | None:
     """Return the 6/49 classic prize"""
-    date: Final[str] = row[_DRAW_DATE_FIELD].strftime(_DATE_FORMAT)
-    result_page: Final[Response] = get(f"{_6_49_BASE_URL}{_6_49_PAGE}/numbers/{date}")
+    date_string: Final[str] = date.strftime(_DATE_FORMAT)
+
+    _LOTTO_NUMBERS_RATE_LIMITER.wait()
+    result_page: Final[Response] = http_client.get(_get_result_page_url(date))
 
     if result_page.status_code != 200:
-        raise Exception(f"Unable to fetch the prize for the date {date}. \n message: {result_page.text}")
+        raise Exception(f"Unable to fetch the prize for the date {date_string}. \n message: {result_page.text}")
     
     html_content: BeautifulSoup = BeautifulSoup(result_page.text, "html.parser")
     table_body: Final[ResultSet] = html_content.find("tbody")
@@ -209,21 +289,27 @@ def _get_classic_prize(row) -> float | None:
 
     return float(price)
 
-def _build_result(row, gold_ball_data: DataFrame, guaranteed_data: DataFrame) -> Result:
-    """Return the 6/49 result"""
-    date: Final[datetime.date] = row["DRAW DATE"]
+def _group_guaranteed_by_date(guaranteed_data: DataFrame) -> dict[Timestamp, list[Guaranteed]]:
+    """Return the guaranteed prizes of every draw in a single pass"""
+    guaranteed_by_date: Final[dict[Timestamp, list[Guaranteed]]] = {}
 
-    classic: Final[Classic] = Classic(numbers=row[_NUMBERS_FIELDS], bonus=row[_BONUS_NUMBER_FIELD], prize=row[_PRIZE_WON_FIELD])
-    guaranteed: list[Guaranteed] | None = None
-    gold_ball: GoldBall | None = None
+    for date, prize, numbers in zip(guaranteed_data[_DRAW_DATE_FIELD], guaranteed_data[_PRIZE_WON_FIELD], guaranteed_data[_NUMBER_DRAWN_FIELD]):
+        guaranteed_by_date.setdefault(date, []).append(Guaranteed(numbers=numbers, prize=prize))
 
-    if not guaranteed_data[guaranteed_data[_DRAW_DATE_FIELD] == date].empty:
-        guaranteed_value_df: Final[DataFrame] = guaranteed_data.loc[guaranteed_data[_DRAW_DATE_FIELD] == date, [_PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD]].rename(columns={_NUMBER_DRAWN_FIELD: "numbers", _PRIZE_WON_FIELD: "prize"})
-        guaranteed = guaranteed_value_df.apply(lambda row: Guaranteed(numbers=row["numbers"], prize=row["prize"]), axis=1).tolist()
-    
-    if not gold_ball_data[gold_ball_data[_DRAW_DATE_FIELD] == date].empty:
-        gold_ball_value_df: Final[DataFrame] = gold_ball_data.loc[gold_ball_data[_DRAW_DATE_FIELD] == date, [_PRIZE_WON_FIELD, _NUMBER_DRAWN_FIELD, _IS_GOLD_BALL_DRAWN_FIELD]].rename(columns={_NUMBER_DRAWN_FIELD: "number", _PRIZE_WON_FIELD: "prize", _IS_GOLD_BALL_DRAWN_FIELD: "isGoldBallDrawn"})
-        gold_ball = GoldBall(**gold_ball_value_df.to_dict(orient="records")[0])
+    return guaranteed_by_date
+
+def _group_gold_ball_by_date(gold_ball_data: DataFrame) -> dict[Timestamp, GoldBall]:
+    """Return the first gold ball draw of every draw in a single pass"""
+    first_draws: Final[DataFrame] = gold_ball_data.drop_duplicates(subset=[_DRAW_DATE_FIELD], keep="first")
+
+    return {
+        date: GoldBall(number=number, prize=prize, isGoldBallDrawn=is_gold_ball_drawn)
+        for date, prize, number, is_gold_ball_drawn in zip(first_draws[_DRAW_DATE_FIELD], first_draws[_PRIZE_WON_FIELD], first_draws[_NUMBER_DRAWN_FIELD], first_draws[_IS_GOLD_BALL_DRAWN_FIELD])
+    }
+
+def _build_result(date: Timestamp, prize: float | None, numbers: list[int], bonus: int, guaranteed: list[Guaranteed] | None, gold_ball: GoldBall | None) -> Result:
+    """Return the 6/49 result"""
+    classic: Final[Classic] = Classic(numbers=numbers, bonus=bonus, prize=prize)
 
     return Result(date=date.strftime(_DATE_FORMAT), classic=classic, guaranteed=guaranteed, goldBall=gold_ball)
 
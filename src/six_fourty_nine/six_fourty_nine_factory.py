@@ -1,5 +1,5 @@
 import datetime
-from json import loads, dumps
+from json import dumps
 from typing import Final
 
 from sqlalchemy import Column
@@ -21,7 +21,7 @@ def build_649_results(data: list[SixFourtyNineResults]) -> list[Result]:
 
   for value in data:
     date: datetime.date = value.date
-    classic: Classic = Classic(**loads(value.classic))
+    classic: Classic = Classic(**value.classic)
     guaranteed: list[Guaranteed] | None = None
     gold_ball: GoldBall | None = None
 
@@ -29,28 +29,32 @@ def build_649_results(data: list[SixFourtyNineResults]) -> list[Result]:
       guaranteed = _build_guaranteed(value.guaranteed)
     
     if value.gold_ball is not None:
-      gold_ball_dict: Final[dict] = loads(value.gold_ball)
+      gold_ball_dict: Final[dict] = value.gold_ball
       gold_ball = GoldBall(number=gold_ball_dict["number"], prize=gold_ball_dict["prize"], isGoldBallDrawn=gold_ball_dict["is_gold_ball_drawn"])
 
     results.append(Result(date=date, classic=classic, guaranteed=guaranteed, goldBall=gold_ball))
 
   return sorted(results, key=lambda x: x.date, reverse=True)
 
+def build_649_classic_prizes(data: list[SixFourtyNineResults]) -> dict[datetime.date, float | None]:
+  """Build the classic prize of every saved 6/49 result"""
+  return {value.date: value.classic["prize"] for value in data}
+
 def build_649_prize_breakdown(data: SixFourtyNineResults) -> PrizeBreakdown:
     """Build 6/49 prize breakdown"""
     summary: Final[Summary] = _build_summary(data.summary)
     numbers_matched: Final[list[NumbersMatched]] = _build_match_numbers(data.number_matched)
     return PrizeBreakdown(summary=summary, numbers_matched=numbers_matched)
 
-def build_649_new_result(number_result: Result, prize_breakdown: PrizeBreakdown) -> SixFourtyNineResults:
+def build_649_new_result(number_result: Result, prize_breakdown: PrizeBreakdown | None) -> SixFourtyNineResults:
    return SixFourtyNineResults(
     date=number_result.date,
     game_id=3,
-    classic=number_result.classic.model_dump_json(),
-    guaranteed=list(map(lambda guaranteed: guaranteed.model_dump_json(), number_result.guaranteed)) if number_result.guaranteed else None,
-    gold_ball=number_result.gold_ball.model_dump_json() if number_result.gold_ball else None,
-    summary=prize_breakdown.summary.model_dump_json() if prize_breakdown.summary else None,
-    number_matched=list(map(lambda number_matched: number_matched.model_dump_json(), prize_breakdown.numbers_matched)) if prize_breakdown.numbers_matched else None
+    classic=number_result.classic.model_dump(mode="json"),
+    guaranteed=list(map(lambda guaranteed: guaranteed.model_dump(mode="json"), number_result.guaranteed)) if number_result.guaranteed else None,
+    gold_ball=number_result.gold_ball.model_dump(mode="json") if number_result.gold_ball else None,
+    summary=prize_breakdown.summary.model_dump(mode="json") if prize_breakdown and prize_breakdown.summary else None,
+    number_matched=list(map(lambda number_matched: number_matched.model_dump(mode="json"), prize_breakdown.numbers_matched)) if prize_breakdown and prize_breakdown.numbers_matched else None
   )
 
 def build_649_body_email(data: SixFourtyNineResults) -> str:
@@ -73,14 +77,14 @@ def build_649_body_email(data: SixFourtyNineResults) -> str:
 
 def _build_summary(summary: Column) -> Summary:
     """Build summary"""
-    summary_dict: Final[dict] = loads(summary)
+    summary_dict: Final[dict] = summary
     return Summary(**summary_dict)
 
 def _build_match_numbers(numbers_matched: Column) -> list[NumbersMatched]:
     """Build match numbers"""
     result: Final[list[NumbersMatched]] = []
     for value in numbers_matched:
-        match_dict = loads(value)
+        match_dict = value
         result.append(NumbersMatched(**match_dict))
     return result
 
@@ -88,6 +92,6 @@ def _build_guaranteed(guaranteed: Column) -> list[Guaranteed]:
     """Build guaranteed"""
     result: Final[list[Guaranteed]] = []
     for value in guaranteed:
-        guaranteed_dict = loads(value)
+        guaranteed_dict = value
         result.append(Guaranteed(**guaranteed_dict))
     return result
\ No newline at end of file
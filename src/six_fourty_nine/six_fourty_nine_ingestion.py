@@ -0,0 +1,108 @@
+import asyncio
+import datetime
+import traceback
+from typing import Final
+
+from src.common.draw_calendar import get_missing_draw_dates
+from src.config.configuration import configuration
+from src.database.database import database
+from src.database.upserts import UpsertResult
+from src.exports.exports import export_years
+from src.notification.notification_outbox import notification_outbox
+from src.payloads.payloads import materialize_year
+from src.response_cache.response_cache import response_cache
+
+from .six_fourty_nine_external_data import extract_649_prize_breakdown_async, extract_649_result_async
+from .six_fourty_nine_factory import build_649_body_email, build_649_new_result
+
+from .entities.six_fourty_nine_results import SixFourtyNineResults
+
+from .models.prize_breakdown import PrizeBreakdown
+from .models.result import Result
+
+from src.games.game_repository import is_year_exist_by_name, save_new_year_by_name
+from src.games.game_years_registry import game_years_registry
+from .sixe_fourty_nine_repository import get_649_dates_since, save_649_results
+
+_GAME_NAME: Final[str] = "sixfourtynine"
+_DRAW_WEEKDAYS: Final[list[int]] = [2, 5]
+
+def find_missed_draw_dates(until: datetime.date) -> list[datetime.date]:
+    """Return the 6/49 draw dates of the calendar missing from the saved results over the catch-up window"""
+    since: Final[datetime.date] = until - datetime.timedelta(days=configuration.catch_up_days)
+
+    return get_missing_draw_dates(set(get_649_dates_since(since)), since, until, _DRAW_WEEKDAYS)
+
+async def insert_new_649_results(dates: list[datetime.date]) -> None:
+    """Insert new 6/49 results, the draw payload and the prize breakdown page of every date are fetched concurrently and the draws are saved in one batch"""
+    external_results: Final[list[Result | BaseException]] = await asyncio.gather(*map(extract_649_result_async, dates), return_exceptions=True)
+    external_prize_breakdowns: Final[list[PrizeBreakdown | None | BaseException]] = await asyncio.gather(*map(extract_649_prize_breakdown_async, dates), return_exceptions=True)
+    new_results: Final[list[SixFourtyNineResults]] = []
+
+    for date, external_number_result, external_prize_breakdown in zip(dates, external_results, external_prize_breakdowns):
+        new_result: SixFourtyNineResults | None = await asyncio.to_thread(_build_new_649_result, date, external_number_result, external_prize_breakdown)
+
+        if new_result is not None:
+            new_results.append(new_result)
+
+    if new_results:
+        await asyncio.to_thread(_save_new_649_results, new_results)
+
+def _build_new_649_result(date: datetime.date, external_number_result: Result | BaseException, external_prize_breakdown: PrizeBreakdown | None | BaseException) -> SixFourtyNineResults | None:
+    """Build a fetched 6/49 result, notify and return None when it cannot be built"""
+    try:
+        for error in (external_number_result, external_prize_breakdown):
+            if isinstance(error, BaseException):
+                raise error
+
+        if external_number_result is None:
+            notification_outbox.notify("ERROR 6/49 numbers", f"The numbers for the date {date.strftime('%Y-%m-%d')} were not found.")
+            return None
+        
+        if external_prize_breakdown is None:
+            notification_outbox.notify("ERROR 6/49 prize breakdown", f"The prize breakdown for the date {date.strftime('%Y-%m-%d')} were not found.")
+            return None
+
+        return build_649_new_result(external_number_result, external_prize_breakdown)
+    except Exception:
+        notification_outbox.notify("ERROR 6/49", f"An error occurred while inserting the 6/49 result for the date {date.strftime('%Y-%m-%d')}.<br> Error: {traceback.format_exc().replace('\n', '<br>')}")
+        return None
+
+def _save_new_649_results(six_fourty_nine_results: list[SixFourtyNineResults]) -> None:
+    """Save the built 6/49 results in one batch, the draws already saved are reported instead of inserted again"""
+    try:
+        new_years: Final[list[int]] = []
+
+        # the new years, the draws and their responses are committed together, so a failed rebuild never leaves a stale year response
+        with database.unit_of_work() as session:
+            for year in sorted({result.date.year for result in six_fourty_nine_results}):
+                if not is_year_exist_by_name(_GAME_NAME, year, session):
+                    save_new_year_by_name(_GAME_NAME, year, session)
+                    new_years.append(year)
+
+            upsert_result: Final[UpsertResult] = save_649_results(six_fourty_nine_results, session=session)
+            inserted_years: Final[list[int]] = sorted({date.year for date in upsert_result.inserted})
+
+            for year in inserted_years:
+                materialize_year(_GAME_NAME, year, session)
+
+        if new_years:
+            game_years_registry.refresh(_GAME_NAME)
+
+        for year in new_years:
+            notification_outbox.notify("New 6/49 year", f"A new year {year} was added to the database.")
+
+        print(f"6/49 results: {len(upsert_result.inserted)} inserted, {len(upsert_result.skipped)} skipped")
+
+        for date in upsert_result.skipped:
+            notification_outbox.notify("ERROR 6/49", f"The numbers for the date {date.strftime('%Y-%m-%d')} already exist.")
+
+        response_cache.invalidate(_GAME_NAME)
+
+        if inserted_years:
+            export_years(_GAME_NAME, inserted_years)
+
+        for new_result in filter(lambda result: result.date in upsert_result.inserted, six_fourty_nine_results):
+            notification_outbox.notify("New 6/49 result", build_649_body_email(new_result))
+    except Exception:
+        notification_outbox.notify("ERROR 6/49", f"An error occurred while saving the 6/49 results.<br> Error: {traceback.format_exc().replace('\n', '<br>')}")
@@ -1,11 +1,17 @@
-from typing import Final
-from fastapi import APIRouter, Path
+from fastapi import APIRouter, Path, Query
 import datetime
 
+from fastapi.responses import FileResponse, StreamingResponse
+
+from src.config.configuration import configuration
+from src.exports.export_files import EXPORT_MEDIA_TYPES, ExportFormat
+from src.payloads.draw_range import ResultsFormat
+from src.response_cache.http_caching import build_json_response
+
 from .models.prize_breakdown import PrizeBreakdown
 
 from .models.result import Result
-from .six_fourty_nine_service import find_all_years, find_649_numbers_by_year, find_649_by_date
+from .six_fourty_nine_service import find_all_years, find_649_numbers_by_year_json, find_649_by_date_json, find_649_results_between, find_649_export
 
 router = APIRouter(
     prefix="/6-49",
@@ -13,27 +19,37 @@ router = APIRouter(
     responses={404: {"description": "Not Found"}, 500: {"description": "Internal server error"}}
 )
 
-_649_YEARS: Final[list[int]] = find_all_years()
-_649_START_YEAR: Final[int] = min(_649_YEARS)
-_649_LAST_YEAR: Final[int] = max(_649_YEARS)
-
 @router.get("/years", response_model=list[int])
 async def get_six_fourty_nine_years() -> list[int]:
     """Get all years from lotto 6/49"""
-    return _649_YEARS
+    return find_all_years()
 
 @router.get("/years/{year}", response_model=list[Result])
-async def get_six_fourty_nine_result_by_year(year: int = Path(
-        title="The year of lotto 6/49 results to get",
-        ge=_649_START_YEAR,
-        le=_649_LAST_YEAR
+def get_six_fourty_nine_result_by_year(year: int = Path(
+        title="The year of lotto 6/49 results to get"
 )):
     """Get the lotto 6/49 numbers result by year"""
-    return find_649_numbers_by_year(year)
+    return build_json_response(find_649_numbers_by_year_json(year), year)
+
+@router.get("/results", response_class=StreamingResponse, responses={200: {"content": {"application/x-ndjson": {}, "application/json": {}}}})
+def get_six_fourty_nine_results(
+    date_from: datetime.date = Query(alias="from", title="The date of the first draw"),
+    date_to: datetime.date = Query(alias="to", title="The date of the last draw"),
+    cursor: datetime.date | None = Query(None, title="The X-Next-Cursor header of the previous page"),
+    limit: int = Query(configuration.results_page_max_size, ge=1, le=configuration.results_page_max_size, title="The maximum number of draws of the page"),
+    results_format: ResultsFormat = Query(ResultsFormat.NDJSON, alias="format", title="Newline-delimited JSON or a JSON array")):
+    """Stream the winning numbers and prize payouts of the draws between two dates"""
+    return find_649_results_between(date_from, date_to, cursor, limit, results_format)
 
 @router.get("/results/{date}", response_model=PrizeBreakdown)
-async def get_six_fourty_nine_result_by_date(date: datetime.date = Path(
+def get_six_fourty_nine_result_by_date(date: datetime.date = Path(
         title="The date to view the winning numbers and prize payouts that took place"
 )):
     """Get the winning numbers and prise payouts for a specific date"""
-    return find_649_by_date(date)
\ No newline at end of file
+    return build_json_response(find_649_by_date_json(date), date.year)
+
+@router.get("/export", response_class=FileResponse, responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}})
+def get_six_fourty_nine_export(
+    export_format: ExportFormat = Query(ExportFormat.PARQUET, alias="format", title="Parquet or Arrow IPC")):
+    """Get the full lotto 6/49 draw history as a columnar file"""
+    return find_649_export(export_format)
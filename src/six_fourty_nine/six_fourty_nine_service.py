@@ -1,27 +1,29 @@
 import datetime
-import traceback
 from typing import Final
 
 from fastapi import HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
 
-from src.notification.email_sender import email_sender
+from src.payloads.draw_range import ResultsFormat, build_draw_range_response
+from src.payloads.payloads import RESULTS_VARIANT, get_draw_payload, get_year_payload
+from src.response_cache.response_cache import CachedResponse, response_cache, to_json
 
-from .six_fourty_nine_external_data import extract_649_prize_breakdown, extract_649_result
-from .six_fourty_nine_factory import build_649_body_email, build_649_new_result, build_649_prize_breakdown, build_649_results
+from .six_fourty_nine_factory import build_649_prize_breakdown, build_649_results
 
 from .entities.six_fourty_nine_results import SixFourtyNineResults
 
 from .models.prize_breakdown import PrizeBreakdown
 from .models.result import Result
 
-from src.games.game_repository import get_years_by_name, is_year_exist_by_name, save_new_year_by_name
-from .sixe_fourty_nine_repository import get_649_numbers_by_year, get_649_numbers_by_date, save_649_result
+from src.exports.export_files import ExportFormat, build_export_response
+from src.games.game_years_registry import game_years_registry
+from .sixe_fourty_nine_repository import get_649_numbers_by_year, get_649_numbers_by_date
 
 _GAME_NAME: Final[str] = "sixfourtynine"
 
 def find_all_years() -> list[int]:
     """Return all 6/49 years"""
-    return get_years_by_name(_GAME_NAME)
+    return game_years_registry.get_years(_GAME_NAME)
 
 def find_649_numbers_by_year(year: int) -> list[Result]:
     """Return 6/49 numbers by year"""
@@ -32,6 +34,11 @@ def find_649_numbers_by_year(year: int) -> list[Result]:
     
     return build_649_results(year_results)
 
+def find_649_numbers_by_year_json(year: int) -> CachedResponse:
+    """Return 6/49 numbers by year as the serialized response"""
+    game_years_registry.validate_year(_GAME_NAME, year)
+    return response_cache.get_or_build((_GAME_NAME, "years", year), lambda: get_year_payload(_GAME_NAME, year) or to_json(list[Result], find_649_numbers_by_year(year)))
+
 def find_649_by_date(date: datetime.date) -> PrizeBreakdown:
     """Return 6/49 numbers by date"""
     result: SixFourtyNineResults = get_649_numbers_by_date(date)
@@ -41,33 +48,14 @@ def find_649_by_date(date: datetime.date) -> PrizeBreakdown:
     
     return build_649_prize_breakdown(result)
 
-def insert_new_649_result(date: datetime.date) -> None:
-    """Insert new 6/49 result"""
-    try:
-        if get_649_numbers_by_date(date) is not None:
-         email_sender.notify("ERROR 6/49", f"The numbers for the date {date.strftime('%Y-%m-%d')} already exist.")
-         return
-
-        external_number_result: Final[Result] = extract_649_result(date)
-        external_prize_breakdown: Final[PrizeBreakdown | None] = extract_649_prize_breakdown(date)
-
-        if external_number_result is None:
-            email_sender.notify("ERROR 6/49 numbers", f"The numbers for the date {date.strftime('%Y-%m-%d')} were not found.")
-            return
-        
-        if external_prize_breakdown is None:
-            email_sender.notify("ERROR 6/49 prize breakdown", f"The prize breakdown for the date {date.strftime('%Y-%m-%d')} were not found.")
-            return
-
-        year: Final[int] = date.year
-
-        if not is_year_exist_by_name(_GAME_NAME, year):
-            save_new_year_by_name(_GAME_NAME, year)
-            email_sender.notify("New 6/49 year", f"A new year {year} was added to the database.")
+def find_649_by_date_json(date: datetime.date) -> CachedResponse:
+    """Return 6/49 numbers by date as the serialized response"""
+    return response_cache.get_or_build((_GAME_NAME, "results", date), lambda: get_draw_payload(_GAME_NAME, RESULTS_VARIANT, date) or to_json(PrizeBreakdown, find_649_by_date(date)))
 
-        new_result: Final[SixFourtyNineResults] = build_649_new_result(external_number_result, external_prize_breakdown)
-        save_649_result(new_result)
+def find_649_results_between(date_from: datetime.date, date_to: datetime.date, cursor: datetime.date | None, limit: int, results_format: ResultsFormat) -> StreamingResponse:
+    """Stream a page of the 6/49 results of a date range"""
+    return build_draw_range_response(_GAME_NAME, RESULTS_VARIANT, date_from, date_to, cursor, limit, results_format)
 
-        email_sender.notify("New 6/49 result", build_649_body_email(new_result))
-    except Exception:
-        email_sender.notify("ERROR 6/49", f"An error occurred while inserting the 6/49 result for the date {date.strftime('%Y-%m-%d')}.<br> Error: {traceback.format_exc().replace('\n', '<br>')}")
\ No newline at end of file
+def find_649_export(export_format: ExportFormat) -> FileResponse:
+    """Return the file of the full 6/49 draw history"""
+    return build_export_response(_GAME_NAME, export_format)
@@ -1,16 +1,24 @@
 import datetime
-from sqlalchemy import extract
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 from src.database.database import database
+from src.database.predicates import is_in_year
+from src.database.upserts import UpsertResult, to_row, upsert_draw_results
 from .entities.six_fourty_nine_results import SixFourtyNineResults
 
-with database.get_db() as _database:
-  def get_649_numbers_by_year(year: int) -> list[SixFourtyNineResults]:
-    return _database.query(SixFourtyNineResults.date, SixFourtyNineResults.classic, SixFourtyNineResults.guaranteed, SixFourtyNineResults.gold_ball).filter(extract('year', SixFourtyNineResults.date) == year).all()
+def get_649_numbers_by_year(year: int) -> list[SixFourtyNineResults]:
+  with database.get_db() as _database:
+    return _database.query(SixFourtyNineResults.date, SixFourtyNineResults.classic, SixFourtyNineResults.guaranteed, SixFourtyNineResults.gold_ball).filter(is_in_year(SixFourtyNineResults.date, year)).all()
 
-  def get_649_numbers_by_date(date: datetime.date) -> SixFourtyNineResults:
+def get_649_numbers_by_date(date: datetime.date) -> SixFourtyNineResults:
+  with database.get_db() as _database:
     return _database.query(SixFourtyNineResults.summary, SixFourtyNineResults.number_matched).filter(SixFourtyNineResults.date == date).first()
-  
-  def save_649_result(six_fourty_nine_result: SixFourtyNineResults) -> None:
-    _database.add(six_fourty_nine_result)
-    _database.commit()
-    _database.refresh(six_fourty_nine_result)
\ No newline at end of file
+
+def get_649_dates_since(since: datetime.date) -> list[datetime.date]:
+  with database.get_db() as _database:
+    return _database.scalars(select(SixFourtyNineResults.date).filter(SixFourtyNineResults.date >= since)).all()
+
+def save_649_results(six_fourty_nine_results: list[SixFourtyNineResults], overwrite: bool = False, session: Session | None = None) -> UpsertResult:
+  """Save a batch of draws in one transaction, the one of the session when given, the draws already saved are skipped unless they are overwritten"""
+  with database.unit_of_work(session) as _database:
+    return upsert_draw_results(_database, SixFourtyNineResults.__table__, list(map(to_row, six_fourty_nine_results)), overwrite)
@@ -0,0 +1,7 @@
+import os
+
+# the configuration is read when the modules are imported, the tests without a database never open a connection
+if "TEST_DATABASE_CONNECTION_STRING" in os.environ:
+    os.environ["DATABASE_CONNECTION_STRING"] = os.environ["TEST_DATABASE_CONNECTION_STRING"]
+else:
+    os.environ.setdefault("DATABASE_CONNECTION_STRING", "postgresql://localhost/lottery")
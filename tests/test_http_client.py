@@ -0,0 +1,88 @@
+"""Check the retries and the conditional GETs of the HttpClient against a local HTTP server."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Final, Iterator
+
+import pytest
+
+from src.http_client.disk_cache import DiskCache
+from src.http_client.http_client import HttpClient
+
+_ETAG: Final[str] = '"v1"'
+_LAST_MODIFIED: Final[str] = "Wed, 01 May 2024 10:00:00 GMT"
+_BODY: Final[bytes] = b"<html>draws</html>"
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answer /flaky with a 503 then a 200, and /validated with a 200 then a 304 once the ETag is sent back"""
+    hits: dict[str, int] = {}
+    received_headers: list[dict[str, str]] = []
+
+    def do_GET(self) -> None:
+        hit: int = self.hits.get(self.path, 0) + 1
+        self.hits[self.path] = hit
+        self.received_headers.append(dict(self.headers))
+
+        if self.path == "/flaky" and hit == 1:
+            self._reply(503, b"")
+        elif self.path == "/validated" and self.headers.get("If-None-Match") == _ETAG:
+            self._reply(304, b"")
+        else:
+            self._reply(200, _BODY, {"ETag": _ETAG, "Last-Modified": _LAST_MODIFIED, "Content-Type": "text/html"})
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    _StubHandler.hits = {}
+    _StubHandler.received_headers = []
+    server: Final[ThreadingHTTPServer] = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread: Final[threading.Thread] = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def client(tmp_path: Path) -> HttpClient:
+    return HttpClient(1, 1, 2, 0, 0, 2, DiskCache(str(tmp_path), 3600, 10 ** 6))
+
+def test_a_503_is_retried(base_url: str, client: HttpClient) -> None:
+    response = client.get(f"{base_url}/flaky")
+
+    assert response.status_code == 200
+    assert response.content == _BODY
+    assert _StubHandler.hits["/flaky"] == 2
+
+def test_the_validators_are_sent_back_and_a_304_returns_the_cached_body(base_url: str, client: HttpClient) -> None:
+    first = client.get(f"{base_url}/validated")
+    second = client.get(f"{base_url}/validated", max_age=0)
+
+    assert _StubHandler.hits["/validated"] == 2
+    assert "If-None-Match" not in _StubHandler.received_headers[0]
+    assert _StubHandler.received_headers[1]["If-None-Match"] == _ETAG
+    assert _StubHandler.received_headers[1]["If-Modified-Since"] == _LAST_MODIFIED
+    assert second.status_code == 200
+    assert second.content == first.content == _BODY
+
+def test_a_fresh_document_is_served_without_a_request(base_url: str, client: HttpClient) -> None:
+    client.get(f"{base_url}/validated")
+    cached = client.get(f"{base_url}/validated")
+
+    assert _StubHandler.hits["/validated"] == 1
+    assert cached.content == _BODY
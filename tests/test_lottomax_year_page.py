@@ -0,0 +1,37 @@
+"""Golden-file tests of the Lotto Max year page parser, with lxml and with the html.parser fallback"""
+import json
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from src.lottomax import lottomax_external_data
+from src.lottomax.models.numbers import Numbers
+
+_FIXTURES_DIRECTORY: Final[Path] = Path(__file__).parent / "fixtures" / "lottomax"
+_YEARS: Final[list[int]] = [2009, 2023]
+
+def _parse_year_page(year: int) -> list[Numbers]:
+    return lottomax_external_data._parse_year_page(year, (_FIXTURES_DIRECTORY / f"year_{year}.html").read_text())
+
+def _get_golden_numbers(year: int) -> list[Numbers]:
+    return [Numbers(**number) for number in json.loads((_FIXTURES_DIRECTORY / f"year_{year}.json").read_text())]
+
+@pytest.fixture
+def html_parser(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(lottomax_external_data, "lxml_html", None)
+
+@pytest.mark.parametrize("year", _YEARS)
+def test_lxml_parser_matches_the_golden_numbers(year: int) -> None:
+    if lottomax_external_data.lxml_html is None:
+        pytest.skip("lxml is not installed")
+
+    assert _parse_year_page(year) == _get_golden_numbers(year)
+
+@pytest.mark.parametrize("year", _YEARS)
+def test_html_parser_matches_the_golden_numbers(year: int, html_parser: None) -> None:
+    assert _parse_year_page(year) == _get_golden_numbers(year)
+
+def test_year_page_without_draws_is_rejected(html_parser: None) -> None:
+    with pytest.raises(Exception, match="The year 2023 is not found"):
+        lottomax_external_data._parse_year_page(2023, "<html><body><table><tr><td>No draws</td></tr></table></body></html>")
@@ -0,0 +1,132 @@
+"""Send the notification outbox to a local SMTP server.
+
+The outbox is saved in the database of TEST_DATABASE_CONNECTION_STRING, the tests are skipped without it.
+"""
+import email
+import os
+import socket
+from typing import Final, Iterator
+
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import Engine, delete, func, select, update
+from sqlalchemy.exc import OperationalError
+
+_RETRY_DELAY: Final[float] = 60.0
+_DELAY_TOLERANCE: Final[float] = 5.0
+
+class _RecordingHandler:
+    """Keep the messages received by the SMTP server"""
+    def __init__(self) -> None:
+        self.messages: list[email.message.Message] = []
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        self.messages.append(email.message_from_bytes(envelope.content))
+        return "250 OK"
+
+@pytest.fixture(scope="module")
+def engine() -> Engine:
+    if "TEST_DATABASE_CONNECTION_STRING" not in os.environ:
+        pytest.skip("TEST_DATABASE_CONNECTION_STRING is not set")
+
+    from src.database.database import database
+    from src.notification.entities.outbox_notification import Base
+
+    try:
+        with database.engine.connect():
+            pass
+    except OperationalError:
+        pytest.skip("the test database is not reachable")
+
+    Base.metadata.create_all(database.engine)
+
+    return database.engine
+
+@pytest.fixture
+def outbox_table(engine: Engine) -> Iterator[None]:
+    from src.database.database import database
+    from src.notification.entities.outbox_notification import OutboxNotification
+
+    with database.unit_of_work() as session:
+        session.execute(delete(OutboxNotification))
+
+    yield
+
+    with database.unit_of_work() as session:
+        session.execute(delete(OutboxNotification))
+
+@pytest.fixture
+def smtp_server() -> Iterator[tuple[int, _RecordingHandler]]:
+    handler: Final[_RecordingHandler] = _RecordingHandler()
+    controller: Final[Controller] = Controller(handler, hostname="127.0.0.1", port=_get_free_port())
+    controller.start()
+
+    yield controller.port, handler
+
+    controller.stop()
+
+def test_a_run_is_sent_as_one_digest(outbox_table: None, smtp_server: tuple[int, _RecordingHandler]) -> None:
+    port, handler = smtp_server
+    outbox = _build_outbox(port)
+
+    for index in range(3):
+        outbox.notify(f"Lotto Max error {index}", f"<p>draw {index} failed</p>")
+
+    assert outbox.flush() == 3
+    assert len(handler.messages) == 1
+
+    message: Final[email.message.Message] = handler.messages[0]
+    body: Final[str] = next(part for part in message.walk() if part.get_content_type() == "text/html").get_payload(decode=True).decode()
+
+    assert message["Subject"].startswith("3 notifications")
+    assert all(f"<p>draw {index} failed</p>" in body for index in range(3))
+    assert _get_pending() == []
+
+def test_a_refused_connection_postpones_the_notifications_with_a_doubled_delay(outbox_table: None) -> None:
+    outbox = _build_outbox(_get_free_port())
+
+    outbox.notify("Daily Grand error", "<p>draw failed</p>")
+    outbox.notify("6/49 error", "<p>draw failed</p>")
+
+    assert outbox.flush() == 0
+    assert [attempts for attempts, _ in _get_pending()] == [1, 1]
+    assert all(delay == pytest.approx(_RETRY_DELAY, abs=_DELAY_TOLERANCE) for _, delay in _get_pending())
+
+    _make_pending_due()
+
+    assert outbox.flush() == 0
+    assert [attempts for attempts, _ in _get_pending()] == [2, 2]
+    assert all(delay == pytest.approx(2 * _RETRY_DELAY, abs=_DELAY_TOLERANCE) for _, delay in _get_pending())
+
+def _build_outbox(port: int):
+    from src.notification.email_sender import EmailSender
+    from src.notification.notification_outbox import NotificationOutbox
+
+    return NotificationOutbox(EmailSender("sender@example.com", "", "recipient@example.com", "127.0.0.1", port, False), 50, 8, _RETRY_DELAY, 300)
+
+def _get_pending() -> list[tuple[int, float]]:
+    """Return the attempts of the notifications not sent yet and the seconds until their next attempt"""
+    from src.database.database import database
+    from src.notification.entities.outbox_notification import OutboxNotification
+
+    with database.get_db() as session:
+        return [
+            (attempts, delay.total_seconds())
+            for attempts, delay in session.execute(
+                select(OutboxNotification.attempts, OutboxNotification.next_attempt_at - func.now())
+                .filter(OutboxNotification.sent_at.is_(None))
+                .order_by(OutboxNotification.id)
+            )
+        ]
+
+def _make_pending_due() -> None:
+    from src.database.database import database
+    from src.notification.entities.outbox_notification import OutboxNotification
+
+    with database.unit_of_work() as session:
+        session.execute(update(OutboxNotification).filter(OutboxNotification.sent_at.is_(None)).values(next_attempt_at=func.now()))
+
+def _get_free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
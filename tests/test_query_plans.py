@@ -0,0 +1,82 @@
+"""Guard the date range queries against plans that scan the whole tables.
+
+The queries run against the database of TEST_DATABASE_CONNECTION_STRING, the tests are skipped without it.
+"""
+import datetime
+import os
+from typing import Callable, Final
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import OperationalError
+
+_GAME_DATE_INDEX: Final[str] = "ix_draw_payloads_game_id_date"
+_SINCE: Final[datetime.date] = datetime.date(2024, 1, 1)
+_UNTIL: Final[datetime.date] = datetime.date(2024, 12, 31)
+
+@pytest.fixture(scope="module")
+def engine() -> Engine:
+    if "TEST_DATABASE_CONNECTION_STRING" not in os.environ:
+        pytest.skip("TEST_DATABASE_CONNECTION_STRING is not set")
+
+    from src.database.database import database
+    from src.lottomax.entities.lotto_max_results import Base as LottoMaxBase
+    from src.payloads.entities.draw_payload import Base as DrawPayloadBase
+
+    try:
+        with database.engine.connect():
+            pass
+    except OperationalError:
+        pytest.skip("the test database is not reachable")
+
+    # the tables of a migrated database are kept, the index under test then comes from the migration
+    for base in (DrawPayloadBase, LottoMaxBase):
+        base.metadata.create_all(database.engine)
+
+    return database.engine
+
+def test_year_draw_payloads_use_the_game_date_index(engine: Engine) -> None:
+    from src.payloads import payload_repository
+
+    plans: Final[list[str]] = _explain(engine, lambda: payload_repository.get_draw_payloads_by_year(1, 2024))
+
+    assert plans and all(_GAME_DATE_INDEX in plan for plan in plans)
+
+def test_draw_range_queries_do_not_scan_the_draw_payloads(engine: Engine) -> None:
+    from src.payloads import payload_repository
+
+    plans: Final[list[str]] = _explain(engine, lambda: (
+        list(payload_repository.iter_draw_payloads_between(1, "results", _SINCE, _UNTIL, 100)),
+        payload_repository.get_draw_payload_dates_between(1, "results", _SINCE, _UNTIL, 99, 2)
+    ))
+
+    assert len(plans) == 2 and all("Seq Scan" not in plan for plan in plans)
+
+def test_year_results_do_not_scan_the_draw_results(engine: Engine) -> None:
+    from src.lottomax.lottomax_repository import get_lotto_numbers_by_year
+
+    plans: Final[list[str]] = _explain(engine, lambda: get_lotto_numbers_by_year(2024))
+
+    assert plans and all("Seq Scan" not in plan for plan in plans)
+
+def _explain(engine: Engine, call: Callable[[], object]) -> list[str]:
+    """Run the call, then return the plan of every SELECT it sent with the sequential scans disabled, so only a plan without a usable index scans"""
+    statements: Final[list[tuple[str, object]]] = []
+
+    def capture(connection, cursor, statement: str, parameters: object, context, executemany: bool) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SET enable_seqscan TO off")
+
+        return [
+            "\n".join(row[0] for row in connection.exec_driver_sql(f"EXPLAIN {statement}", parameters))
+            for statement, parameters in statements
+        ]
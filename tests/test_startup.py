@@ -0,0 +1,9 @@
+"""Keep the scrapers, the scheduler and the email sender out of the import path of the API."""
+from benchmarks.startup import StartupMeasure, measure_startup
+
+def test_main_does_not_import_the_lazy_modules() -> None:
+    measure: StartupMeasure = measure_startup()
+
+    assert measure.loaded_modules == []
+    assert measure.status_code == 200
+    assert measure.import_seconds > 0 and measure.first_request_seconds > 0